@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Pomiar czasu uruchamiania narzędzi i importu modułów (python -X importtime)
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import subprocess
+from datetime import datetime
+
+# Mierzone polecenia: nazwa, argumenty interpretera i moduły, których
+# polecenie nie może załadować
+HEADLESS_FORBIDDEN = ('tkinter', 'numpy', 'asyncio', 'morse_sound', 'station_gui')
+TARGETS = [
+    ('cli/help', ['-m', 'morse_cli', '--help'], HEADLESS_FORBIDDEN),
+    ('cli/encode', ['-m', 'morse_cli', 'encode', 'SOS TITANIC'], HEADLESS_FORBIDDEN),
+    ('cli/decode', ['-m', 'morse_cli', 'decode', '... --- ...'], HEADLESS_FORBIDDEN),
+    ('import/radio_station', ['-c', 'import radio_station'], HEADLESS_FORBIDDEN),
+    ('import/station_launcher', ['-c', 'import station_launcher'], HEADLESS_FORBIDDEN),
+    ('import/relay_hub', ['-c', 'import relay_hub'], ('tkinter', 'numpy')),
+    ('import/station_gui', ['-c', 'import station_gui'], ('numpy', 'morse_sound')),
+]
+
+# Parametry pomiaru
+REPEAT = 5                 # Liczba uruchomień - wynikiem jest najszybsze
+DEFAULT_THRESHOLD = 0.5    # Dopuszczalny wzrost czasu importu względem bazowego pomiaru
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+BASELINE_FILE = os.path.join(PACKAGE_DIR, "bench_imports_baseline.json")
+
+def parse_importtime(report):
+    """
+    Odczytuje raport -X importtime.
+    
+    Args:
+        report (str): Standardowe wyjście błędów interpretera
+    
+    Returns:
+        tuple: Łączny czas importów w µs i zbiór załadowanych modułów
+    """
+    total = 0
+    modules = set()
+    for line in report.splitlines():
+        fields = line.split('|')
+        if len(fields) != 3 or not line.startswith("import time:"):
+            continue
+        cumulative = fields[1].strip()
+        if not cumulative.isdigit():
+            continue  # Nagłówek raportu
+        # Zależności są wcięte, a czas skumulowany modułu najwyższego
+        # poziomu obejmuje już wszystkie jego zależności
+        name = fields[2][1:].rstrip()
+        modules.add(name.strip())
+        if not name.startswith(' '):
+            total += int(cumulative)
+    return total, modules
+
+def run_target(arguments):
+    """
+    Uruchamia interpreter z -X importtime.
+    
+    Args:
+        arguments (list): Argumenty interpretera po -X importtime
+    
+    Returns:
+        tuple: Czas importów w µs, czas procesu w sekundach i zbiór modułów
+    
+    Raises:
+        RuntimeError: Jeśli polecenie zakończyło się błędem
+    """
+    start = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime'] + arguments,
+        cwd=PACKAGE_DIR,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        universal_newlines=True
+    )
+    wall = time.perf_counter() - start
+    if completed.returncode != 0:
+        last_line = completed.stderr.strip().splitlines()[-1:]
+        raise RuntimeError(last_line[0] if last_line else f"kod wyjścia {completed.returncode}")
+    import_us, modules = parse_importtime(completed.stderr)
+    return import_us, wall, modules
+
+def run_benchmarks(targets, repeat=REPEAT, name_filter=None):
+    """
+    Mierzy czas uruchamiania poleceń i sprawdza załadowane moduły.
+    
+    Args:
+        targets (list): Polecenia w formacie TARGETS
+        repeat (int): Liczba uruchomień każdego polecenia
+        name_filter (str, optional): Mierzy tylko polecenia zawierające ten tekst
+    
+    Returns:
+        tuple: Wyniki (nazwa -> {'import_ms', 'wall_ms', 'modules'}) i lista
+            par (nazwa, opis) dla poleceń z błędem lub niedozwolonym importem
+    """
+    results = {}
+    violations = []
+    for name, arguments, forbidden in targets:
+        if name_filter and name_filter not in name:
+            continue
+        try:
+            runs = [run_target(arguments) for _ in range(repeat)]
+        except RuntimeError as e:
+            violations.append((name, f"błąd: {e}"))
+            continue
+        import_us = min(run[0] for run in runs)
+        wall = min(run[1] for run in runs)
+        modules = runs[0][2]
+        results[name] = {
+            'import_ms': import_us / 1000,
+            'wall_ms': wall * 1000,
+            'modules': len(modules),
+        }
+        print(f"{name:30} {import_us / 1000:8.1f} ms importu {wall * 1000:8.1f} ms procesu "
+              f"{len(modules):5} modułów")
+        
+        loaded = sorted(module for module in forbidden if module in modules)
+        if loaded:
+            violations.append((name, "załadowano " + ", ".join(loaded)))
+    return results, violations
+
+def compare(results, baseline, threshold):
+    """
+    Porównuje wyniki z bazowym pomiarem.
+    
+    Args:
+        results (dict): Bieżące wyniki
+        baseline (dict): Wyniki bazowe w tym samym formacie
+        threshold (float): Dopuszczalny względny wzrost czasu importu
+    
+    Returns:
+        list: Pary (nazwa, względna zmiana) dla poleceń z regresją
+    """
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        change = result['import_ms'] / baseline[name]['import_ms'] - 1
+        if change > threshold:
+            regressions.append((name, change))
+    return regressions
+
+def main(argv=None):
+    """
+    Uruchamia pomiar czasu uruchamiania z wiersza poleceń.
+    
+    Args:
+        argv (list, optional): Argumenty wiersza poleceń
+    
+    Returns:
+        int: 0 bez regresji, 1 gdy polecenie zwolniło ponad próg lub
+            załadowało niedozwolony moduł
+    """
+    parser = argparse.ArgumentParser(
+        description="Czas uruchamiania narzędzi i importu modułów (-X importtime)"
+    )
+    parser.add_argument("--baseline", default=BASELINE_FILE,
+                        help="Plik z bazowym pomiarem (JSON)")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="Zapisz bieżące wyniki jako bazowy pomiar")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Dopuszczalny wzrost czasu importu, np. 0.5 = 50%%")
+    parser.add_argument("--repeat", type=int, default=REPEAT,
+                        help="Liczba uruchomień każdego polecenia")
+    parser.add_argument("--filter", help="Mierz tylko polecenia zawierające ten tekst")
+    parser.add_argument("--output", help="Zapisz wyniki do pliku JSON")
+    args = parser.parse_args(argv)
+    
+    results, violations = run_benchmarks(TARGETS, args.repeat, args.filter)
+    for name, description in violations:
+        print(f"BŁĄD {name}: {description}")
+    
+    report = {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as output_file:
+            json.dump(report, output_file, indent=2)
+    
+    if args.update_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as baseline_file:
+            json.dump(report, baseline_file, indent=2)
+        print(f"Zapisano bazowy pomiar w {args.baseline}")
+        return 1 if violations else 0
+    
+    if not os.path.exists(args.baseline):
+        print(f"Brak bazowego pomiaru {args.baseline} - uruchom z --update-baseline")
+        return 1 if violations else 0
+    
+    with open(args.baseline, encoding='utf-8') as baseline_file:
+        baseline = json.load(baseline_file)['results']
+    
+    regressions = compare(results, baseline, args.threshold)
+    for name, change in regressions:
+        print(f"REGRESJA {name}: {change:+.1%}")
+    if regressions or violations:
+        return 1
+    print(f"Brak regresji powyżej {args.threshold:.0%}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Mikrobenchmarki kodowania, dekodowania, syntezy i modelu czasowego Morse'a
+"""
+
+import os
+import sys
+import json
+import random
+import timeit
+import argparse
+import platform
+from datetime import datetime
+
+from morse_utils import text_to_morse, morse_to_text, CHAR_TO_MORSE
+from morse_timing import DEFAULT_TIMING
+import morse_sound
+
+# Rozmiary danych wejściowych (nazwa, liczba znaków tekstu)
+SIZES = [
+    ('word', 5),
+    ('sentence', 64),
+    ('1KB', 1024),
+    ('64KB', 64 * 1024),
+    ('1MB', 1024 * 1024),
+    ('4MB', 4 * 1024 * 1024),
+]
+
+# Synteza dźwięku rośnie z czasem transmisji, nie z rozmiarem tekstu -
+# powyżej tego rozmiaru pomiar trwałby minuty
+MAX_SYNTHESIS_SIZE = 1024
+
+# Znaki spoza alfabetu Morse'a wstawiane do wariantu "unsupported"
+UNSUPPORTED_CHARS = 'ąęłżź{}[]<>#~'
+UNSUPPORTED_RATE = 0.1
+
+# Parametry pomiaru
+MIN_MEASURE_TIME = 0.2     # s, minimalny czas jednej serii wywołań
+REPEAT = 3                 # Liczba serii - wynikiem jest najszybsza
+DEFAULT_THRESHOLD = 0.25   # Dopuszczalny spadek ops/s względem bazowego pomiaru
+DEFAULT_SEED = 1912
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bench_baseline.json")
+
+def make_text(size, unsupported, seed=DEFAULT_SEED):
+    """
+    Tworzy powtarzalny tekst o zadanej długości.
+    
+    Args:
+        size (int): Liczba znaków
+        unsupported (bool): Czy wstawiać znaki spoza alfabetu Morse'a
+        seed (int): Ziarno generatora
+    
+    Returns:
+        str: Tekst złożony ze słów rozdzielonych spacjami
+    """
+    rng = random.Random(seed + size + unsupported)
+    alphabet = [char for char in CHAR_TO_MORSE if char != ' ']
+    chars = []
+    while len(chars) < size:
+        word = rng.choices(alphabet, k=rng.randint(2, 8))
+        if unsupported:
+            word = [rng.choice(UNSUPPORTED_CHARS) if rng.random() < UNSUPPORTED_RATE else char
+                    for char in word]
+        chars.extend(word)
+        chars.append(' ')
+    return ''.join(chars[:size])
+
+def build_cases(max_size=None, include_synthesis=True):
+    """
+    Przygotowuje listę przypadków pomiarowych.
+    
+    Args:
+        max_size (int, optional): Pomija rozmiary większe niż podany
+        include_synthesis (bool): Czy mierzyć syntezę dźwięku (wymaga numpy)
+    
+    Returns:
+        list: Trójki (nazwa, funkcja bez argumentów, liczba bajtów wejścia)
+    """
+    cases = []
+    for variant, unsupported in (('ascii', False), ('unsupported', True)):
+        for size_name, size in SIZES:
+            if max_size is not None and size > max_size:
+                continue
+            text = make_text(size, unsupported)
+            morse_code = text_to_morse(text)
+            text_bytes = len(text.encode('utf-8'))
+            morse_bytes = len(morse_code.encode('utf-8'))
+            
+            def case_name(function, size_name=size_name, variant=variant):
+                return f"{function}/{variant}/{size_name}"
+            
+            cases.append((case_name('text_to_morse'),
+                          lambda text=text: text_to_morse(text), text_bytes))
+            cases.append((case_name('morse_to_text'),
+                          lambda morse=morse_code: morse_to_text(morse), morse_bytes))
+            cases.append((case_name('timing.duration'),
+                          lambda morse=morse_code: DEFAULT_TIMING.duration(morse), morse_bytes))
+            cases.append((case_name('timing.timeline'),
+                          lambda morse=morse_code: DEFAULT_TIMING.timeline(morse), morse_bytes))
+            cases.append((case_name('scheduler.schedule'),
+                          lambda morse=morse_code: morse_sound.MorseScheduler.schedule(morse),
+                          morse_bytes))
+            
+            if include_synthesis and not unsupported and size <= MAX_SYNTHESIS_SIZE:
+                cases.append((case_name('render_morse_pcm'),
+                              lambda morse=morse_code: morse_sound.render_morse_pcm(morse),
+                              morse_bytes))
+    return cases
+
+def measure(function):
+    """
+    Mierzy czas jednego wywołania funkcji.
+    
+    Liczba wywołań w serii dobierana jest tak, aby seria trwała co najmniej
+    MIN_MEASURE_TIME, a wynikiem jest najszybsza z REPEAT serii.
+    
+    Args:
+        function (function): Funkcja bez argumentów
+    
+    Returns:
+        float: Czas jednego wywołania w sekundach
+    """
+    timer = timeit.Timer(function)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= MIN_MEASURE_TIME:
+            break
+        number = max(number * 2, int(number * MIN_MEASURE_TIME / max(elapsed, 1e-9)))
+    best = elapsed
+    for _ in range(REPEAT - 1):
+        best = min(best, timer.timeit(number))
+    return best / number
+
+def run_benchmarks(cases, name_filter=None):
+    """
+    Wykonuje pomiary i wypisuje wyniki na bieżąco.
+    
+    Args:
+        cases (list): Przypadki z build_cases
+        name_filter (str, optional): Mierzy tylko przypadki zawierające ten tekst
+    
+    Returns:
+        dict: Nazwa przypadku -> {'ops_per_s', 'bytes_per_s'}
+    """
+    results = {}
+    for name, function, input_bytes in cases:
+        if name_filter and name_filter not in name:
+            continue
+        seconds = measure(function)
+        results[name] = {
+            'ops_per_s': 1 / seconds,
+            'bytes_per_s': input_bytes / seconds,
+        }
+        print(f"{name:45} {1 / seconds:14.1f} ops/s {input_bytes / seconds / 1e6:10.2f} MB/s")
+    return results
+
+def compare(results, baseline, threshold):
+    """
+    Porównuje wyniki z bazowym pomiarem.
+    
+    Args:
+        results (dict): Bieżące wyniki
+        baseline (dict): Wyniki bazowe w tym samym formacie
+        threshold (float): Dopuszczalny względny spadek ops/s
+    
+    Returns:
+        list: Pary (nazwa, względna zmiana) dla przypadków z regresją
+    """
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        change = result['ops_per_s'] / baseline[name]['ops_per_s'] - 1
+        if change < -threshold:
+            regressions.append((name, change))
+    return regressions
+
+def main(argv=None):
+    """
+    Uruchamia mikrobenchmarki z wiersza poleceń.
+    
+    Args:
+        argv (list, optional): Argumenty wiersza poleceń
+    
+    Returns:
+        int: 0 bez regresji, 1 gdy któryś przypadek przekroczył próg
+    """
+    parser = argparse.ArgumentParser(
+        description="Mikrobenchmarki modułów morse_utils, morse_timing i morse_sound"
+    )
+    parser.add_argument("--baseline", default=BASELINE_FILE,
+                        help="Plik z bazowym pomiarem (JSON)")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="Zapisz bieżące wyniki jako bazowy pomiar")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Dopuszczalny spadek ops/s, np. 0.25 = 25%%")
+    parser.add_argument("--filter", help="Mierz tylko przypadki zawierające ten tekst")
+    parser.add_argument("--max-size", type=int,
+                        help="Pomiń dane wejściowe większe niż podana liczba znaków")
+    parser.add_argument("--output", help="Zapisz wyniki do pliku JSON")
+    args = parser.parse_args(argv)
+    
+    include_synthesis = morse_sound.np is not None
+    if not include_synthesis:
+        print("Brak numpy - pomijam pomiary syntezy dźwięku")
+    
+    results = run_benchmarks(build_cases(args.max_size, include_synthesis), args.filter)
+    
+    report = {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as output_file:
+            json.dump(report, output_file, indent=2)
+    
+    if args.update_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as baseline_file:
+            json.dump(report, baseline_file, indent=2)
+        print(f"Zapisano bazowy pomiar w {args.baseline}")
+        return 0
+    
+    if not os.path.exists(args.baseline):
+        print(f"Brak bazowego pomiaru {args.baseline} - uruchom z --update-baseline")
+        return 0
+    
+    with open(args.baseline, encoding='utf-8') as baseline_file:
+        baseline = json.load(baseline_file)['results']
+    
+    regressions = compare(results, baseline, args.threshold)
+    for name, change in regressions:
+        print(f"REGRESJA {name}: {change:+.1%}")
+    if regressions:
+        return 1
+    print(f"Brak regresji powyżej {args.threshold:.0%}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
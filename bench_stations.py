@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+Generator obciążenia i pomiar przepustowości łączności między stacjami
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import threading
+from datetime import datetime
+
+from morse_utils import text_to_morse
+from radio_station import RadioStation
+from station_link import PeerLink
+from station_protocol import encode_frame, PACKET_FORMAT_BINARY, PACKET_FORMAT_TEXT
+from station_profiles import (
+    CARPATHIA_MESSAGES, CARPATHIA_PORT, CARPATHIA_CALL_SIGN,
+    TITANIC_MESSAGES, TITANIC_PORT, TITANIC_CALL_SIGN
+)
+
+# Parametry domyślne
+DEFAULT_SENDERS = 4
+DEFAULT_RATE = 100          # Wiadomości na sekundę na nadawcę
+DEFAULT_DURATION = 10       # s, czas nadawania
+DEFAULT_DRAIN_TIMEOUT = 5   # s, czas oczekiwania na ramki w drodze
+QUEUE_FULL_BACKOFF = 0.001  # s, przerwa nadawcy przy pełnej kolejce nadawczej
+RESULTS_DIR = "bench_results"
+
+class Receiver:
+    """Bezgłowa stacja odbiorcza zliczająca ramki i ich opóźnienia"""
+    
+    def __init__(self, call_sign, port):
+        """
+        Inicjalizuje odbiornik
+        
+        Args:
+            call_sign (str): Znak wywoławczy stacji
+            port (int): Port nasłuchiwania
+        """
+        self.station = RadioStation(call_sign, port=port)
+        self.station.on_receive = self.on_receive
+        self.latencies = []
+        self.received = set()
+    
+    def on_receive(self, frame):
+        """Zapisuje opóźnienie ramki (wątek obsługi serwera)"""
+        self.latencies.append(time.time() - frame.timestamp)
+        self.received.add((frame.sender, frame.sequence))
+
+class Sender(threading.Thread):
+    """Wątek nadający wiadomości z korpusu do jednej stacji"""
+    
+    def __init__(self, call_sign, port, messages, duration, rate, packet_format, seed):
+        """
+        Inicjalizuje nadawcę
+        
+        Args:
+            call_sign (str): Znak wywoławczy nadawcy
+            port (int): Port stacji odbiorczej
+            messages (list): Korpus wiadomości
+            duration (float): Czas nadawania w sekundach
+            rate (float): Wiadomości na sekundę (0 - bez ograniczenia)
+            packet_format (str): Format danych ramki
+            seed (int): Ziarno wyboru wiadomości
+        """
+        super().__init__(name=f"bench-sender-{call_sign}", daemon=True)
+        self.call_sign = call_sign
+        self.link = PeerLink('localhost', port)
+        self.duration = duration
+        self.rate = rate
+        self.packet_format = packet_format
+        self.random = random.Random(seed)
+        
+        # Kod Morse'a wyliczany raz - mierzymy protokół, a nie koder
+        self.corpus = [(message, text_to_morse(message)) for message in messages]
+        self.sent = 0
+        self.stalls = 0
+    
+    def run(self):
+        """Nadaje wiadomości do upływu czasu nadawania"""
+        start = time.monotonic()
+        end = start + self.duration
+        interval = 1.0 / self.rate if self.rate else 0.0
+        deadline = start
+        while True:
+            now = time.monotonic()
+            if now >= end:
+                break
+            if interval:
+                if now < deadline:
+                    time.sleep(deadline - now)
+                deadline += interval
+            
+            message, morse_code = self.random.choice(self.corpus)
+            frame = encode_frame(
+                message,
+                morse_code,
+                self.call_sign,
+                self.sent + 1,
+                self.packet_format
+            )
+            # Pełna kolejka nadawcza - czekamy zamiast gubić ramkę
+            while not self.link.send(frame):
+                self.stalls += 1
+                time.sleep(QUEUE_FULL_BACKOFF)
+            self.sent += 1
+
+def percentile(sorted_values, fraction):
+    """
+    Zwraca percentyl metodą najbliższej rangi.
+    
+    Args:
+        sorted_values (list): Posortowane wartości
+        fraction (float): Percentyl jako ułamek (np. 0.95)
+    
+    Returns:
+        float: Wartość percentyla lub None dla pustej listy
+    """
+    if not sorted_values:
+        return None
+    index = max(0, int(len(sorted_values) * fraction + 0.5) - 1)
+    return sorted_values[min(index, len(sorted_values) - 1)]
+
+def run_benchmark(senders=DEFAULT_SENDERS, duration=DEFAULT_DURATION, rate=DEFAULT_RATE,
+                  packet_format=PACKET_FORMAT_BINARY, drain_timeout=DEFAULT_DRAIN_TIMEOUT,
+                  carpathia_port=CARPATHIA_PORT, titanic_port=TITANIC_PORT, seed=0):
+    """
+    Uruchamia odbiorniki obu stacji i nadawców, po czym zbiera wyniki.
+    
+    Nadawcy o parzystych numerach nadają do Carpathii wiadomości Titanica,
+    a pozostali do Titanica wiadomości Carpathii.
+    
+    Args:
+        senders (int): Liczba równoczesnych nadawców
+        duration (float): Czas nadawania w sekundach
+        rate (float): Wiadomości na sekundę na nadawcę (0 - bez ograniczenia)
+        packet_format (str): Format danych ramki
+        drain_timeout (float): Czas oczekiwania na ramki w drodze
+        carpathia_port (int): Port odbiornika Carpathii
+        titanic_port (int): Port odbiornika Titanica
+        seed (int): Ziarno wyboru wiadomości
+    
+    Returns:
+        dict: Wyniki pomiaru
+    
+    Raises:
+        OSError: Jeśli nie można otworzyć portów odbiorników
+    """
+    receivers = [
+        Receiver(CARPATHIA_CALL_SIGN, carpathia_port),
+        Receiver(TITANIC_CALL_SIGN, titanic_port),
+    ]
+    for receiver in receivers:
+        if not receiver.station.start():
+            raise OSError(f"Nie można otworzyć portu {receiver.station.port}")
+    
+    corpora = [
+        (carpathia_port, TITANIC_MESSAGES),
+        (titanic_port, CARPATHIA_MESSAGES),
+    ]
+    threads = []
+    for index in range(senders):
+        port, messages = corpora[index % 2]
+        threads.append(Sender(f"B{index:03d}", port, messages, duration, rate,
+                              packet_format, seed + index))
+    
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    sent = sum(thread.sent for thread in threads)
+    
+    # Oczekiwanie na ramki, które są jeszcze w drodze
+    drain_end = time.monotonic() + drain_timeout
+    while time.monotonic() < drain_end:
+        if sum(len(receiver.received) for receiver in receivers) >= sent:
+            break
+        time.sleep(0.01)
+    elapsed = time.perf_counter() - start
+    
+    for thread in threads:
+        thread.link.close()
+    for receiver in receivers:
+        receiver.station.stop()
+    
+    received = sum(len(receiver.received) for receiver in receivers)
+    latencies = sorted(
+        latency * 1000 for receiver in receivers for latency in receiver.latencies
+    )
+    
+    return {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'config': {
+            'senders': senders,
+            'duration_s': duration,
+            'rate_per_sender': rate,
+            'packet_format': packet_format,
+            'ports': [carpathia_port, titanic_port],
+        },
+        'sent': sent,
+        'received': received,
+        # Ramki nieodebrane przed upływem drain_timeout liczą się jako utracone
+        'dropped': sent - received,
+        'drop_rate': (sent - received) / sent if sent else 0.0,
+        'queue_full_stalls': sum(thread.stalls for thread in threads),
+        'elapsed_s': elapsed,
+        'throughput_msg_s': received / elapsed if elapsed else 0.0,
+        'latency_ms': {
+            'p50': percentile(latencies, 0.50),
+            'p95': percentile(latencies, 0.95),
+            'p99': percentile(latencies, 0.99),
+            'max': latencies[-1] if latencies else None,
+        },
+    }
+
+def main(argv=None):
+    """
+    Uruchamia pomiar z wiersza poleceń i zapisuje wyniki w formacie JSON.
+    
+    Args:
+        argv (list, optional): Argumenty wiersza poleceń
+    """
+    parser = argparse.ArgumentParser(
+        description="Pomiar przepustowości i opóźnień łączności między stacjami"
+    )
+    parser.add_argument("--senders", type=int, default=DEFAULT_SENDERS,
+                        help="Liczba równoczesnych nadawców")
+    parser.add_argument("--duration", type=float, default=DEFAULT_DURATION,
+                        help="Czas nadawania w sekundach")
+    parser.add_argument("--rate", type=float, default=DEFAULT_RATE,
+                        help="Wiadomości na sekundę na nadawcę (0 - nasycenie, "
+                             "bez ograniczenia)")
+    parser.add_argument("--packet-format", choices=[PACKET_FORMAT_BINARY, PACKET_FORMAT_TEXT],
+                        default=PACKET_FORMAT_BINARY, help="Format danych ramki")
+    parser.add_argument("--drain-timeout", type=float, default=DEFAULT_DRAIN_TIMEOUT,
+                        help="Czas oczekiwania na ramki w drodze (s)")
+    parser.add_argument("--carpathia-port", type=int, default=CARPATHIA_PORT,
+                        help="Port odbiornika Carpathii")
+    parser.add_argument("--titanic-port", type=int, default=TITANIC_PORT,
+                        help="Port odbiornika Titanica")
+    parser.add_argument("--seed", type=int, default=0, help="Ziarno wyboru wiadomości")
+    parser.add_argument("--output", help="Plik wyników JSON (domyślnie w katalogu "
+                                         f"{RESULTS_DIR} z datą w nazwie)")
+    args = parser.parse_args(argv)
+    
+    try:
+        results = run_benchmark(
+            senders=args.senders,
+            duration=args.duration,
+            rate=args.rate,
+            packet_format=args.packet_format,
+            drain_timeout=args.drain_timeout,
+            carpathia_port=args.carpathia_port,
+            titanic_port=args.titanic_port,
+            seed=args.seed
+        )
+    except OSError as e:
+        print(f"Błąd: {e}")
+        return 1
+    
+    output = args.output
+    if output is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        output = os.path.join(RESULTS_DIR, f"stations-{datetime.now():%Y%m%d-%H%M%S}.json")
+    with open(output, 'w', encoding='utf-8') as results_file:
+        json.dump(results, results_file, indent=2)
+    
+    latency = results['latency_ms']
+    print(f"Wysłano {results['sent']}, odebrano {results['received']} "
+          f"(utracone: {results['drop_rate']:.2%})")
+    print(f"Przepustowość: {results['throughput_msg_s']:.0f} wiad./s")
+    if latency['p50'] is not None:
+        print(f"Opóźnienie p50/p95/p99: {latency['p50']:.2f} / "
+              f"{latency['p95']:.2f} / {latency['p99']:.2f} ms")
+    print(f"Wyniki zapisano w {output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,380 @@
+#!/usr/bin/env python3
+"""
+Moduł zawierający wektorowy model kanału radiowego dla kodu Morse'a
+"""
+
+import math
+import time
+import argparse
+
+try:
+    import numpy as np
+except ImportError:
+    # Model kanału wymaga numpy - bez niego stacje nadają bez zakłóceń
+    np = None
+
+from morse_utils import text_to_morse
+from station_profiles import TITANIC_MESSAGES, CARPATHIA_MESSAGES
+
+# Parametry domyślne kanału
+DEFAULT_SNR_DB = 20          # dB, przy tej wartości kanał jest praktycznie czysty
+DEFAULT_FADE_LENGTH = 8      # Średnia długość zaniku w elementach
+DROP_RATIO = 0.5             # Szansa zgubienia elementu względem szansy pomyłki
+INSERT_RATIO = 0.25          # Szansa wstawienia elementu względem szansy pomyłki
+CHUNK_BYTES = 1024 * 1024    # Rozmiar części paczki przetwarzanej naraz (pamięć)
+SPARSE_RATE = 0.05           # Poniżej tej szansy zdarzenia losowane są pozycjami
+
+# Kody bajtowe symboli
+DOT = ord('.')
+DASH = ord('-')
+SPACE = ord(' ')
+
+def snr_error_rate(snr_db):
+    """
+    Zwraca prawdopodobieństwo błędnego odczytu elementu przy danym SNR.
+    
+    Przybliżenie dla niekoherentnego odbioru kluczowania on-off:
+    p = 0.5 * exp(-SNR / 2), gdzie SNR jest w skali liniowej.
+    
+    Args:
+        snr_db (float): Stosunek sygnału do szumu w dB
+    
+    Returns:
+        float: Prawdopodobieństwo błędu elementu (0 - 0.5)
+    """
+    return 0.5 * math.exp(-10 ** (snr_db / 10) / 2)
+
+def jitter_error_rate(jitter):
+    """
+    Zwraca prawdopodobieństwo, że rozrzut czasów przesunie element za próg.
+    
+    Kropka (1 jednostka) i kreska (3), a także przerwa między elementami (1)
+    i między literami (3) są rozróżniane progiem 2 jednostek, więc błąd
+    następuje, gdy odchylenie przekroczy 1 jednostkę: p = Q(1 / jitter).
+    
+    Args:
+        jitter (float): Odchylenie standardowe czasów w jednostkach kodu
+    
+    Returns:
+        float: Prawdopodobieństwo błędu (0 - 0.5)
+    """
+    if jitter <= 0:
+        return 0.0
+    return 0.5 * math.erfc(1 / (jitter * math.sqrt(2)))
+
+class ChannelModel:
+    """
+    Kanał radiowy zniekształcający całe paczki kodów Morse'a naraz.
+    
+    Wszystkie kody z paczki są sklejane w jedną tablicę bajtów i przetwarzane
+    operacjami numpy, bez pętli po znakach. Kanał modeluje:
+        
+        - pomyłki kropka/kreska (szum i rozrzut czasów),
+        - zgubione i wstawione elementy (szum),
+        - rozbicie litery lub sklejenie dwóch liter (rozrzut czasów),
+        - zaniki: seria kolejnych elementów ginie w całości.
+    
+    Prawdopodobieństwa pomyłek, zgubień i wstawień wynikają z SNR, chyba że
+    zostaną podane wprost. Generator losowy jest własnością kanału, więc ten
+    sam seed daje ten sam przebieg zakłóceń.
+    """
+    
+    def __init__(self, snr_db=DEFAULT_SNR_DB, jitter=0.0, fade_rate=0.0,
+                 fade_length=DEFAULT_FADE_LENGTH, confusion_rate=None, drop_rate=None,
+                 insert_rate=None, seed=None):
+        """
+        Inicjalizuje kanał
+        
+        Args:
+            snr_db (float): Stosunek sygnału do szumu w dB
+            jitter (float): Odchylenie standardowe czasów w jednostkach kodu
+            fade_rate (float): Szansa rozpoczęcia zaniku na każdym elemencie
+            fade_length (float): Średnia długość zaniku w elementach
+            confusion_rate (float, optional): Szansa pomyłki kropka/kreska
+            drop_rate (float, optional): Szansa zgubienia elementu
+            insert_rate (float, optional): Szansa wstawienia elementu po elemencie
+            seed (int, optional): Ziarno generatora losowego
+        
+        Raises:
+            ImportError: Jeśli numpy nie jest zainstalowane
+        """
+        if np is None:
+            raise ImportError("Model kanału wymaga biblioteki numpy")
+        
+        error_rate = snr_error_rate(snr_db)
+        self.snr_db = snr_db
+        self.jitter = jitter
+        self.fade_rate = fade_rate
+        self.fade_length = fade_length
+        self.timing_error_rate = jitter_error_rate(jitter)
+        self.confusion_rate = error_rate if confusion_rate is None else confusion_rate
+        self.drop_rate = error_rate * DROP_RATIO if drop_rate is None else drop_rate
+        self.insert_rate = error_rate * INSERT_RATIO if insert_rate is None else insert_rate
+        self.rng = np.random.default_rng(seed)
+    
+    def reseed(self, seed):
+        """
+        Ustawia nowe ziarno generatora losowego kanału.
+        
+        Args:
+            seed (int, optional): Ziarno generatora
+        """
+        self.rng = np.random.default_rng(seed)
+    
+    def __repr__(self):
+        return (f"ChannelModel(snr_db={self.snr_db!r}, jitter={self.jitter!r}, "
+                f"fade_rate={self.fade_rate!r}, fade_length={self.fade_length!r})")
+    
+    def apply(self, morse_code):
+        """
+        Przepuszcza jeden kod Morse'a przez kanał.
+        
+        Args:
+            morse_code (str): Kod Morse'a
+        
+        Returns:
+            str: Kod Morse'a po przejściu przez kanał
+        """
+        return self.apply_batch([morse_code])[0]
+    
+    def apply_batch(self, morse_codes):
+        """
+        Przepuszcza paczkę kodów Morse'a przez kanał.
+        
+        Znaki spoza alfabetu Morse'a i separatory słów przechodzą bez zmian,
+        a zaniki nie przechodzą z jednej wiadomości na następną. Duże paczki
+        są dzielone na części po około CHUNK_BYTES, żeby tablice pomocnicze
+        nie rosły razem z liczbą wiadomości.
+        
+        Args:
+            morse_codes (list): Kody Morse'a
+        
+        Returns:
+            list: Kody Morse'a po przejściu przez kanał, w tej samej kolejności
+        """
+        results = []
+        for encoded in self._chunks(morse_codes):
+            output, out_lengths, _ = self._transmit(encoded)
+            buffer = output.tobytes()
+            offset = 0
+            for length in out_lengths.tolist():
+                results.append(buffer[offset:offset + length].decode('utf-8', errors='replace'))
+                offset += length
+        return results
+    
+    def corrupted(self, morse_codes):
+        """
+        Przepuszcza paczkę przez kanał i zwraca tylko to, które kody uległy zmianie.
+        
+        Nie buduje wynikowych napisów, więc nadaje się do symulacji Monte Carlo
+        na milionach wiadomości. Kod jest zmieniony, jeśli kanał wprowadził
+        w nim choć jedno zdarzenie - sporadycznie zgubiony element i element
+        wstawiony obok dają z powrotem ten sam napis.
+        
+        Args:
+            morse_codes (list): Kody Morse'a
+        
+        Returns:
+            numpy.ndarray: Maska bool kodów zmienionych przez kanał
+        """
+        masks = [self._transmit(encoded, build_output=False)[2]
+                 for encoded in self._chunks(morse_codes)]
+        if not masks:
+            return np.zeros(0, dtype=bool)
+        return np.concatenate(masks)
+    
+    def _chunks(self, morse_codes):
+        """Dzieli paczkę na części po około CHUNK_BYTES zakodowanych w UTF-8"""
+        chunk = []
+        chunk_bytes = 0
+        for morse_code in morse_codes:
+            encoded = morse_code.encode('utf-8')
+            chunk.append(encoded)
+            chunk_bytes += len(encoded)
+            if chunk_bytes >= CHUNK_BYTES:
+                yield chunk
+                chunk = []
+                chunk_bytes = 0
+        if chunk:
+            yield chunk
+    
+    def _transmit(self, encoded, build_output=True):
+        """
+        Przepuszcza przez kanał część paczki.
+        
+        Args:
+            encoded (list): Kody Morse'a zakodowane w UTF-8
+            build_output (bool): Czy składać bajty wyniku
+        
+        Returns:
+            tuple: (bajty wyniku jako numpy.ndarray lub None, długości
+                wynikowych kodów, maska kodów zmienionych przez kanał)
+        """
+        lengths = np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded))
+        data = np.frombuffer(b''.join(encoded), dtype=np.uint8).copy()
+        n = len(data)
+        if n == 0:
+            return data, lengths, np.zeros(len(encoded), dtype=bool)
+        
+        # Granice wiadomości: ends[i] to pozycja za ostatnim bajtem wiadomości i
+        ends = np.cumsum(lengths)
+        starts = ends - lengths
+        same_message_next = np.ones(n, dtype=bool)
+        same_message_next[ends[lengths > 0] - 1] = False
+        
+        is_mark = (data == DOT) | (data == DASH)
+        mark_next = np.zeros(n, dtype=bool)
+        mark_next[:-1] = is_mark[1:]
+        mark_next &= same_message_next
+        mark_prev = np.zeros(n, dtype=bool)
+        mark_prev[1:] = is_mark[:-1] & same_message_next[:-1]
+        
+        # Pomyłki kropka/kreska: 46 + 45 - symbol zamienia jeden na drugi
+        flip = self._events(is_mark, self.confusion_rate + self.timing_error_rate)
+        data[flip] = DOT + DASH - data[flip]
+        
+        # Zgubione elementy i zaniki
+        lost = self._events(is_mark, self.drop_rate)
+        if self.fade_rate > 0:
+            lost |= is_mark & self._fade_mask(is_mark, ends)
+        
+        # Przerwa między literami odczytana jako przerwa między elementami
+        letter_gap = (data == SPACE) & mark_prev & mark_next
+        keep = ~(lost | self._events(letter_gap, self.timing_error_rate))
+        
+        # Znaki dodawane po elemencie: losowy element lub spacja (rozbita litera)
+        extra = np.zeros(n, dtype=np.uint8)
+        inserted = self._events(is_mark, self.insert_rate)
+        extra[inserted] = np.where(self.rng.random(int(inserted.sum())) < 0.5, DOT, DASH)
+        extra[self._events(is_mark & mark_next, self.timing_error_rate)] = SPACE
+        has_extra = extra != 0
+        
+        # Wiadomość jest zmieniona, jeśli zaszło w niej choć jedno zdarzenie
+        changed = np.zeros(len(encoded), dtype=bool)
+        events = np.flatnonzero(flip | ~keep | has_extra)
+        changed[np.searchsorted(ends, events, side='right')] = True
+        if not build_output:
+            return None, None, changed
+        
+        # Wynik: zachowane bajty i bajty dodane za swoimi pozycjami
+        output = data[keep]
+        if has_extra.any():
+            kept_before = np.cumsum(keep, dtype=np.int32)
+            output = np.insert(output, kept_before[has_extra], extra[has_extra])
+        
+        # Nowe długości wiadomości z liczby bajtów wychodzących z każdej pozycji
+        produced = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(keep.astype(np.int64) + has_extra, out=produced[1:])
+        out_lengths = produced[ends] - produced[starts]
+        return output, out_lengths, changed
+    
+    def _events(self, candidates, rate):
+        """
+        Losuje zdarzenia o danym prawdopodobieństwie na wskazanych pozycjach.
+        
+        Rzadkie zdarzenia są losowane jako liczba trafień z rozkładu
+        dwumianowego i tyle różnych pozycji, co jest kilka razy tańsze niż
+        losowanie liczby dla każdej pozycji.
+        
+        Args:
+            candidates (numpy.ndarray): Maska bool pozycji, na których zdarzenie
+                może wystąpić
+            rate (float): Prawdopodobieństwo zdarzenia
+        
+        Returns:
+            numpy.ndarray: Maska bool pozycji ze zdarzeniem
+        """
+        if rate <= 0:
+            return np.zeros(len(candidates), dtype=bool)
+        if rate >= SPARSE_RATE:
+            return candidates & (self.rng.random(len(candidates), dtype=np.float32) < rate)
+        
+        positions = np.flatnonzero(candidates)
+        hits = self.rng.choice(len(positions), self.rng.binomial(len(positions), rate),
+                               replace=False)
+        events = np.zeros(len(candidates), dtype=bool)
+        events[positions[hits]] = True
+        return events
+    
+    def _fade_mask(self, is_mark, ends):
+        """
+        Wyznacza pozycje objęte zanikami.
+        
+        Zanik zaczyna się na elemencie z szansą fade_rate i trwa liczbę
+        elementów z rozkładu geometrycznego o średniej fade_length, ale nie
+        dłużej niż do końca wiadomości.
+        
+        Args:
+            is_mark (numpy.ndarray): Maska pozycji kropek i kresek
+            ends (numpy.ndarray): Pozycje końców kolejnych wiadomości
+        
+        Returns:
+            numpy.ndarray: Maska bool pozycji w zaniku
+        """
+        n = len(is_mark)
+        fade_starts = np.flatnonzero(self._events(is_mark, self.fade_rate))
+        if not len(fade_starts):
+            return np.zeros(n, dtype=bool)
+        
+        durations = self.rng.geometric(1 / max(self.fade_length, 1), size=len(fade_starts))
+        fade_ends = np.minimum(
+            fade_starts + durations,
+            ends[np.searchsorted(ends, fade_starts, side='right')]
+        )
+        delta = np.zeros(n + 1, dtype=np.int32)
+        np.add.at(delta, fade_starts, 1)
+        np.add.at(delta, fade_ends, -1)
+        return np.cumsum(delta[:-1]) > 0
+
+def message_success_rate(channel, morse_codes):
+    """
+    Zwraca odsetek kodów, które przeszły przez kanał bez zmian.
+    
+    Args:
+        channel (ChannelModel): Kanał
+        morse_codes (list): Kody Morse'a
+    
+    Returns:
+        float: Odsetek kodów odebranych bez błędu
+    """
+    if not morse_codes:
+        return 1.0
+    return 1 - channel.corrupted(morse_codes).mean()
+
+def main(argv=None):
+    """
+    Symulacja Monte Carlo niezawodności łączności dla kolejnych wartości SNR.
+    
+    Args:
+        argv (list, optional): Argumenty wiersza poleceń
+    """
+    parser = argparse.ArgumentParser(
+        description="Niezawodność kanału radiowego w funkcji SNR (Monte Carlo)"
+    )
+    parser.add_argument("--snr", type=float, nargs='+', default=[0, 3, 6, 9, 12, 15],
+                        help="Wartości SNR w dB")
+    parser.add_argument("--messages", type=int, default=100000,
+                        help="Liczba wiadomości na punkt pomiarowy")
+    parser.add_argument("--jitter", type=float, default=0.0,
+                        help="Rozrzut czasów w jednostkach kodu")
+    parser.add_argument("--fade-rate", type=float, default=0.0,
+                        help="Szansa rozpoczęcia zaniku na elemencie")
+    parser.add_argument("--fade-length", type=float, default=DEFAULT_FADE_LENGTH,
+                        help="Średnia długość zaniku w elementach")
+    parser.add_argument("--seed", type=int, default=1912, help="Ziarno generatora")
+    args = parser.parse_args(argv)
+    
+    corpus = [text_to_morse(message) for message in TITANIC_MESSAGES + CARPATHIA_MESSAGES]
+    morse_codes = (corpus * (args.messages // len(corpus) + 1))[:args.messages]
+    
+    for snr_db in args.snr:
+        channel = ChannelModel(snr_db, args.jitter, args.fade_rate, args.fade_length,
+                               seed=args.seed)
+        start = time.perf_counter()
+        success = message_success_rate(channel, morse_codes)
+        elapsed = time.perf_counter() - start
+        print(f"SNR {snr_db:5.1f} dB: {success:7.2%} wiadomości bez błędu "
+              f"({len(morse_codes) / elapsed:,.0f} wiad./s)")
+
+if __name__ == "__main__":
+    main()
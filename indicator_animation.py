@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Moduł zawierający animację wskaźnika sygnału sterowaną pętlą zdarzeń Tk
+"""
+
+import time
+
+import metrics
+from morse_timing import DEFAULT_TIMING
+
+class IndicatorAnimator:
+    """
+    Odtwarza kod Morse'a jako miganie wskaźnika bez blokowania interfejsu.
+    
+    Kod jest zamieniany z góry na listę odcinków włączenia i wyłączenia, które
+    są odtwarzane przez root.after(), a terminy liczone są od wspólnego
+    momentu startu, dzięki czemu opóźnienia pętli zdarzeń nie kumulują się.
+    Tkinter nie jest bezpieczny wątkowo, więc metody publiczne wolno wywołać
+    wyłącznie w wątku Tk - inne wątki przekazują wywołanie przez UIBus.
+    """
+    
+    def __init__(self, root, indicator, on_color, off_color="black", timing=DEFAULT_TIMING):
+        """
+        Inicjalizuje animację
+        
+        Args:
+            root (tk.Tk lub tk.Frame): Widget, którego pętla zdarzeń wykonuje animację
+            indicator (tk.Widget): Wskaźnik zmieniający kolor tła
+            on_color (str): Kolor wskaźnika podczas sygnału
+            off_color (str): Kolor wskaźnika podczas ciszy
+            timing (MorseTiming): Model czasowy transmisji
+        """
+        self.root = root
+        self.indicator = indicator
+        self.on_color = on_color
+        self.off_color = off_color
+        self.timing = timing
+        self._after_id = None
+    
+    def play(self, morse_code):
+        """
+        Rozpoczyna animację kodu Morse'a, przerywając poprzednią (wątek Tk).
+        
+        Args:
+            morse_code (str): Kod Morse'a do wyświetlenia
+        """
+        # Oś czasu: (kolor, moment zakończenia odcinka w sekundach od startu)
+        steps = []
+        elapsed = 0.0
+        for is_on, duration in self.timing.timeline(morse_code):
+            elapsed += duration
+            steps.append((self.on_color if is_on else self.off_color, elapsed))
+        
+        self.cancel()
+        self._step(steps, 0, time.monotonic())
+    
+    def cancel(self):
+        """Przerywa bieżącą animację i gasi wskaźnik (wątek Tk)"""
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+        self.indicator.config(bg=self.off_color)
+    
+    def _step(self, steps, index, start):
+        """Wyświetla kolejny odcinek i planuje następny (wątek Tk)"""
+        # Etap "gui_blink": praca jednego kroku animacji w wątku Tk
+        with metrics.timer("gui_blink"):
+            if index >= len(steps):
+                self._after_id = None
+                self.indicator.config(bg=self.off_color)
+                return
+            
+            color, end = steps[index]
+            self.indicator.config(bg=color)
+            
+            delay = max(0, int((start + end - time.monotonic()) * 1000))
+            self._after_id = self.root.after(delay, self._step, steps, index + 1, start)
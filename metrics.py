@@ -0,0 +1,402 @@
+#!/usr/bin/env python3
+"""
+Moduł zawierający pomiary czasu etapów transmisji i liczniki ruchu stacji
+"""
+
+import os
+import json
+import time
+import bisect
+import threading
+
+# Granice przedziałów histogramów w sekundach (1 µs - 100 s)
+BUCKETS = tuple(
+    mantissa * 10.0 ** exponent for exponent in range(-6, 2) for mantissa in (1, 2.5, 5)
+) + (100.0,)
+
+# Eksport
+METRIC_PREFIX = "morse"
+EXPORT_INTERVAL = 5.0       # s, odstęp zapisu migawki do pliku
+METRICS_HOST = 'localhost'
+
+# Zmienne środowiskowe konfigurujące pomiary (configure_from_env)
+ENV_ENABLE = 'MORSE_METRICS'              # 1 - włącza pomiary
+ENV_FILE = 'MORSE_METRICS_FILE'           # Plik migawki (.json albo tekst Prometheusa)
+ENV_PORT = 'MORSE_METRICS_PORT'           # Port HTTP z /metrics i /metrics.json
+ENV_INTERVAL = 'MORSE_METRICS_INTERVAL'   # Odstęp zapisu migawki w sekundach
+ENV_PROFILE = 'MORSE_PROFILE'             # Plik profilu cProfile pierwszej transmisji
+
+class Histogram:
+    """Histogram czasów z ustalonymi przedziałami, bezpieczny wątkowo"""
+    
+    def __init__(self, buckets=BUCKETS):
+        """
+        Inicjalizuje histogram
+        
+        Args:
+            buckets (tuple): Rosnące górne granice przedziałów w sekundach
+        """
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self._lock = threading.Lock()
+    
+    def observe(self, value):
+        """Dodaje pomiar do histogramu"""
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.count += 1
+            self.sum += value
+    
+    def snapshot(self):
+        """
+        Zwraca stan histogramu.
+        
+        Returns:
+            dict: Liczba i suma pomiarów oraz skumulowane liczby w przedziałach
+        """
+        with self._lock:
+            counts = list(self.counts)
+            count, total = self.count, self.sum
+        cumulative = []
+        running = 0
+        for bound, bucket_count in zip(self.buckets + (float('inf'),), counts):
+            running += bucket_count
+            cumulative.append((bound, running))
+        return {'count': count, 'sum': total, 'buckets': cumulative}
+
+class _NullContext:
+    """Kontekst, który nic nie robi - zwracany, gdy pomiary są wyłączone"""
+    
+    __slots__ = ()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        return False
+
+_NULL_CONTEXT = _NullContext()
+
+class _StageTimer:
+    """Kontekst mierzący czas bloku i dodający go do histogramu etapu"""
+    
+    __slots__ = ('histogram', 'start')
+    
+    def __init__(self, histogram):
+        self.histogram = histogram
+        self.start = 0.0
+    
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.histogram.observe(time.perf_counter() - self.start)
+        return False
+
+class _Profiler:
+    """Kontekst profilujący blok przez cProfile i zapisujący wynik do pliku"""
+    
+    def __init__(self, path):
+        import cProfile
+        self.path = path
+        self.profile = cProfile.Profile()
+    
+    def __enter__(self):
+        self.profile.enable()
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.profile.disable()
+        self.profile.dump_stats(self.path)
+        print(f"Profil transmisji zapisano w {self.path}")
+        return False
+
+# Stan pomiarów (wspólny dla całego procesu)
+_enabled = False
+_histograms = {}
+_counters = {}
+_registry_lock = threading.Lock()
+_profile_path = None
+_configured = False
+
+def enable():
+    """Włącza pomiary"""
+    global _enabled
+    _enabled = True
+
+def disable():
+    """Wyłącza pomiary (zebrane dane pozostają)"""
+    global _enabled
+    _enabled = False
+
+def enabled():
+    """Czy pomiary są włączone"""
+    return _enabled
+
+def reset():
+    """Usuwa wszystkie zebrane histogramy i liczniki"""
+    with _registry_lock:
+        _histograms.clear()
+        _counters.clear()
+
+def _histogram(stage):
+    """Zwraca histogram etapu, tworząc go przy pierwszym użyciu"""
+    histogram = _histograms.get(stage)
+    if histogram is None:
+        with _registry_lock:
+            histogram = _histograms.setdefault(stage, Histogram())
+    return histogram
+
+def timer(stage):
+    """
+    Zwraca kontekst mierzący czas bloku kodu jako etap transmisji.
+    
+    Przy wyłączonych pomiarach zwracany jest wspólny pusty kontekst, więc
+    koszt sprowadza się do jednego wywołania funkcji.
+    
+    Args:
+        stage (str): Nazwa etapu, np. "encode"
+    
+    Returns:
+        Kontekst do użycia w instrukcji with
+    """
+    if not _enabled:
+        return _NULL_CONTEXT
+    return _StageTimer(_histogram(stage))
+
+def observe(stage, seconds):
+    """
+    Dodaje zmierzony czas do histogramu etapu.
+    
+    Args:
+        stage (str): Nazwa etapu
+        seconds (float): Czas w sekundach
+    """
+    if _enabled:
+        _histogram(stage).observe(seconds)
+
+def count(name, value=1):
+    """
+    Zwiększa licznik.
+    
+    Args:
+        name (str): Nazwa licznika, np. "bytes_sent"
+        value (int): Przyrost
+    """
+    if not _enabled:
+        return
+    with _registry_lock:
+        _counters[name] = _counters.get(name, 0) + value
+
+def snapshot():
+    """
+    Zwraca migawkę wszystkich pomiarów.
+    
+    Returns:
+        dict: Znacznik czasu, liczniki i histogramy etapów
+    """
+    with _registry_lock:
+        counters = dict(_counters)
+        histograms = dict(_histograms)
+    return {
+        'timestamp': time.time(),
+        'counters': counters,
+        'stages': {stage: histogram.snapshot() for stage, histogram in histograms.items()},
+    }
+
+def _format_bound(bound):
+    """Zapisuje granicę przedziału w formacie Prometheusa"""
+    return "+Inf" if bound == float('inf') else repr(bound)
+
+def prometheus_text(data=None):
+    """
+    Zapisuje migawkę w formacie tekstowym Prometheusa.
+    
+    Args:
+        data (dict, optional): Migawka z snapshot(), domyślnie bieżąca
+    
+    Returns:
+        str: Tekst gotowy do zebrania przez Prometheusa
+    """
+    data = data or snapshot()
+    lines = []
+    for name, value in sorted(data['counters'].items()):
+        metric = f"{METRIC_PREFIX}_{name}_total"
+        lines.append(f"# TYPE {metric} counter")
+        lines.append(f"{metric} {value}")
+    
+    metric = f"{METRIC_PREFIX}_stage_seconds"
+    if data['stages']:
+        lines.append(f"# TYPE {metric} histogram")
+    for stage, histogram in sorted(data['stages'].items()):
+        for bound, bucket_count in histogram['buckets']:
+            lines.append(f'{metric}_bucket{{stage="{stage}",le="{_format_bound(bound)}"}} '
+                         f'{bucket_count}')
+        lines.append(f'{metric}_sum{{stage="{stage}"}} {histogram["sum"]!r}')
+        lines.append(f'{metric}_count{{stage="{stage}"}} {histogram["count"]}')
+    return '\n'.join(lines) + '\n'
+
+def json_text(data=None):
+    """
+    Zapisuje migawkę w formacie JSON.
+    
+    Args:
+        data (dict, optional): Migawka z snapshot(), domyślnie bieżąca
+    
+    Returns:
+        str: Migawka jako tekst JSON
+    """
+    data = data or snapshot()
+    stages = {
+        stage: dict(histogram, buckets=[[_format_bound(bound), bucket_count]
+                                        for bound, bucket_count in histogram['buckets']])
+        for stage, histogram in data['stages'].items()
+    }
+    return json.dumps(dict(data, stages=stages), indent=2)
+
+def write_snapshot(path):
+    """
+    Zapisuje migawkę do pliku, podmieniając go w całości.
+    
+    Plik .json dostaje format JSON, każdy inny - tekst Prometheusa (np. dla
+    textfile collectora node_exportera).
+    
+    Args:
+        path (str): Ścieżka pliku
+    """
+    text = json_text() if path.endswith('.json') else prometheus_text()
+    temporary = f"{path}.tmp"
+    with open(temporary, 'w', encoding='utf-8') as snapshot_file:
+        snapshot_file.write(text)
+    # Czytelnik pliku nigdy nie zobaczy migawki zapisanej w połowie
+    os.replace(temporary, path)
+
+def start_file_export(path, interval=EXPORT_INTERVAL):
+    """
+    Uruchamia wątek zapisujący migawkę do pliku co interval sekund.
+    
+    Args:
+        path (str): Ścieżka pliku
+        interval (float): Odstęp zapisu w sekundach
+    
+    Returns:
+        threading.Event: Zdarzenie, którego ustawienie zatrzymuje zapis
+    """
+    stopped = threading.Event()
+    
+    def export_loop():
+        while not stopped.wait(interval):
+            try:
+                write_snapshot(path)
+            except OSError as e:
+                print(f"Błąd zapisu pomiarów: {e}")
+    
+    threading.Thread(target=export_loop, name="metrics-export", daemon=True).start()
+    return stopped
+
+def serve(port, host=METRICS_HOST):
+    """
+    Udostępnia migawkę przez HTTP: /metrics (Prometheus) i /metrics.json.
+    
+    Args:
+        port (int): Port nasłuchiwania (0 - dowolny wolny port)
+        host (str): Adres nasłuchiwania
+    
+    Returns:
+        HTTPServer: Działający serwer (server_address zawiera port)
+    """
+    from http.server import HTTPServer, BaseHTTPRequestHandler
+    
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path == '/metrics.json':
+                body, content_type = json_text(), 'application/json'
+            elif self.path in ('/', '/metrics'):
+                body, content_type = prometheus_text(), 'text/plain; version=0.0.4'
+            else:
+                self.send_error(404)
+                return
+            body = body.encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        
+        def log_message(self, format, *args):
+            pass
+    
+    server = HTTPServer((host, port), MetricsHandler)
+    threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+    return server
+
+def profile_next(path):
+    """
+    Włącza profilowanie cProfile najbliższej transmisji.
+    
+    Args:
+        path (str): Plik, do którego trafią statystyki (pstats)
+    """
+    global _profile_path
+    _profile_path = path
+
+def profiled():
+    """
+    Zwraca kontekst profilujący blok, jeśli wywołano wcześniej profile_next.
+    
+    Profilowana jest tylko jedna transmisja - kolejne wywołania zwracają
+    pusty kontekst.
+    
+    Returns:
+        Kontekst do użycia w instrukcji with
+    """
+    global _profile_path
+    if _profile_path is None:
+        return _NULL_CONTEXT
+    with _registry_lock:
+        path, _profile_path = _profile_path, None
+    if path is None:
+        return _NULL_CONTEXT
+    return _Profiler(path)
+
+def configure_from_env(environ=None):
+    """
+    Włącza pomiary i eksport zgodnie ze zmiennymi środowiskowymi.
+    
+    Wywołanie jest jednorazowe - kolejne nic nie zmieniają, więc kilka
+    stacji w jednym procesie nie otwiera drugi raz tego samego portu.
+    
+    Args:
+        environ (dict, optional): Zmienne środowiskowe, domyślnie os.environ
+    
+    Returns:
+        bool: Czy pomiary są włączone
+    """
+    global _configured
+    environ = os.environ if environ is None else environ
+    with _registry_lock:
+        if _configured:
+            return _enabled
+        _configured = True
+    
+    if environ.get(ENV_PROFILE):
+        profile_next(environ[ENV_PROFILE])
+    if environ.get(ENV_ENABLE, '0') in ('', '0'):
+        return False
+    
+    enable()
+    if environ.get(ENV_FILE):
+        start_file_export(environ[ENV_FILE],
+                          float(environ.get(ENV_INTERVAL, EXPORT_INTERVAL)))
+    if environ.get(ENV_PORT):
+        try:
+            server = serve(int(environ[ENV_PORT]))
+            print(f"Pomiary dostępne na http://{METRICS_HOST}:"
+                  f"{server.server_address[1]}/metrics")
+        except OSError as e:
+            print(f"Nie można udostępnić pomiarów: {e}")
+    return True
@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""
+Bezgłowe narzędzie wiersza poleceń: kodowanie, dekodowanie, nadawanie, nasłuch i pomiary
+
+Uruchamianie: python -m morse_cli <polecenie> [opcje]
+
+Na starcie ładowane są tylko morse_utils i station_profiles - sieć, dźwięk,
+numpy i benchmarki importuje dopiero polecenie, które ich potrzebuje.
+"""
+
+import sys
+import time
+import argparse
+
+from morse_utils import text_to_morse, morse_to_text
+from station_protocol import BROADCAST_CALL_SIGN
+from station_profiles import (
+    CARPATHIA_HOST, CARPATHIA_PORT, CARPATHIA_CALL_SIGN, TITANIC_CALL_SIGN, PROFILES,
+    parse_address
+)
+
+# Parametry nadawania
+SEND_DRAIN_TIMEOUT = 10     # s, czas oczekiwania na wysłanie ramek z kolejki
+DRAIN_POLL_INTERVAL = 0.01  # s
+
+# Benchmarki uruchamiane poleceniem bench (nazwa -> moduł z funkcją main)
+BENCHMARKS = {
+    'morse': 'bench_morse',
+    'stations': 'bench_stations',
+    'imports': 'bench_imports',
+}
+
+def _read_lines(values):
+    """
+    Zwraca dane wejściowe polecenia.
+    
+    Args:
+        values (list): Argumenty pozycyjne
+    
+    Returns:
+        list: Argumenty połączone w jedną linię albo, gdy ich brak, niepuste
+            linie ze standardowego wejścia
+    """
+    if values:
+        return [' '.join(values)]
+    return [line.strip() for line in sys.stdin if line.strip()]
+
+def _address(value):
+    """Zamienia adres host:port z wiersza poleceń na krotkę (host, port)"""
+    try:
+        return parse_address(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+def _timing(wpm):
+    """Zwraca model czasowy dla podanego tempa (None - domyślny)"""
+    from morse_timing import MorseTiming, DEFAULT_TIMING
+    return DEFAULT_TIMING if wpm is None else MorseTiming(wpm)
+
+def command_encode(args):
+    """Koduje tekst do Morse'a, opcjonalnie zapisując lub odtwarzając dźwięk"""
+    lines = _read_lines(args.text)
+    codes = [text_to_morse(line) for line in lines]
+    for morse_code in codes:
+        print(morse_code)
+    if not (args.wav or args.play):
+        return 0
+    
+    # Import lokalny - synteza dźwięku ładuje numpy
+    import morse_sound
+    morse_code = ' / '.join(codes)
+    try:
+        timing = _timing(args.wpm)
+        if args.wav:
+            morse_sound.render_to_wav(morse_code, args.wav, timing=timing)
+            print(f"Zapisano {args.wav}")
+        if args.play:
+            morse_sound.play_morse(morse_code, timing=timing)
+    except (ImportError, OSError, ValueError) as e:
+        print(f"Błąd: {e}")
+        return 1
+    return 0
+
+def command_decode(args):
+    """Dekoduje kod Morse'a albo nagrania WAV"""
+    if not args.wav:
+        for line in _read_lines(args.code):
+            print(morse_to_text(line))
+        return 0
+    
+    # Import lokalny - odbiornik sygnału audio ładuje numpy
+    import wave
+    from morse_receiver import decode_wav
+    status = 0
+    for path in args.wav:
+        try:
+            text = decode_wav(path, args.frequency, args.wpm)[0]
+        except (ImportError, OSError, EOFError, ValueError, wave.Error) as e:
+            print(f"{path}: błąd: {e}")
+            status = 1
+            continue
+        print(text)
+    return status
+
+def _open_journal(name):
+    """Otwiera dziennik ruchu sesji, jeśli podano jego nazwę"""
+    if name is None:
+        return None
+    from radio_station import station_journal
+    return station_journal(name)
+
+def command_send(args):
+    """Nadaje wiadomości do stacji lub węzła i czeka na ich wysłanie"""
+    import metrics
+    from radio_station import RadioStation, radio_channel
+    metrics.configure_from_env()
+    
+    channel = None
+    if args.snr is not None:
+        channel = radio_channel(args.snr)
+        if channel is None:
+            print("Brak numpy - nadawanie bez zakłóceń")
+    
+    station = RadioStation(
+        args.call_sign,
+        peer=None if args.hub else (args.host, args.port),
+        hub=args.hub,
+        peer_call_sign=args.to,
+        channel=channel,
+        packet_format=args.packet_format,
+        seed=args.seed,
+        journal=_open_journal(args.journal)
+    )
+    delivered = [0]
+    last_status = [None]
+    
+    def on_sent(count):
+        delivered[0] += count
+    
+    def on_status(text):
+        last_status[0] = text
+    
+    station.on_sent = on_sent
+    station.on_status = on_status
+    station.start()
+    
+    messages = _read_lines(args.message) * args.count
+    try:
+        for index, message in enumerate(messages):
+            if index and args.interval:
+                time.sleep(args.interval)
+            station.transmit(message)
+        
+        # Zatrzymanie stacji porzuca ramki czekające w kolejce nadawczej
+        drain_end = time.monotonic() + args.timeout
+        while delivered[0] < len(messages) and time.monotonic() < drain_end:
+            time.sleep(DRAIN_POLL_INTERVAL)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        station.stop()
+    
+    print(f"Wysłano {delivered[0]} z {len(messages)} wiadomości")
+    if delivered[0] < len(messages):
+        if last_status[0]:
+            print(last_status[0])
+        return 1
+    return 0
+
+def command_listen(args):
+    """
+    Odbiera ramki i wypisuje je do czasu przerwania (Ctrl+C lub SIGTERM).
+    
+    Z profilem stacji polecenie działa jak bezgłowa stacja Titanica lub
+    Carpathii: nadaje przez zakłócony kanał i odpowiada na wezwania pomocy.
+    """
+    import signal
+    import threading
+    import metrics
+    from radio_station import RadioStation, radio_channel
+    metrics.configure_from_env()
+    
+    profile = PROFILES.get(args.profile)
+    call_sign = args.call_sign or (profile.call_sign if profile else CARPATHIA_CALL_SIGN)
+    station = RadioStation(
+        call_sign,
+        port=None if args.hub else args.port,
+        peer=args.peer,
+        hub=args.hub,
+        host=args.host,
+        peer_call_sign=args.peer_call_sign,
+        responses=profile.responses if profile else (),
+        auto_response_probability=profile.auto_response_probability if profile else 0.0,
+        channel=radio_channel(profile.snr_db) if profile and args.peer else None,
+        seed=args.seed,
+        journal=_open_journal(args.journal)
+    )
+    output_lock = threading.Lock()
+    finished = threading.Event()
+    received = [0]
+    
+    def on_receive(frame):
+        stamp = time.strftime('%H:%M:%S', time.localtime(frame.timestamp))
+        with output_lock:
+            print(f"[{stamp}] {frame.sender}->{frame.recipient} #{frame.sequence}: "
+                  f"{frame.message}", flush=True)
+            if args.morse:
+                print(f"    {frame.morse_code}", flush=True)
+            received[0] += 1
+            if args.count and received[0] >= args.count:
+                finished.set()
+    
+    station.on_receive = on_receive
+    if not station.start():
+        return 1
+    if args.hub:
+        print(f"Stacja {call_sign} nasłuchuje przez węzeł {args.hub[0]}:{args.hub[1]}",
+              flush=True)
+    else:
+        print(f"Stacja {call_sign} nasłuchuje na porcie {station.port}", flush=True)
+    signal.signal(signal.SIGTERM, lambda signum, frame: finished.set())
+    
+    try:
+        finished.wait(args.timeout)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        station.stop()
+    return 0
+
+def command_bench(args):
+    """Uruchamia wybrany benchmark z jego własnymi argumentami"""
+    import importlib
+    module = importlib.import_module(BENCHMARKS[args.benchmark])
+    return module.main(args.options)
+
+def build_parser():
+    """
+    Tworzy parser argumentów narzędzia.
+    
+    Returns:
+        argparse.ArgumentParser: Parser z podpoleceniami
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m morse_cli",
+        description="Kodowanie, dekodowanie, nadawanie i odbiór Morse'a bez interfejsu graficznego"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    
+    encode_parser = commands.add_parser("encode", help="Tekst na kod Morse'a")
+    encode_parser.add_argument("text", nargs="*",
+                               help="Tekst (domyślnie linie ze standardowego wejścia)")
+    encode_parser.add_argument("--wav", help="Zapisz transmisję do pliku WAV")
+    encode_parser.add_argument("--play", action="store_true", help="Odtwórz transmisję")
+    encode_parser.add_argument("--wpm", type=float, help="Tempo nadawania dźwięku")
+    encode_parser.set_defaults(handler=command_encode)
+    
+    decode_parser = commands.add_parser("decode", help="Kod Morse'a lub nagranie na tekst")
+    decode_parser.add_argument("code", nargs="*",
+                               help="Kod Morse'a (domyślnie linie ze standardowego wejścia)")
+    decode_parser.add_argument("--wav", action="append", default=[],
+                               help="Dekoduj nagranie WAV 16-bit (można powtórzyć)")
+    decode_parser.add_argument("--frequency", type=float,
+                               help="Częstotliwość tonu nagrania w Hz (domyślnie wykrywana)")
+    decode_parser.add_argument("--wpm", type=float,
+                               help="Początkowe tempo nadawcy (domyślnie szacowane)")
+    decode_parser.set_defaults(handler=command_decode)
+    
+    send_parser = commands.add_parser("send", help="Nadanie wiadomości do stacji")
+    send_parser.add_argument("message", nargs="*",
+                             help="Wiadomość (domyślnie linie ze standardowego wejścia)")
+    send_parser.add_argument("--host", default=CARPATHIA_HOST, help="Adres stacji docelowej")
+    send_parser.add_argument("--port", type=int, default=CARPATHIA_PORT,
+                             help="Port stacji docelowej")
+    send_parser.add_argument("--hub", type=_address,
+                             help="Nadaj przez węzeł przekaźnikowy host:port")
+    send_parser.add_argument("--call-sign", default=TITANIC_CALL_SIGN,
+                             help="Znak wywoławczy nadawcy")
+    send_parser.add_argument("--to", default=CARPATHIA_CALL_SIGN, help="Znak wywoławczy adresata")
+    send_parser.add_argument("--count", type=int, default=1, help="Liczba powtórzeń wiadomości")
+    send_parser.add_argument("--interval", type=float, default=0.0,
+                             help="Odstęp między wiadomościami w sekundach")
+    send_parser.add_argument("--snr", type=float,
+                             help="Symuluj zakłócenia kanału o podanym SNR w dB (wymaga numpy)")
+    send_parser.add_argument("--packet-format", choices=['binary', 'text'], default='binary',
+                             help="Format danych ramki")
+    send_parser.add_argument("--seed", type=int,
+                             help="Ziarno generatora zakłóceń (powtarzalny przebieg)")
+    send_parser.add_argument("--journal", help="Zapisz ruch w dzienniku o podanej nazwie")
+    send_parser.add_argument("--timeout", type=float, default=SEND_DRAIN_TIMEOUT,
+                             help="Czas oczekiwania na wysłanie wiadomości (s)")
+    send_parser.set_defaults(handler=command_send)
+    
+    listen_parser = commands.add_parser("listen", help="Odbiór i wypisywanie wiadomości")
+    listen_parser.add_argument("--host", default='localhost', help="Adres nasłuchiwania")
+    listen_parser.add_argument("--port", type=int, default=CARPATHIA_PORT,
+                               help="Port nasłuchiwania (0 - dowolny wolny port)")
+    listen_parser.add_argument("--hub", type=_address,
+                               help="Odbieraj przez węzeł przekaźnikowy host:port")
+    listen_parser.add_argument("--call-sign",
+                               help="Znak wywoławczy stacji (domyślnie z profilu lub "
+                                    f"{CARPATHIA_CALL_SIGN})")
+    listen_parser.add_argument("--profile", choices=sorted(PROFILES),
+                               help="Działaj jak bezgłowa stacja z profilu: automatyczne "
+                                    "odpowiedzi i zakłócenia kanału")
+    listen_parser.add_argument("--peer", type=_address,
+                               help="Stacja host:port, do której trafiają odpowiedzi")
+    listen_parser.add_argument("--peer-call-sign", default=BROADCAST_CALL_SIGN,
+                               help="Znak wywoławczy adresata odpowiedzi")
+    listen_parser.add_argument("--count", type=int,
+                               help="Zakończ po odebraniu podanej liczby wiadomości")
+    listen_parser.add_argument("--timeout", type=float, help="Zakończ po podanym czasie (s)")
+    listen_parser.add_argument("--morse", action="store_true", help="Wypisuj także kod Morse'a")
+    listen_parser.add_argument("--seed", type=int,
+                               help="Ziarno generatora odpowiedzi i zakłóceń (powtarzalny przebieg)")
+    listen_parser.add_argument("--journal", help="Zapisz ruch w dzienniku o podanej nazwie")
+    listen_parser.set_defaults(handler=command_listen)
+    
+    bench_parser = commands.add_parser("bench", help="Uruchomienie benchmarku")
+    bench_parser.add_argument("benchmark", choices=sorted(BENCHMARKS),
+                              help="morse - kodowanie i synteza, stations - łączność, "
+                                   "imports - czas uruchamiania")
+    bench_parser.add_argument("options", nargs=argparse.REMAINDER,
+                              help="Argumenty przekazywane do benchmarku")
+    bench_parser.set_defaults(handler=command_bench)
+    return parser
+
+def main(argv=None):
+    """
+    Uruchamia polecenie z wiersza poleceń.
+    
+    Args:
+        argv (list, optional): Argumenty wiersza poleceń
+    
+    Returns:
+        int: Kod wyjścia polecenia
+    """
+    args = build_parser().parse_args(argv)
+    return args.handler(args) or 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,495 @@
+#!/usr/bin/env python3
+"""
+Moduł zawierający odbiornik dekodujący kod Morse'a z sygnału audio (PCM)
+"""
+
+import sys
+import math
+import time
+import wave
+import argparse
+
+try:
+    import numpy as np
+except ImportError:
+    # Detekcja tonu wymaga numpy - bez niego odbiór możliwy jest tylko z ramek
+    np = None
+
+from morse_utils import MorseStreamDecoder
+from morse_timing import PARIS_UNITS
+from morse_sound import SAMPLE_RATE
+
+# Detekcja tonu
+BLOCK_DURATION = 0.005        # s, długość bloku filtru Goertzela
+DETECT_DURATION = 1.0         # s, ilość sygnału użyta do wykrycia częstotliwości
+DETECT_FRAME = 4096           # Długość ramki FFT przy wykrywaniu częstotliwości
+MIN_TONE = 200                # Hz, zakres szukania tonu
+MAX_TONE = 3000               # Hz
+SIGNAL_TO_NOISE = 3.0         # Minimalny stosunek poziomu tonu do poziomu szumu
+LEVEL_SMOOTHING = 0.3         # Waga nowego pomiaru poziomów sygnału i szumu
+SIGNAL_PERCENTILE = 95        # Percentyl amplitudy bloku uznawany za poziom tonu
+NOISE_PERCENTILE = 20         # Percentyl amplitudy bloku uznawany za poziom szumu
+
+# Estymacja tempa
+INITIAL_MARKS = 8             # Liczba sygnałów zbieranych przed pierwszą estymacją
+SPEED_SMOOTHING = 0.2         # Waga nowego pomiaru przy śledzeniu tempa nadawcy
+GLITCH_UNITS = 0.25           # Krótsze odcinki (w jednostkach) są zakłóceniami
+# Granice klasyfikacji w jednostkach kodu - średnie geometryczne sąsiednich
+# długości, więc zmiana tempa jest tak samo tolerowana w obie strony
+DASH_THRESHOLD = math.sqrt(3)          # Kropka (1) / kreska (3), przerwa w literze / między literami
+WORD_GAP_THRESHOLD = math.sqrt(3 * 7)  # Przerwa między literami (3) / między słowami (7)
+CLUSTER_RATIO = 2             # Minimalny skok długości oddzielający dwie grupy odcinków
+
+STREAM_CHUNK = 1.0            # s, fragment sygnału przetwarzany naraz w trybie wsadowym
+
+def detect_frequency(pcm, sample_rate=SAMPLE_RATE, min_tone=MIN_TONE, max_tone=MAX_TONE):
+    """
+    Wykrywa częstotliwość tonu w sygnale na podstawie uśrednionego widma FFT.
+    
+    Args:
+        pcm (numpy.ndarray): Próbki mono
+        sample_rate (int): Częstotliwość próbkowania w Hz
+        min_tone (float): Dolna granica szukanej częstotliwości w Hz
+        max_tone (float): Górna granica szukanej częstotliwości w Hz
+    
+    Returns:
+        float: Częstotliwość tonu w Hz
+    
+    Raises:
+        ImportError: Jeśli numpy nie jest zainstalowane
+        ValueError: Jeśli sygnał jest zbyt krótki
+    """
+    if np is None:
+        raise ImportError("Odbiornik Morse'a wymaga biblioteki numpy")
+    
+    frame = min(DETECT_FRAME, len(pcm))
+    if frame < 2:
+        raise ValueError("Sygnał jest zbyt krótki do wykrycia tonu")
+    
+    # Widmo uśrednione po ramkach (metoda Welcha bez nakładania)
+    frames = np.asarray(pcm[:len(pcm) // frame * frame], dtype=np.float32).reshape(-1, frame)
+    spectrum = (np.abs(np.fft.rfft(frames * np.hanning(frame).astype(np.float32))) ** 2).mean(axis=0)
+    
+    frequencies = np.fft.rfftfreq(frame, 1 / sample_rate)
+    band = (frequencies >= min_tone) & (frequencies <= max_tone)
+    return float(frequencies[band][np.argmax(spectrum[band])])
+
+def estimate_unit(marks, spaces):
+    """
+    Szacuje długość jednostki kodu na podstawie czasów sygnałów i przerw.
+    
+    Sygnały dzielone są na kropki i kreski w miejscu największego skoku
+    długości. Jeśli wszystkie sygnały są jednego rodzaju, jednostką jest
+    najkrótsza grupa przerw (przerwy między elementami litery).
+    
+    Args:
+        marks (list): Czasy sygnałów w sekundach
+        spaces (list): Czasy przerw w sekundach
+    
+    Returns:
+        float: Długość jednostki w sekundach
+    """
+    def short_cluster(durations):
+        durations = sorted(durations)
+        ratios = [durations[i + 1] / durations[i] for i in range(len(durations) - 1)]
+        if ratios and max(ratios) >= CLUSTER_RATIO:
+            split = ratios.index(max(ratios)) + 1
+            return sum(durations[:split]) / split, True
+        return sum(durations) / len(durations), False
+    
+    mark_unit, has_dashes = short_cluster(marks)
+    if has_dashes or not spaces:
+        return mark_unit
+    
+    gap_unit, _ = short_cluster(spaces)
+    # Same kreski - sygnały są co najmniej dwa razy dłuższe niż przerwy w literze
+    if mark_unit >= CLUSTER_RATIO * gap_unit:
+        return gap_unit
+    return mark_unit
+
+class MorseReceiver:
+    """
+    Strumieniowy odbiornik Morse'a dekodujący sygnał audio int16.
+    
+    Sygnał jest dzielony na bloki, w których filtr Goertzela mierzy
+    amplitudę tonu - dla całego fragmentu naraz, jako dwa iloczyny macierzy
+    bloków przez wektory cos/sin. Próg kluczowania leży w połowie między
+    śledzonymi poziomami szumu i tonu, a odcinki sygnału i ciszy są
+    klasyfikowane względem jednostki kodu, która podąża za tempem nadawcy.
+    Wynik trafia do MorseStreamDecoder, więc zużycie pamięci nie zależy od
+    długości nagrania.
+    """
+    
+    def __init__(self, sample_rate=SAMPLE_RATE, frequency=None, wpm=None,
+                 block_duration=BLOCK_DURATION):
+        """
+        Inicjalizuje odbiornik
+        
+        Args:
+            sample_rate (int): Częstotliwość próbkowania w Hz
+            frequency (float, optional): Częstotliwość tonu w Hz; domyślnie
+                wykrywana z pierwszej sekundy sygnału
+            wpm (float, optional): Początkowe tempo nadawcy; domyślnie
+                szacowane z pierwszych sygnałów
+            block_duration (float): Długość bloku detekcji w sekundach
+        
+        Raises:
+            ImportError: Jeśli numpy nie jest zainstalowane
+        """
+        if np is None:
+            raise ImportError("Odbiornik Morse'a wymaga biblioteki numpy")
+        
+        self.sample_rate = sample_rate
+        self.frequency = frequency
+        self.block = max(1, int(round(block_duration * sample_rate)))
+        self.block_duration = self.block / sample_rate
+        self.unit = 60 / (PARIS_UNITS * wpm) if wpm else None
+        self.signal_level = None
+        self.noise_level = None
+        
+        self._kernel = None
+        self._pending = np.zeros(0, dtype=np.int16)
+        self._key_down = False
+        self._run_blocks = 0
+        self._current = None      # Ostatni odcinek, który może jeszcze wchłonąć zakłócenie
+        self._runs = []           # Odcinki zebrane przed pierwszą estymacją tempa
+        self._started = False     # Czy odebrano już pierwszy sygnał
+        self._decoder = MorseStreamDecoder()
+    
+    @property
+    def wpm(self):
+        """Bieżące oszacowanie tempa nadawcy w słowach na minutę"""
+        if self.unit is None:
+            return None
+        return 60 / (PARIS_UNITS * self.unit)
+    
+    def feed(self, pcm):
+        """
+        Przekazuje kolejny fragment sygnału do odbiornika.
+        
+        Args:
+            pcm (numpy.ndarray): Próbki mono int16
+        
+        Returns:
+            str: Tekst odkodowany z liter zakończonych w tym fragmencie
+        """
+        return self._decoder.feed(self.demodulate(pcm))
+    
+    def flush(self):
+        """
+        Kończy sygnał i dekoduje ostatnią literę.
+        
+        Returns:
+            str: Pozostały odkodowany tekst
+        """
+        return self._decoder.feed(self.end()) + self._decoder.flush()
+    
+    def demodulate(self, pcm):
+        """
+        Zamienia fragment sygnału na fragment kodu Morse'a.
+        
+        Args:
+            pcm (numpy.ndarray): Próbki mono int16
+        
+        Returns:
+            str: Kod Morse'a odcinków zakończonych w tym fragmencie
+        """
+        data = np.concatenate((self._pending, np.asarray(pcm, dtype=np.int16)))
+        
+        if self._kernel is None:
+            if self.frequency is None:
+                if len(data) < DETECT_DURATION * self.sample_rate:
+                    self._pending = data
+                    return ''
+                self.frequency = detect_frequency(data, self.sample_rate)
+            self._kernel = self._goertzel_kernel()
+        
+        count = len(data) // self.block * self.block
+        self._pending = data[count:]
+        if not count:
+            return ''
+        
+        blocks = data[:count].reshape(-1, self.block).astype(np.float32)
+        cosine, sine = self._kernel
+        amplitude = np.hypot(blocks @ cosine, blocks @ sine)
+        
+        threshold = self._update_levels(amplitude)
+        if threshold is None:
+            key = np.zeros(len(amplitude), dtype=bool)
+        else:
+            key = amplitude > threshold
+        
+        morse_code = []
+        for is_mark, blocks_count in self._runs_of(key):
+            morse_code.append(self._push_run(is_mark, blocks_count * self.block_duration))
+        return ''.join(morse_code)
+    
+    def end(self):
+        """
+        Zamyka ostatni odcinek sygnału.
+        
+        Returns:
+            str: Pozostały kod Morse'a
+        """
+        morse_code = []
+        if self._kernel is None and len(self._pending) >= self.block:
+            # Sygnał krótszy niż czas wykrywania tonu
+            self.frequency = detect_frequency(self._pending, self.sample_rate)
+            self._kernel = self._goertzel_kernel()
+            morse_code.append(self.demodulate(np.zeros(0, dtype=np.int16)))
+        # Niepełny ostatni blok jest krótszy niż jakikolwiek element kodu
+        self._pending = np.zeros(0, dtype=np.int16)
+        
+        if self._run_blocks:
+            morse_code.append(self._push_run(self._key_down,
+                                             self._run_blocks * self.block_duration))
+            self._run_blocks = 0
+        
+        if self._current is not None:
+            self._runs.append(self._current)
+            self._current = None
+        if self._runs:
+            morse_code.append(self._classify_buffered())
+        return ''.join(morse_code)
+    
+    def _goertzel_kernel(self):
+        """Współczynniki filtru Goertzela dla bloku (pojedynczy prążek DFT)"""
+        phase = 2 * np.pi * self.frequency * np.arange(self.block) / self.sample_rate
+        scale = 2 / self.block
+        return ((np.cos(phase) * scale).astype(np.float32),
+                (np.sin(phase) * scale).astype(np.float32))
+    
+    def _update_levels(self, amplitude):
+        """
+        Aktualizuje poziomy tonu i szumu na podstawie amplitud fragmentu.
+        
+        Returns:
+            float: Próg kluczowania lub None, jeśli nie wykryto jeszcze tonu
+        """
+        signal, noise = np.percentile(amplitude, (SIGNAL_PERCENTILE, NOISE_PERCENTILE))
+        if self.noise_level is None:
+            self.noise_level = noise
+        else:
+            self.noise_level += LEVEL_SMOOTHING * (noise - self.noise_level)
+        
+        # Fragment bez tonu nie zmienia poziomu sygnału
+        if signal > SIGNAL_TO_NOISE * self.noise_level:
+            if self.signal_level is None:
+                self.signal_level = signal
+            else:
+                self.signal_level += LEVEL_SMOOTHING * (signal - self.signal_level)
+        
+        if self.signal_level is None:
+            return None
+        return (self.signal_level + self.noise_level) / 2
+    
+    def _runs_of(self, key):
+        """
+        Dzieli maskę kluczowania na odcinki, przenosząc ostatni do kolejnego fragmentu.
+        
+        Yields:
+            tuple: Zakończone odcinki (czy_sygnał, liczba_bloków)
+        """
+        changes = np.flatnonzero(key[1:] != key[:-1]) + 1
+        if key[0] != self._key_down:
+            changes = np.concatenate(([0], changes))
+        
+        start = 0
+        for change in changes.tolist():
+            length = self._run_blocks + change - start
+            if length:
+                yield self._key_down, length
+            self._key_down = not self._key_down
+            self._run_blocks = 0
+            start = change
+        self._run_blocks += len(key) - start
+    
+    def _push_run(self, is_mark, duration):
+        """
+        Przyjmuje zakończony odcinek, scalając zakłócenia z sąsiednimi odcinkami.
+        
+        Returns:
+            str: Kod Morse'a odcinka, który przestał być modyfikowalny
+        """
+        current = self._current
+        glitch = 1.5 * self.block_duration
+        if self.unit is not None:
+            glitch = max(glitch, GLITCH_UNITS * self.unit)
+        
+        if current is None:
+            self._current = (is_mark, duration)
+            return ''
+        if is_mark == current[0] or duration < glitch:
+            # Dalszy ciąg odcinka po zakłóceniu albo samo zakłócenie
+            self._current = (current[0], current[1] + duration)
+            return ''
+        
+        self._current = (is_mark, duration)
+        self._runs.append(current)
+        if self.unit is None:
+            if sum(mark for mark, _ in self._runs) < INITIAL_MARKS:
+                return ''
+        return self._classify_buffered()
+    
+    def _classify_buffered(self):
+        """Klasyfikuje odcinki zebrane w buforze, w razie potrzeby szacując tempo"""
+        runs, self._runs = self._runs, []
+        if self.unit is None:
+            marks = [duration for is_mark, duration in runs if is_mark]
+            if not marks:
+                return ''
+            spaces = [duration for is_mark, duration in runs[1:] if not is_mark]
+            self.unit = estimate_unit(marks, spaces)
+        return ''.join(self._classify(is_mark, duration) for is_mark, duration in runs)
+    
+    def _classify(self, is_mark, duration):
+        """
+        Zamienia odcinek na symbole kodu Morse'a i aktualizuje tempo.
+        
+        Args:
+            is_mark (bool): Czy odcinek jest sygnałem
+            duration (float): Czas odcinka w sekundach
+        
+        Returns:
+            str: Symbole kodu Morse'a
+        """
+        units = duration / self.unit
+        if is_mark:
+            self._started = True
+            if units < DASH_THRESHOLD:
+                self.unit += SPEED_SMOOTHING * (duration - self.unit)
+                return '.'
+            self.unit += SPEED_SMOOTHING * (duration / 3 - self.unit)
+            return '-'
+        
+        if not self._started:
+            return ''
+        if units < DASH_THRESHOLD:
+            self.unit += SPEED_SMOOTHING * (duration - self.unit)
+            return ''
+        if units < WORD_GAP_THRESHOLD:
+            return ' '
+        return ' / '
+
+def _iter_pcm(pcm, sample_rate):
+    """Dzieli bufor na fragmenty po STREAM_CHUNK sekund (widoki, bez kopiowania)"""
+    step = max(1, int(STREAM_CHUNK * sample_rate))
+    for start in range(0, len(pcm), step):
+        yield pcm[start:start + step]
+
+def pcm_to_morse(pcm, sample_rate=SAMPLE_RATE, frequency=None, wpm=None):
+    """
+    Odtwarza kod Morse'a z nagranego sygnału.
+    
+    Args:
+        pcm (numpy.ndarray): Próbki mono int16
+        sample_rate (int): Częstotliwość próbkowania w Hz
+        frequency (float, optional): Częstotliwość tonu w Hz
+        wpm (float, optional): Początkowe tempo nadawcy
+    
+    Returns:
+        str: Kod Morse'a w zapisie text_to_morse
+    """
+    receiver = MorseReceiver(sample_rate, frequency, wpm)
+    morse_code = [receiver.demodulate(chunk) for chunk in _iter_pcm(pcm, sample_rate)]
+    morse_code.append(receiver.end())
+    return ''.join(morse_code)
+
+def decode_pcm(pcm, sample_rate=SAMPLE_RATE, frequency=None, wpm=None):
+    """
+    Dekoduje tekst z nagranego sygnału.
+    
+    Args:
+        pcm (numpy.ndarray): Próbki mono int16
+        sample_rate (int): Częstotliwość próbkowania w Hz
+        frequency (float, optional): Częstotliwość tonu w Hz
+        wpm (float, optional): Początkowe tempo nadawcy
+    
+    Returns:
+        str: Odkodowany tekst
+    """
+    receiver = MorseReceiver(sample_rate, frequency, wpm)
+    text = [receiver.feed(chunk) for chunk in _iter_pcm(pcm, sample_rate)]
+    text.append(receiver.flush())
+    return ''.join(text)
+
+def decode_wav(path, frequency=None, wpm=None):
+    """
+    Dekoduje tekst z pliku WAV, czytając go fragmentami.
+    
+    Dla nagrań wielokanałowych używany jest pierwszy kanał.
+    
+    Args:
+        path (str): Ścieżka pliku WAV
+        frequency (float, optional): Częstotliwość tonu w Hz
+        wpm (float, optional): Początkowe tempo nadawcy
+    
+    Returns:
+        tuple: Odkodowany tekst, czas nagrania w sekundach i oszacowane tempo WPM
+    
+    Raises:
+        ValueError: Jeśli plik nie zawiera próbek 16-bitowych
+    """
+    with wave.open(path, 'rb') as wav:
+        if wav.getsampwidth() != 2:
+            raise ValueError("Obsługiwane są tylko pliki WAV 16-bitowe")
+        sample_rate = wav.getframerate()
+        channels = wav.getnchannels()
+        receiver = MorseReceiver(sample_rate, frequency, wpm)
+        
+        text = []
+        step = int(STREAM_CHUNK * sample_rate)
+        while True:
+            data = wav.readframes(step)
+            if not data:
+                break
+            pcm = np.frombuffer(data, dtype='<i2')
+            if channels > 1:
+                pcm = pcm[::channels]
+            text.append(receiver.feed(pcm))
+        text.append(receiver.flush())
+        duration = wav.getnframes() / sample_rate
+    return ''.join(text), duration, receiver.wpm
+
+def main(argv=None):
+    """
+    Dekoduje pliki WAV z wiersza poleceń.
+    
+    Args:
+        argv (list, optional): Argumenty wiersza poleceń
+    
+    Returns:
+        int: 0 po zdekodowaniu wszystkich plików, 1 w razie błędu
+    """
+    parser = argparse.ArgumentParser(
+        description="Dekodowanie nagrań transmisji Morse'a (WAV 16-bit)"
+    )
+    parser.add_argument("files", nargs="+", help="Pliki WAV do zdekodowania")
+    parser.add_argument("--frequency", type=float,
+                        help="Częstotliwość tonu w Hz (domyślnie wykrywana)")
+    parser.add_argument("--wpm", type=float,
+                        help="Początkowe tempo nadawcy (domyślnie szacowane)")
+    args = parser.parse_args(argv)
+    
+    if np is None:
+        print("Odbiornik Morse'a wymaga biblioteki numpy")
+        return 1
+    
+    status = 0
+    for path in args.files:
+        start = time.perf_counter()
+        try:
+            text, duration, wpm = decode_wav(path, args.frequency, args.wpm)
+        except (OSError, EOFError, ValueError, wave.Error) as e:
+            print(f"{path}: błąd: {e}")
+            status = 1
+            continue
+        elapsed = time.perf_counter() - start
+        speed = duration / elapsed if elapsed else float('inf')
+        wpm_text = f"{wpm:.1f} WPM" if wpm else "brak sygnału"
+        print(f"{path} ({duration:.1f} s, {wpm_text}, {speed:.0f}x czasu rzeczywistego):")
+        print(text)
+    return status
+
+if __name__ == "__main__":
+    sys.exit(main())
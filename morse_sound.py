@@ -3,57 +3,563 @@
 Moduł zawierający funkcje do odtwarzania kodu Morse'a jako dźwięku
 """
 
+import io
+import os
+import sys
 import time
+import wave
+import argparse
+import functools
+import shutil
 import platform
+import threading
+import tempfile
 import subprocess
+from collections import OrderedDict
 
-# Parametry dla odtwarzania dźwięku
-DOT_DURATION = 100  # ms
-DASH_DURATION = 300  # ms
-SYMBOL_PAUSE = 100   # ms
-LETTER_PAUSE = 300   # ms
-WORD_PAUSE = 700    # ms
+try:
+    import numpy as np
+except ImportError:
+    # Synteza PCM wymaga numpy - bez niego pozostaje odtwarzanie przez beep()
+    np = None
+
+import metrics
+from morse_timing import DEFAULT_TIMING
+from station_profiles import station_corpora
+
+# Parametry dla odtwarzania dźwięku (czasy symboli określa MorseTiming)
 FREQUENCY = 800      # Hz
 
-def play_morse_with_simple_beep(morse_code, status_callback=None):
+# Parametry syntezy PCM
+SAMPLE_RATE = 44100  # Hz
+AMPLITUDE = 0.5      # Względna głośność tonu (0-1)
+RAMP_DURATION = 5    # ms, czas narastania i opadania obwiedni kluczowania
+RENDER_CHUNK = 4096  # Liczba symboli renderowanych naraz przy zapisie do pliku
+PCM_CACHE_BYTES = 64 * 1024 * 1024  # Limit pamięci bufora wyrenderowanych transmisji
+
+def _samples(duration, sample_rate):
+    """Zamienia czas w sekundach na liczbę próbek"""
+    return int(round(duration * sample_rate))
+
+def _tone_template(duration, frequency, sample_rate):
     """
-    Odtwarza kod Morse'a jako dźwięk używając prostej metody dostępnej na każdym systemie.
-    Ta metoda nie wymaga instalacji numpy ani pygame.
+    Generuje ton o zadanym czasie trwania z obwiednią podniesionego kosinusa.
+    
+    Łagodne narastanie i opadanie obwiedni usuwa trzaski kluczowania,
+    które powstają przy skokowym włączaniu i wyłączaniu tonu.
     
     Args:
-        morse_code (str): Kod Morse'a do odtworzenia
-        status_callback (function, optional): Callback do aktualizacji statusu
+        duration (float): Czas trwania tonu w sekundach
+        frequency (int): Częstotliwość tonu w Hz
+        sample_rate (int): Częstotliwość próbkowania w Hz
+    
+    Returns:
+        numpy.ndarray: Próbki tonu jako float64 w zakresie -1..1
     """
-    system = platform.system()
+    length = _samples(duration, sample_rate)
+    t = np.arange(length) / sample_rate
+    tone = np.sin(2 * np.pi * frequency * t)
+    
+    ramp = min(_samples(RAMP_DURATION / 1000, sample_rate), length // 2)
+    if ramp:
+        envelope = 0.5 - 0.5 * np.cos(np.pi * np.arange(ramp) / ramp)
+        tone[:ramp] *= envelope
+        tone[length - ramp:] *= envelope[::-1]
+    return tone
+
+@functools.lru_cache(maxsize=8)
+def _element_templates(frequency, sample_rate, timing):
+    """
+    Przygotowuje gotowe bloki PCM dla każdego symbolu kodu Morse'a.
+    
+    Każdy blok zawiera sygnał symbolu i ciszę po nim, zgodnie z modelem
+    czasowym, więc cały sygnał powstaje przez samo sklejenie bloków. Bloki są
+    współdzielone między wywołaniami, dlatego są tylko do odczytu.
+    
+    Args:
+        frequency (int): Częstotliwość tonu w Hz
+        sample_rate (int): Częstotliwość próbkowania w Hz
+        timing (MorseTiming): Model czasowy transmisji
+    
+    Returns:
+        dict: Słownik symbol -> blok próbek int16
+    """
+    scale = AMPLITUDE * np.iinfo(np.int16).max
+    
+    templates = {}
+    for symbol, (on, off) in timing.symbol_durations.items():
+        tone = _tone_template(on, frequency, sample_rate) * scale
+        silence = np.zeros(_samples(off, sample_rate))
+        block = np.concatenate((tone, silence)).astype(np.int16)
+        block.flags.writeable = False
+        templates[symbol] = block
+    return templates
+
+def _iter_pcm_chunks(morse_code, frequency, sample_rate, timing, chunk_size=RENDER_CHUNK):
+    """
+    Renderuje kod Morse'a kawałkami po chunk_size symboli.
+    
+    Args:
+        morse_code (str): Kod Morse'a do wyrenderowania
+        frequency (int): Częstotliwość tonu w Hz
+        sample_rate (int): Częstotliwość próbkowania w Hz
+        timing (MorseTiming): Model czasowy transmisji
+        chunk_size (int): Liczba symboli w jednym kawałku
+        
+    Yields:
+        numpy.ndarray: Kolejne fragmenty próbek mono int16
+    """
+    if np is None:
+        raise ImportError("Synteza PCM wymaga biblioteki numpy")
+    
+    templates = _element_templates(frequency, sample_rate, timing)
+    for start in range(0, len(morse_code), chunk_size):
+        chunk = morse_code[start:start + chunk_size]
+        blocks = [templates[symbol] for symbol in chunk if symbol in templates]
+        if blocks:
+            yield np.concatenate(blocks)
+
+def render_morse_pcm(morse_code, frequency=FREQUENCY, sample_rate=SAMPLE_RATE,
+                     timing=DEFAULT_TIMING):
+    """
+    Renderuje cały kod Morse'a do jednego bufora PCM.
+    
+    Zachowuje te same czasy trwania co play_morse_with_simple_beep,
+    a znaki spoza kodu Morse'a są pomijane.
+    
+    Args:
+        morse_code (str): Kod Morse'a do wyrenderowania
+        frequency (int): Częstotliwość tonu w Hz
+        sample_rate (int): Częstotliwość próbkowania w Hz
+        timing (MorseTiming): Model czasowy transmisji
     
-    if status_callback:
-        status_callback(f"Odtwarzanie na systemie {system}...")
+    Returns:
+        numpy.ndarray: Próbki mono int16
     
-    for i, symbol in enumerate(morse_code):
-        if status_callback and i % 5 == 0:
-            progress = min(100, int((i / len(morse_code)) * 100))
-            status_callback(f"Odtwarzanie: {progress}%")
+    Raises:
+        ImportError: Jeśli numpy nie jest zainstalowane
+    """
+    if np is None:
+        raise ImportError("Synteza PCM wymaga biblioteki numpy")
+    
+    templates = _element_templates(frequency, sample_rate, timing)
+    blocks = [templates[symbol] for symbol in morse_code if symbol in templates]
+    if not blocks:
+        return np.zeros(0, dtype=np.int16)
+    return np.concatenate(blocks)
+
+def render_to_wav(morse_code, path, frequency=FREQUENCY, sample_rate=SAMPLE_RATE,
+                  timing=DEFAULT_TIMING):
+    """
+    Zapisuje kod Morse'a do pliku WAV bez odtwarzania w czasie rzeczywistym.
+    
+    Sygnał jest renderowany i zapisywany kawałkami, więc zużycie pamięci
+    nie rośnie wraz z długością kodu.
+    
+    Args:
+        morse_code (str): Kod Morse'a do zapisania
+        path (str): Ścieżka pliku wyjściowego
+        frequency (int): Częstotliwość tonu w Hz
+        sample_rate (int): Częstotliwość próbkowania w Hz
+        timing (MorseTiming): Model czasowy transmisji
+        
+    Returns:
+        str: Ścieżka zapisanego pliku
+    """
+    with wave.open(path, 'wb') as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        for chunk in _iter_pcm_chunks(morse_code, frequency, sample_rate, timing):
+            wav.writeframes(chunk.astype('<i2', copy=False).tobytes())
+    return path
+
+def _render_message_to_wav(job):
+    """Renderuje pojedynczą wiadomość tekstową - zadanie dla puli procesów"""
+    message, path = job
+    # Import lokalny, aby moduł nie zależał od morse_utils przy imporcie
+    from morse_utils import text_to_morse
+    return render_to_wav(text_to_morse(message), path)
+
+def render_corpus_to_wav(messages, directory, prefix="message", workers=1):
+    """
+    Zapisuje wiele wiadomości tekstowych do osobnych plików WAV.
+    
+    Args:
+        messages (iterable): Wiadomości tekstowe do zapisania
+        directory (str): Katalog docelowy (tworzony w razie potrzeby)
+        prefix (str): Przedrostek nazw plików
+        workers (int): Liczba procesów renderujących (1 - bez puli procesów)
+        
+    Returns:
+        list: Ścieżki zapisanych plików w kolejności wiadomości
+    """
+    os.makedirs(directory, exist_ok=True)
+    jobs = [
+        (message, os.path.join(directory, f"{prefix}_{index:04d}.wav"))
+        for index, message in enumerate(messages)
+    ]
+    
+    if workers <= 1:
+        return [_render_message_to_wav(job) for job in jobs]
+    
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_render_message_to_wav, jobs, chunksize=16))
+
+class PCMCache:
+    """
+    Bufor LRU wyrenderowanych transmisji ograniczony łącznym rozmiarem danych.
+    
+    Kluczem jest kod Morse'a wraz z parametrami syntezy, dzięki czemu
+    powtarzane wiadomości (np. SOS) są odtwarzane bez ponownej syntezy.
+    Najdawniej używane wpisy są usuwane, gdy suma rozmiarów przekroczy limit.
+    """
+    
+    def __init__(self, max_bytes=PCM_CACHE_BYTES):
+        """
+        Inicjalizuje bufor
+        
+        Args:
+            max_bytes (int): Maksymalny łączny rozmiar przechowywanych buforów
+        """
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def make_key(morse_code, frequency=FREQUENCY, sample_rate=SAMPLE_RATE,
+                 timing=DEFAULT_TIMING):
+        """Tworzy klucz obejmujący kod Morse'a i wszystkie parametry syntezy"""
+        return (morse_code, frequency, sample_rate, timing, RAMP_DURATION, AMPLITUDE)
+    
+    def get(self, key):
+        """
+        Zwraca bufor dla klucza i oznacza go jako ostatnio używany.
+        
+        Args:
+            key (tuple): Klucz utworzony przez make_key
             
-        if symbol == '.':
-            # Odtwórz kropkę (krótki dźwięk)
-            beep(FREQUENCY, DOT_DURATION, system)
-            time.sleep(SYMBOL_PAUSE / 1000)
+        Returns:
+            numpy.ndarray: Bufor PCM lub None, jeśli go nie ma
+        """
+        with self._lock:
+            pcm = self._entries.get(key)
+            if pcm is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return pcm
+    
+    def put(self, key, pcm):
+        """
+        Zapisuje bufor, usuwając najdawniej używane wpisy ponad limit.
+        
+        Bufory większe niż cały limit nie są zapamiętywane.
+        
+        Args:
+            key (tuple): Klucz utworzony przez make_key
+            pcm (numpy.ndarray): Bufor PCM (zostaje oznaczony jako tylko do odczytu)
+        """
+        if pcm.nbytes > self.max_bytes:
+            return
+        pcm.flags.writeable = False
+        
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.current_bytes -= previous.nbytes
+            self._entries[key] = pcm
+            self.current_bytes += pcm.nbytes
             
-        elif symbol == '-':
-            # Odtwórz kreskę (długi dźwięk)
-            beep(FREQUENCY, DASH_DURATION, system)
-            time.sleep(SYMBOL_PAUSE / 1000)
+            while self.current_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.current_bytes -= evicted.nbytes
+    
+    def render(self, morse_code, frequency=FREQUENCY, sample_rate=SAMPLE_RATE,
+               timing=DEFAULT_TIMING):
+        """
+        Zwraca bufor PCM z pamięci podręcznej lub renderuje go i zapamiętuje.
+        
+        Args:
+            morse_code (str): Kod Morse'a do wyrenderowania
+            frequency (int): Częstotliwość tonu w Hz
+            sample_rate (int): Częstotliwość próbkowania w Hz
+            timing (MorseTiming): Model czasowy transmisji
             
-        elif symbol == ' ':
-            # Przerwa między literami
-            time.sleep(LETTER_PAUSE / 1000)
+        Returns:
+            numpy.ndarray: Próbki mono int16 (tylko do odczytu)
+        """
+        key = self.make_key(morse_code, frequency, sample_rate, timing)
+        pcm = self.get(key)
+        if pcm is None:
+            pcm = render_morse_pcm(morse_code, frequency, sample_rate, timing)
+            self.put(key, pcm)
+        return pcm
+    
+    def clear(self):
+        """Usuwa wszystkie wpisy i zeruje liczniki"""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+            self.hits = 0
+            self.misses = 0
+    
+    def stats(self):
+        """
+        Zwraca statystyki bufora.
+        
+        Returns:
+            dict: Liczba wpisów, zajęte bajty, trafienia i chybienia
+        """
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+# Wspólny bufor wyrenderowanych transmisji używany przez play_morse
+PCM_CACHE = PCMCache()
+
+def pcm_to_wav_bytes(pcm, sample_rate=SAMPLE_RATE):
+    """
+    Opakowuje bufor PCM w nagłówek WAV.
+    
+    Args:
+        pcm (numpy.ndarray): Próbki mono int16
+        sample_rate (int): Częstotliwość próbkowania w Hz
+    
+    Returns:
+        bytes: Kompletny plik WAV w pamięci
+    """
+    output = io.BytesIO()
+    with wave.open(output, 'wb') as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(pcm.astype('<i2', copy=False).tobytes())
+    return output.getvalue()
+
+class MorseScheduler:
+    """
+    Harmonogram odtwarzania symboli kodu Morse'a bez kumulacji błędów czasu.
+    
+    Dla każdego symbolu wyznaczany jest bezwzględny termin liczony od jednego
+    wspólnego momentu startu (zegar monotoniczny), więc opóźnienia pojedynczych
+    wywołań nie przesuwają kolejnych symboli. Postęp trafia do kolejki
+    bezpiecznej wątkowo, a odtwarzanie można przerwać zdarzeniem cancel_event.
+    """
+    
+    def __init__(self, morse_code, on_element=None, progress_queue=None, cancel_event=None,
+                 timing=DEFAULT_TIMING):
+        """
+        Inicjalizuje harmonogram
+        
+        Args:
+            morse_code (str): Kod Morse'a do odtworzenia
+            on_element (function, optional): Wywoływana z (symbol, czas_ms)
+                na początku każdej kropki i kreski
+            progress_queue (queue.Queue, optional): Kolejka komunikatów o postępie
+            cancel_event (threading.Event, optional): Zdarzenie przerywające odtwarzanie
+            timing (MorseTiming): Model czasowy transmisji
+        """
+        self.morse_code = morse_code
+        self.timing = timing
+        self.on_element = on_element
+        self.progress_queue = progress_queue
+        self.cancel_event = cancel_event or threading.Event()
+        self.deadlines, self.total_duration = self.schedule(morse_code, timing)
+    
+    @staticmethod
+    def schedule(morse_code, timing=DEFAULT_TIMING):
+        """
+        Wyznacza moment rozpoczęcia każdego symbolu względem startu.
+        
+        Args:
+            morse_code (str): Kod Morse'a
+            timing (MorseTiming): Model czasowy transmisji
+            
+        Returns:
+            tuple: Lista przesunięć w sekundach (po jednym na znak kodu)
+                oraz całkowity czas odtwarzania w sekundach
+        """
+        symbol_duration = timing.symbol_duration
+        deadlines = []
+        elapsed = 0.0
+        for symbol in morse_code:
+            deadlines.append(elapsed)
+            elapsed += symbol_duration(symbol)
+        return deadlines, elapsed
+    
+    def cancel(self):
+        """Przerywa odtwarzanie (można wywołać z dowolnego wątku)"""
+        self.cancel_event.set()
+    
+    @property
+    def cancelled(self):
+        """Czy odtwarzanie zostało przerwane"""
+        return self.cancel_event.is_set()
+    
+    def report(self, message):
+        """Przekazuje komunikat o postępie do kolejki"""
+        if self.progress_queue is not None:
+            self.progress_queue.put(message)
+    
+    def _wait_until(self, deadline):
+        """
+        Czeka do bezwzględnego terminu lub do przerwania.
+        
+        Returns:
+            bool: False, jeśli odtwarzanie zostało przerwane
+        """
+        remaining = deadline - time.monotonic()
+        if remaining > 0:
+            return not self.cancel_event.wait(remaining)
+        return not self.cancel_event.is_set()
+    
+    def run(self):
+        """
+        Odtwarza harmonogram w bieżącym wątku.
+        
+        Returns:
+            bool: True, jeśli odtwarzanie dobiegło końca bez przerwania
+        """
+        durations = {'.': round(self.timing.dot * 1000), '-': round(self.timing.dash * 1000)}
+        total = len(self.morse_code)
+        start = time.monotonic()
+        
+        for i, symbol in enumerate(self.morse_code):
+            if not self._wait_until(start + self.deadlines[i]):
+                self.report("Odtwarzanie przerwane.")
+                return False
+            
+            if i % 5 == 0:
+                progress = min(100, int((i / total) * 100))
+                self.report(f"Odtwarzanie: {progress}%")
+            
+            if self.on_element and symbol in durations:
+                self.on_element(symbol, durations[symbol])
+        
+        if not self._wait_until(start + self.total_duration):
+            self.report("Odtwarzanie przerwane.")
+            return False
+        return True
+
+def play_morse(morse_code, progress_queue=None, cancel_event=None, timing=DEFAULT_TIMING):
+    """
+    Odtwarza kod Morse'a jako prawdziwy dźwięk z bufora PCM.
+    
+    Cały sygnał jest renderowany jednorazowo i odtwarzany jednym wywołaniem,
+    a MorseScheduler jedynie raportuje postęp w rytmie transmisji.
+    Bez numpy lub bez odtwarzacza dźwięku używana jest metoda
+    play_morse_with_simple_beep.
+    
+    Args:
+        morse_code (str): Kod Morse'a do odtworzenia
+        progress_queue (queue.Queue, optional): Kolejka komunikatów o postępie
+        cancel_event (threading.Event, optional): Zdarzenie przerywające odtwarzanie
+        timing (MorseTiming): Model czasowy transmisji
+    """
+    system = platform.system()
+    player = _pcm_player(system)
+    
+    if np is None or player is None:
+        play_morse_with_simple_beep(morse_code, progress_queue, cancel_event, timing)
+        return
+    
+    scheduler = MorseScheduler(morse_code, progress_queue=progress_queue,
+                               cancel_event=cancel_event, timing=timing)
+    scheduler.report(f"Odtwarzanie na systemie {system}...")
+    
+    try:
+        with metrics.timer("audio_render"):
+            pcm = PCM_CACHE.render(morse_code, timing=timing)
+            wav_data = pcm_to_wav_bytes(pcm)
+        stop = player(wav_data)
+    except Exception as e:
+        scheduler.report(f"Błąd odtwarzania: {str(e)}")
+        return
+    
+    with metrics.timer("audio_playback"):
+        finished = scheduler.run()
+    if finished:
+        scheduler.report("Odtwarzanie zakończone.")
+    stop()
+
+def _pcm_player(system):
+    """
+    Wybiera funkcję odtwarzającą w tle plik WAV z pamięci dla danego systemu.
+    
+    Args:
+        system (str): Nazwa systemu operacyjnego
+    
+    Returns:
+        function: Funkcja przyjmująca bajty pliku WAV i zwracająca funkcję
+            zatrzymującą odtwarzanie, lub None
+    """
+    if system == "Windows":
+        try:
+            import winsound
+        except ImportError:
+            return None
+        
+        def play_windows(data):
+            # SND_ASYNC nie działa z SND_MEMORY, dlatego używamy pliku tymczasowego
+            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as wav_file:
+                wav_file.write(data)
+            winsound.PlaySound(wav_file.name, winsound.SND_FILENAME | winsound.SND_ASYNC)
             
-        elif symbol == '/':
-            # Przerwa między słowami
-            time.sleep(WORD_PAUSE / 1000)
+            def stop():
+                winsound.PlaySound(None, 0)
+                os.remove(wav_file.name)
+            return stop
+        return play_windows
     
-    if status_callback:
-        status_callback("Odtwarzanie zakończone.")
+    # Linux - odtwarzacze wiersza poleceń ALSA i PulseAudio czytające z stdin
+    for command in (["aplay", "-q", "-"], ["paplay"]):
+        if shutil.which(command[0]):
+            def play_command(data, command=command):
+                process = subprocess.Popen(command, stdin=subprocess.PIPE,
+                                           stderr=subprocess.DEVNULL)
+                # Odtwarzacz czyta dane w tempie odtwarzania, więc zapis w tle
+                threading.Thread(target=process.communicate, args=(data,), daemon=True).start()
+                return process.kill
+            return play_command
+    return None
+
+def play_morse_with_simple_beep(morse_code, progress_queue=None, cancel_event=None,
+                                timing=DEFAULT_TIMING):
+    """
+    Odtwarza kod Morse'a jako dźwięk używając prostej metody dostępnej na każdym systemie.
+    Ta metoda nie wymaga instalacji numpy ani pygame.
+    
+    Args:
+        morse_code (str): Kod Morse'a do odtworzenia
+        progress_queue (queue.Queue, optional): Kolejka komunikatów o postępie
+        cancel_event (threading.Event, optional): Zdarzenie przerywające odtwarzanie
+        timing (MorseTiming): Model czasowy transmisji
+    """
+    system = platform.system()
+    
+    # Odtwórz kropkę lub kreskę - pauzy wynikają z terminów harmonogramu
+    scheduler = MorseScheduler(
+        morse_code,
+        on_element=lambda symbol, duration: beep(FREQUENCY, duration, system),
+        progress_queue=progress_queue,
+        cancel_event=cancel_event,
+        timing=timing
+    )
+    scheduler.report(f"Odtwarzanie na systemie {system}...")
+    
+    if scheduler.run():
+        scheduler.report("Odtwarzanie zakończone.")
 
 def beep(frequency, duration, system):
     """
@@ -80,11 +586,44 @@ def beep(frequency, duration, system):
             time.sleep(duration / 1000)
     except Exception as e:
         # W razie błędu, po prostu symulujemy dźwięk poprzez pauzę
-        print(f"[BEEP: {'.' if duration == DOT_DURATION else '-'}]", end="", flush=True)
+        print(f"[BEEP: {duration} ms]", end="", flush=True)
         time.sleep(duration / 1000)
 
+def main(argv=None):
+    """
+    Tryb wsadowy: zapis wiadomości do plików WAV bez odtwarzania.
+    
+    Args:
+        argv (list, optional): Argumenty wiersza poleceń
+    """
+    parser = argparse.ArgumentParser(
+        description="Zapis transmisji Morse'a do plików WAV"
+    )
+    parser.add_argument("output_dir", help="Katalog na pliki WAV")
+    parser.add_argument("--corpus", action="append", default=[],
+                        help="Plik tekstowy z wiadomościami (jedna na linię)")
+    parser.add_argument("--no-stations", action="store_true",
+                        help="Pomiń historyczne wiadomości Titanica i Carpathii")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="Liczba procesów renderujących")
+    args = parser.parse_args(argv)
+    
+    corpora = [] if args.no_stations else station_corpora()
+    for corpus_path in args.corpus:
+        with open(corpus_path, encoding='utf-8') as corpus_file:
+            messages = [line.strip() for line in corpus_file if line.strip()]
+        name = os.path.splitext(os.path.basename(corpus_path))[0]
+        corpora.append((name, messages))
+    
+    for name, messages in corpora:
+        paths = render_corpus_to_wav(messages, args.output_dir, name, args.workers)
+        print(f"{name}: zapisano {len(paths)} plików WAV")
+
 # Proste testowanie modułu
 if __name__ == "__main__":
-    test_morse = "... --- ..."  # SOS
-    print(f"Odtwarzam kod Morse'a: {test_morse}")
-    play_morse_with_simple_beep(test_morse)
\ No newline at end of file
+    if len(sys.argv) > 1:
+        main()
+    else:
+        test_morse = "... --- ..."  # SOS
+        print(f"Odtwarzam kod Morse'a: {test_morse}")
+        play_morse_with_simple_beep(test_morse)
\ No newline at end of file
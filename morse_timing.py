@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Moduł zawierający model czasowy kodu Morse'a oparty o prędkość WPM
+"""
+
+# Prędkość domyślna - kropka trwa 100 ms, tak jak w pierwotnych stałych
+DEFAULT_WPM = 12
+
+# Liczba jednostek w słowie wzorcowym "PARIS " - stąd 1.2 s / WPM na jednostkę
+PARIS_UNITS = 50
+
+class MorseTiming:
+    """
+    Czasy trwania elementów kodu Morse'a wyliczone z prędkości WPM.
+    
+    Wszystkie czasy są wyliczane raz, przy tworzeniu obiektu, i wspólne dla
+    syntezy dźwięku, animacji wskaźnika i tempa nadawania. Odstępy Farnswortha
+    wydłużają jedynie przerwy między literami i słowami, pozostawiając znaki
+    nadawane z pełną prędkością.
+    
+    Czasy symboli odpowiadają zapisowi tekstowemu z text_to_morse: po kropce
+    i kresce zawsze następuje przerwa między elementami, spacja dopełnia ją do
+    przerwy między literami, a sekwencja " / " trwa łącznie tyle, ile przerwa
+    między słowami.
+    """
+    
+    def __init__(self, wpm=DEFAULT_WPM, farnsworth_wpm=None):
+        """
+        Inicjalizuje model czasowy
+        
+        Args:
+            wpm (float): Prędkość nadawania znaków w słowach na minutę
+            farnsworth_wpm (float, optional): Efektywna prędkość z odstępami
+                Farnswortha (mniejsza niż wpm)
+        
+        Raises:
+            ValueError: Jeśli prędkości nie są dodatnie lub farnsworth_wpm > wpm
+        """
+        if wpm <= 0 or (farnsworth_wpm is not None and farnsworth_wpm <= 0):
+            raise ValueError("Prędkość WPM musi być dodatnia")
+        if farnsworth_wpm is not None and farnsworth_wpm > wpm:
+            raise ValueError("Prędkość Farnswortha nie może przekraczać prędkości znaków")
+        
+        self.wpm = wpm
+        self.farnsworth_wpm = farnsworth_wpm
+        
+        # Czasy w sekundach
+        self.unit = 60 / (PARIS_UNITS * wpm)
+        self.dot = self.unit
+        self.dash = 3 * self.unit
+        self.element_gap = self.unit
+        
+        if farnsworth_wpm is None or farnsworth_wpm == wpm:
+            self.letter_gap = 3 * self.unit
+            self.word_gap = 7 * self.unit
+        else:
+            # Wzór ARRL: łączny czas przerw w słowie wzorcowym rozłożony 3:7
+            spacing = (60 * wpm - 37.2 * farnsworth_wpm) / (farnsworth_wpm * wpm)
+            self.letter_gap = 3 * spacing / 19
+            self.word_gap = 7 * spacing / 19
+        
+        # Symbol -> (czas sygnału, czas ciszy) w sekundach
+        self.symbol_durations = {
+            '.': (self.dot, self.element_gap),
+            '-': (self.dash, self.element_gap),
+            ' ': (0.0, self.letter_gap - self.element_gap),
+            '/': (0.0, self.word_gap - 2 * self.letter_gap + self.element_gap),
+        }
+        self._symbol_totals = {
+            symbol: on + off for symbol, (on, off) in self.symbol_durations.items()
+        }
+    
+    def __repr__(self):
+        return f"MorseTiming(wpm={self.wpm!r}, farnsworth_wpm={self.farnsworth_wpm!r})"
+    
+    def __eq__(self, other):
+        if not isinstance(other, MorseTiming):
+            return NotImplemented
+        return (self.wpm, self.farnsworth_wpm) == (other.wpm, other.farnsworth_wpm)
+    
+    def __hash__(self):
+        return hash((self.wpm, self.farnsworth_wpm))
+    
+    def symbol_duration(self, symbol):
+        """
+        Zwraca łączny czas symbolu (sygnał i cisza po nim).
+        
+        Args:
+            symbol (str): Pojedynczy znak kodu Morse'a
+        
+        Returns:
+            float: Czas w sekundach (0 dla znaków spoza kodu)
+        """
+        return self._symbol_totals.get(symbol, 0.0)
+    
+    def duration(self, morse_code):
+        """
+        Zwraca czas nadawania całego kodu Morse'a.
+        
+        Args:
+            morse_code (str): Kod Morse'a
+        
+        Returns:
+            float: Czas w sekundach
+        """
+        totals = self._symbol_totals
+        return sum(totals[symbol] * morse_code.count(symbol) for symbol in totals)
+    
+    def timeline(self, morse_code):
+        """
+        Zamienia kod Morse'a na listę odcinków włączenia i wyłączenia sygnału.
+        
+        Sąsiednie odcinki ciszy są scalane, więc odcinki na przemian
+        włączają i wyłączają sygnał.
+        
+        Args:
+            morse_code (str): Kod Morse'a
+        
+        Returns:
+            list: Pary (czy_sygnał, czas_w_sekundach)
+        """
+        timeline = []
+        for symbol in morse_code:
+            if symbol not in self.symbol_durations:
+                continue
+            on, off = self.symbol_durations[symbol]
+            if on:
+                timeline.append((True, on))
+            if off:
+                if timeline and not timeline[-1][0]:
+                    timeline[-1] = (False, timeline[-1][1] + off)
+                else:
+                    timeline.append((False, off))
+        return timeline
+
+# Wspólny model czasowy używany domyślnie przez dźwięk, wskaźnik i sieć
+DEFAULT_TIMING = MorseTiming()
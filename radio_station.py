@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+Moduł zawierający silnik stacji radiowej niezależny od interfejsu graficznego
+"""
+
+import time
+import random
+import itertools
+import threading
+
+from morse_utils import text_to_morse
+from station_protocol import (
+    encode_frame, PACKET_FORMAT_BINARY, PACKET_FORMAT_TEXT, BROADCAST_CALL_SIGN
+)
+from station_link import PeerLink, HubLink
+import metrics
+from traffic_journal import JournalWriter, JournalError, session_path, SENT, RECEIVED
+
+# Parametry automatycznej odpowiedzi
+AUTO_RESPONSE_DELAY = 2.0   # s, opóźnienie odpowiedzi na wezwanie pomocy
+DISTRESS_SIGNAL = "SOS"
+
+def _timer_schedule(delay, callback):
+    """Domyślny harmonogram: wywołuje callback po delay sekundach w wątku Timer"""
+    timer = threading.Timer(delay, callback)
+    timer.daemon = True
+    timer.start()
+
+def radio_channel(snr_db, seed=None, **options):
+    """
+    Tworzy model kanału radiowego dla stacji.
+    
+    Args:
+        snr_db (float): Stosunek sygnału do szumu w dB
+        seed (int, optional): Ziarno generatora losowego kanału
+        **options: Pozostałe parametry ChannelModel
+    
+    Returns:
+        ChannelModel: Model kanału lub None (kanał bez zakłóceń), gdy brak numpy
+    """
+    # Import lokalny - model kanału ładuje numpy, zbędne stacjom bez zakłóceń
+    from channel_model import ChannelModel
+    try:
+        return ChannelModel(snr_db, seed=seed, **options)
+    except ImportError:
+        return None
+
+def station_journal(name):
+    """
+    Otwiera dziennik ruchu nowej sesji stacji.
+    
+    Args:
+        name (str): Nazwa stacji w nazwie pliku
+    
+    Returns:
+        JournalWriter: Dziennik lub None, jeśli nie udało się go otworzyć
+    """
+    try:
+        return JournalWriter(session_path(name))
+    except (OSError, JournalError) as e:
+        print(f"Nie można otworzyć dziennika ruchu: {e}")
+        return None
+
+class RadioStation:
+    """
+    Stacja radiowa bez zależności od Tkinter.
+    
+    Łączy w sobie odbiór (StationServer albo połączenie z węzłem
+    przekaźnikowym), nadawanie przez trwałe połączenie, kodowanie Morse'a,
+    symulację zakłóceń, dziennik ruchu i automatyczne odpowiedzi na wezwania
+    pomocy.
+    Interfejs użytkownika obserwuje stację przez zdarzenia - atrybuty, które
+    można ustawić na dowolną funkcję:
+    
+        on_status(text)          - zmiana stanu stacji
+        on_receive(frame)        - odebrana ramka (Frame)
+        on_sent(count)           - ramki wysłane do sieci (liczba)
+        on_auto_response(text)   - stacja chce nadać automatyczną odpowiedź;
+                                   bez obsługi odpowiedź jest nadawana od razu
+    
+    Zdarzenia są wywoływane w wątkach sieciowych. Stacja i jej kanał mają
+    własne generatory losowe. Podany seed ustawia oba (ziarno kanału jest
+    wyprowadzane z ziarna stacji), więc przebieg można powtórzyć.
+    """
+    
+    def __init__(self, call_sign, port=None, peer=None, hub=None, host='localhost',
+                 peer_call_sign=BROADCAST_CALL_SIGN, peer_name=None, responses=(),
+                 auto_response_probability=0.0, channel=None,
+                 packet_format=PACKET_FORMAT_BINARY, seed=None, scheduler=_timer_schedule,
+                 journal=None):
+        """
+        Inicjalizuje stację (sieć rusza po wywołaniu start)
+        
+        Args:
+            call_sign (str): Znak wywoławczy stacji
+            port (int, optional): Port nasłuchiwania przy łączności bezpośredniej
+            peer (tuple, optional): Adres (host, port) stacji docelowej
+            hub (tuple, optional): Adres (host, port) węzła przekaźnikowego;
+                zastępuje port i peer
+            host (str): Adres nasłuchiwania
+            peer_call_sign (str): Domyślny adresat nadawanych ramek
+            peer_name (str, optional): Nazwa stacji docelowej w komunikatach
+                (w narzędniku, np. "Titanicem")
+            responses (sequence): Wiadomości do automatycznych odpowiedzi
+            auto_response_probability (float): Szansa odpowiedzi na SOS
+            channel (ChannelModel, optional): Kanał radiowy zniekształcający
+                nadawane wiadomości; None - kanał bez zakłóceń
+            packet_format (str): Preferowany format danych ramki (binarny tylko,
+                gdy druga strona go obsługuje)
+            seed (int, optional): Ziarno generatora losowego stacji i jej kanału
+            scheduler (function): Funkcja (opóźnienie_s, callback) planująca
+                automatyczną odpowiedź
+            journal (JournalWriter, optional): Dziennik nadanych i odebranych
+                ramek (zamykany w stop)
+        """
+        self.call_sign = call_sign
+        self.port = port
+        self.peer = peer
+        self.hub = hub
+        self.host = host
+        self.peer_call_sign = peer_call_sign
+        self.peer_name = peer_name or peer_call_sign
+        self.responses = list(responses)
+        self.auto_response_probability = auto_response_probability
+        self.channel = channel
+        self.packet_format = packet_format
+        self.random = random.Random(seed)
+        if seed is not None and channel is not None:
+            channel.reseed(self.random.getrandbits(64))
+        self.schedule = scheduler
+        self.journal = journal
+        
+        self.sequence = itertools.count(1)
+        self.server = None
+        self.link = None
+        
+        # Zdarzenia
+        self.on_status = None
+        self.on_receive = None
+        self.on_sent = None
+        self.on_auto_response = None
+    
+    def start(self):
+        """
+        Uruchamia odbiór i przygotowuje połączenie nadawcze.
+        
+        Returns:
+            bool: False, jeśli nie udało się otworzyć portu nasłuchiwania
+        """
+        if self.hub is not None:
+            self.link = HubLink(
+                self.hub[0],
+                self.hub[1],
+                self.call_sign,
+                self.handle_frame,
+                on_sent=self._on_link_sent,
+                on_error=self._on_link_error
+            )
+            self.link.start()
+            self.set_status("Nasłuchiwanie wiadomości...")
+            return True
+        
+        if self.peer is not None:
+            self.link = PeerLink(
+                self.peer[0],
+                self.peer[1],
+                on_sent=self._on_link_sent,
+                on_error=self._on_link_error
+            )
+        
+        if self.port is None:
+            return True
+        
+        # Import lokalny - serwer ładuje asyncio, zbędne stacjom tylko nadającym
+        from station_server import StationServer
+        self.server = StationServer(
+            self.host,
+            self.port,
+            self.handle_frame,
+            on_partial=lambda text: self.set_status(f"Odbieranie: {text}")
+        )
+        try:
+            self.port = self.server.start()
+        except OSError as e:
+            print(f"Błąd serwera: {e}")
+            return False
+        self.set_status("Nasłuchiwanie wiadomości...")
+        return True
+    
+    def stop(self):
+        """Zamyka połączenie nadawcze i zatrzymuje odbiór"""
+        if self.link is not None:
+            self.link.close()
+        if self.server is not None:
+            self.server.stop()
+        if self.journal is not None:
+            self.journal.close()
+    
+    def set_status(self, text):
+        """Zgłasza zmianę stanu stacji"""
+        if self.on_status:
+            self.on_status(text)
+    
+    def transmit(self, message, recipient=None):
+        """
+        Koduje wiadomość i umieszcza ją w kolejce nadawczej.
+        
+        Args:
+            message (str): Treść wiadomości
+            recipient (str, optional): Adresat, domyślnie peer_call_sign
+        
+        Returns:
+            str: Kod Morse'a wiadomości (bez zakłóceń)
+        """
+        with metrics.profiled():
+            with metrics.timer("encode"):
+                morse_code = text_to_morse(message)
+            if self.link is None:
+                return morse_code
+            
+            noisy_code = self.apply_noise(morse_code)
+            with metrics.timer("frame_encode"):
+                frame = encode_frame(
+                    message,
+                    noisy_code,
+                    self.call_sign,
+                    next(self.sequence),
+                    self.packet_format if self.link.supports_binary else PACKET_FORMAT_TEXT,
+                    recipient=recipient or self.peer_call_sign
+                )
+            if not self.link.send(frame):
+                metrics.count("messages_dropped")
+                self.set_status("Kolejka nadawcza jest pełna - wiadomość odrzucona")
+                return morse_code
+            
+            metrics.count("messages_sent")
+            if self.journal is not None:
+                self.journal.record(SENT, frame)
+            return morse_code
+    
+    def apply_noise(self, morse_code):
+        """
+        Symuluje szumy i zakłócenia radiowe, przepuszczając kod przez kanał.
+        
+        Args:
+            morse_code (str): Kod Morse'a
+        
+        Returns:
+            str: Kod Morse'a po przejściu przez kanał
+        """
+        if self.channel is None:
+            return morse_code
+        with metrics.timer("channel"):
+            noisy_code = self.channel.apply(morse_code)
+        if noisy_code != morse_code:
+            metrics.count("noise_events")
+        return noisy_code
+    
+    def handle_frame(self, frame):
+        """
+        Obsługuje odebraną ramkę (wątek sieciowy).
+        
+        Args:
+            frame (Frame): Odebrana ramka
+        """
+        metrics.count("messages_received")
+        metrics.observe("delivery", time.time() - frame.timestamp)
+        try:
+            if self.journal is not None:
+                self.journal.record_frame(RECEIVED, frame)
+            
+            self.set_status("Odbieranie wiadomości...")
+            if self.on_receive:
+                with metrics.timer("on_receive"):
+                    self.on_receive(frame)
+            
+            # Automatyczna odpowiedź na wezwanie pomocy
+            if (self.responses and DISTRESS_SIGNAL in frame.message.upper()
+                    and self.random.random() < self.auto_response_probability):
+                self.schedule(AUTO_RESPONSE_DELAY, self.auto_respond)
+            
+            self.set_status("Wiadomość odebrana")
+        except Exception as e:
+            self.set_status(f"Błąd odbierania: {str(e)}")
+    
+    def auto_respond(self):
+        """Wybiera losową odpowiedź i przekazuje ją do nadania"""
+        response = self.random.choice(self.responses)
+        if self.on_auto_response:
+            self.on_auto_response(response)
+        else:
+            self.transmit(response)
+    
+    def _on_link_sent(self, count):
+        """Obsługuje potwierdzenie wysłania ramek (wątek połączenia)"""
+        self.set_status("Wiadomość nadana pomyślnie")
+        if self.on_sent:
+            self.on_sent(count)
+    
+    def _on_link_error(self, error):
+        """Obsługuje błąd połączenia (wątek połączenia)"""
+        if isinstance(error, ConnectionRefusedError):
+            self.set_status(f"Nie można nawiązać połączenia z {self.peer_name}")
+        else:
+            self.set_status(f"Błąd: {str(error)}")
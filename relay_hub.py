@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+Węzeł przekaźnikowy sieci radiowej Północnego Atlantyku z 1912 roku
+"""
+
+import sys
+import time
+import asyncio
+import argparse
+import threading
+
+from station_protocol import (
+    FrameError, decode_frame_header, decode_frame_payload, encode_frame, encode_register_frame,
+    FRAME_HEADER_SIZE, FRAME_BINARY, FRAME_REGISTER, BROADCAST_CALL_SIGN,
+    CAPABILITIES, CAPABILITY_BINARY, PACKET_FORMAT_TEXT
+)
+
+# Konfiguracja węzła
+HUB_HOST = 'localhost'
+HUB_PORT = 5680
+LISTEN_BACKLOG = 1024                    # Setki stacji łączących się jednocześnie
+MAX_SUBSCRIBER_BUFFER = 4 * 1024 * 1024  # Bajty zaległe u jednej stacji, powyżej - odrzucanie
+START_TIMEOUT = 5                        # s, czas oczekiwania na uruchomienie węzła
+
+# Znaki wywoławcze stacji sieci z nocy 14/15 kwietnia 1912
+NORTH_ATLANTIC_NET = {
+    'MGY': 'Titanic',
+    'MPA': 'Carpathia',
+    'MKC': 'Olympic',
+    'MWL': 'Californian',
+    'MBC': 'Baltic',
+    'MGN': 'Virginian',
+    'MLQ': 'Mount Temple',
+    'DFT': 'Frankfurt',
+    'SBA': 'Birma',
+    'MCE': 'Cape Race',
+}
+
+class RelayHub:
+    """
+    Węzeł, w którym stacje zgłaszają się znakiem wywoławczym.
+    
+    Ramka adresowana do konkretnej stacji trafia tylko do niej, a ramka
+    z adresatem CQ - do wszystkich pozostałych zgłoszonych stacji. Węzeł nie
+    dekoduje danych ramek (poza przekodowaniem opisanym niżej): sklejony raz nagłówek i dane są zapisywane tym
+    samym obiektem bytes do każdego odbiorcy. Stacja, która nie nadąża
+    z odbiorem, traci ramki zamiast spowalniać pozostałe.
+    
+    Zgłoszenie stacji niesie obsługiwane przez nią formaty, a węzeł odpowiada
+    własnymi. Stacja, która nie zgłosiła formatu binarnego, dostaje ramki
+    binarne przekodowane (raz na ramkę) do formatu tekstowego.
+    """
+    
+    def __init__(self, host=HUB_HOST, port=HUB_PORT, max_buffer=MAX_SUBSCRIBER_BUFFER):
+        """
+        Inicjalizuje węzeł
+        
+        Args:
+            host (str): Adres nasłuchiwania
+            port (int): Port nasłuchiwania (0 - dowolny wolny port)
+            max_buffer (int): Maksymalna liczba bajtów zaległych u jednej stacji
+        """
+        self.host = host
+        self.port = port
+        self.max_buffer = max_buffer
+        
+        # Znak wywoławczy -> StreamWriter zgłoszonej stacji (tylko wątek węzła)
+        self.stations = {}
+        # Połączenia stacji, które nie obsługują ramek binarnych
+        self.text_only = set()
+        
+        # Liczniki ruchu
+        self.frames = 0
+        self.broadcasts = 0
+        self.deliveries = 0
+        self.dropped = 0
+        self.undeliverable = 0
+        
+        self.loop = None
+        self._thread = None
+        self._server = None
+        self._started = threading.Event()
+        self._start_error = None
+    
+    def start(self):
+        """
+        Uruchamia pętlę zdarzeń węzła w osobnym wątku.
+        
+        Returns:
+            int: Port, na którym węzeł faktycznie nasłuchuje
+        
+        Raises:
+            OSError: Jeśli nie można otworzyć portu
+        """
+        self._thread = threading.Thread(target=self._run, name="relay-hub", daemon=True)
+        self._thread.start()
+        self._started.wait(START_TIMEOUT)
+        if self._start_error is not None:
+            raise self._start_error
+        return self.port
+    
+    def stop(self):
+        """Zatrzymuje węzeł i jego pętlę zdarzeń"""
+        if self.loop is not None and self.loop.is_running():
+            self.loop.call_soon_threadsafe(self.loop.stop)
+        if self._thread is not None:
+            self._thread.join(START_TIMEOUT)
+    
+    def stats(self):
+        """
+        Zwraca liczniki ruchu węzła.
+        
+        Returns:
+            dict: Liczba stacji, ramek, rozgłoszeń, doręczeń i ramek odrzuconych
+        """
+        return {
+            'stations': len(self.stations),
+            'frames': self.frames,
+            'broadcasts': self.broadcasts,
+            'deliveries': self.deliveries,
+            'dropped': self.dropped,
+            'undeliverable': self.undeliverable,
+        }
+    
+    def _run(self):
+        """Główna funkcja wątku węzła"""
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        try:
+            self._server = self.loop.run_until_complete(asyncio.start_server(
+                self._handle_connection, self.host, self.port, backlog=LISTEN_BACKLOG
+            ))
+        except OSError as e:
+            self._start_error = e
+            self._started.set()
+            return
+        
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._started.set()
+        try:
+            self.loop.run_forever()
+        finally:
+            self._server.close()
+            tasks = asyncio.all_tasks(self.loop)
+            for task in tasks:
+                task.cancel()
+            self.loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            self.loop.run_until_complete(self._server.wait_closed())
+            self.loop.close()
+    
+    async def _handle_connection(self, reader, writer):
+        """Odczytuje ramki jednej stacji i przekazuje je adresatom"""
+        call_sign = None
+        try:
+            while True:
+                try:
+                    header_bytes = await reader.readexactly(FRAME_HEADER_SIZE)
+                except asyncio.IncompleteReadError as e:
+                    if e.partial:
+                        raise
+                    break
+                
+                header = decode_frame_header(header_bytes)
+                payload = await reader.readexactly(header.length) if header.length else b''
+                
+                if header.kind == FRAME_REGISTER:
+                    call_sign = header.sender
+                    self._register(call_sign, writer, header.sequence)
+                else:
+                    self._route(header, header_bytes + payload, writer)
+        except FrameError as e:
+            print(f"Błąd ramki od {call_sign or 'niezgłoszonej stacji'}: {e}")
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except asyncio.CancelledError:
+            # Zatrzymanie węzła przy otwartych połączeniach
+            pass
+        finally:
+            if call_sign is not None and self.stations.get(call_sign) is writer:
+                del self.stations[call_sign]
+            self.text_only.discard(writer)
+            writer.close()
+    
+    def _register(self, call_sign, writer, capabilities):
+        """
+        Zgłasza stację, zastępując poprzednie połączenie z tym samym znakiem.
+        
+        Args:
+            call_sign (str): Znak wywoławczy stacji
+            writer (asyncio.StreamWriter): Połączenie stacji
+            capabilities (int): Znaczniki CAPABILITY_* z ramki zgłoszenia
+        """
+        previous = self.stations.get(call_sign)
+        if previous is not None and previous is not writer:
+            previous.close()
+        self.stations[call_sign] = writer
+        if capabilities & CAPABILITY_BINARY:
+            self.text_only.discard(writer)
+        else:
+            self.text_only.add(writer)
+        writer.write(encode_register_frame('', CAPABILITIES, call_sign))
+    
+    def _route(self, header, frame, source):
+        """
+        Zapisuje ramkę do adresata lub do wszystkich stacji (CQ).
+        
+        Args:
+            header (FrameHeader): Nagłówek ramki
+            frame (bytes): Cała ramka, zapisywana bez zmian
+            source (asyncio.StreamWriter): Połączenie nadawcy
+        """
+        self.frames += 1
+        if header.recipient == BROADCAST_CALL_SIGN:
+            self.broadcasts += 1
+            targets = [writer for writer in self.stations.values() if writer is not source]
+        else:
+            target = self.stations.get(header.recipient)
+            if target is None:
+                self.undeliverable += 1
+                return
+            targets = (target,)
+        
+        max_buffer = self.max_buffer
+        text_frame = None
+        for writer in targets:
+            transport = writer.transport
+            if transport.is_closing() or transport.get_write_buffer_size() > max_buffer:
+                self.dropped += 1
+                continue
+            if header.kind == FRAME_BINARY and writer in self.text_only:
+                if text_frame is None:
+                    text_frame = self._to_text(header, frame)
+                writer.write(text_frame)
+            else:
+                writer.write(frame)
+            self.deliveries += 1
+    
+    def _to_text(self, header, frame):
+        """
+        Przekodowuje ramkę binarną do formatu tekstowego.
+        
+        Args:
+            header (FrameHeader): Nagłówek ramki
+            frame (bytes): Cała ramka binarna
+        
+        Returns:
+            bytes: Ramka tekstowa z tym samym nadawcą, adresatem, numerem i czasem
+        """
+        decoded = decode_frame_payload(header, frame[FRAME_HEADER_SIZE:])
+        return encode_frame(decoded.message, decoded.morse_code, decoded.sender, decoded.sequence,
+                            PACKET_FORMAT_TEXT, decoded.timestamp, decoded.recipient)
+
+def main(argv=None):
+    """
+    Uruchamia węzeł przekaźnikowy do przerwania klawiszami Ctrl+C.
+    
+    Args:
+        argv (list, optional): Argumenty wiersza poleceń
+    """
+    parser = argparse.ArgumentParser(
+        description="Węzeł przekaźnikowy sieci stacji radiowych"
+    )
+    parser.add_argument("--host", default=HUB_HOST, help="Adres nasłuchiwania")
+    parser.add_argument("--port", type=int, default=HUB_PORT, help="Port nasłuchiwania")
+    parser.add_argument("--stats-interval", type=float, default=10,
+                        help="Co ile sekund wypisywać liczniki ruchu (0 - wcale)")
+    args = parser.parse_args(argv)
+    
+    hub = RelayHub(args.host, args.port)
+    try:
+        port = hub.start()
+    except OSError as e:
+        print(f"Błąd węzła: {e}")
+        return 1
+    print(f"Węzeł przekaźnikowy nasłuchuje na porcie {port}")
+    
+    try:
+        while True:
+            time.sleep(args.stats_interval or 3600)
+            if args.stats_interval:
+                print(hub.stats())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        hub.stop()
+        print(hub.stats())
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,447 @@
+#!/usr/bin/env python3
+"""
+Moduł zawierający wspólny widok Tkinter dla stacji radiowych
+"""
+
+import tkinter as tk
+from tkinter import ttk, scrolledtext, messagebox
+import threading
+import functools
+import argparse
+import signal
+import os
+import time
+import random
+from datetime import datetime
+
+import metrics
+from morse_timing import DEFAULT_TIMING
+from indicator_animation import IndicatorAnimator
+from station_log import CommunicationLog
+from ui_bus import UIBus, STATUS, DELIVER_LATEST, DELIVER_BATCH
+from station_profiles import parse_address
+
+# Interfejs użytkownika
+HISTORY_DIR = "station_logs"  # Katalog z pełną historią logów komunikacji
+
+# Zdarzenia szyny interfejsu
+LOG_EVENT = 'log'
+RECEIVE_EVENT = 'receive'
+
+def _play_morse(*args):
+    """
+    Odtwarza kod Morse'a w wątku dźwięku.
+    
+    Moduł dźwięku (z numpy) jest ładowany przy pierwszym odtworzeniu i poza
+    wątkiem Tk, więc nie opóźnia otwarcia okna.
+    """
+    from morse_sound import play_morse
+    play_morse(*args)
+
+class StationView:
+    """
+    Okno stacji radiowej - cienka warstwa Tk nad silnikiem RadioStation.
+    
+    Sieć, kodowanie, zakłócenia i automatyczne odpowiedzi należą do silnika,
+    a widok jedynie wyświetla jego zdarzenia, odtwarza dźwięk i miga
+    wskaźnikiem. Zdarzenia silnika i wątku dźwięku docierają do widgetów
+    wyłącznie przez szynę UIBus. Klasy pochodne ustawiają wygląd atrybutami
+    klasy i tworzą silnik w create_station(), korzystając z adresów
+    self.port, self.peer i self.hub.
+    """
+    
+    # Wygląd okna
+    WINDOW_TITLE = "Radio"
+    HEADER_TEXT = "Stacja Radiowa"
+    POSITION_TEXT = "14 kwietnia 1912"
+    MESSAGES_LABEL = "Wybierz wiadomość:"
+    MESSAGES = ()
+    QUICK_BUTTON_TEXT = "Nadaj szybką wiadomość"
+    QUICK_MESSAGE = ""
+    BACKGROUND = "#e8dbc5"
+    TITLE_COLOR = "#000000"
+    BUTTON_COLOR = "#2F4F4F"
+    INDICATOR_COLOR = "green"
+    HISTORY_NAME = "station"  # Przedrostek pliku historii logu
+    
+    # Domyślne adresy stacji
+    PORT = None   # Port nasłuchiwania
+    PEER = None   # Adres (host, port) stacji docelowej
+    
+    def __init__(self, root, port=None, peer=None, hub=None):
+        """
+        Inicjalizuje aplikację stacji radiowej
+        
+        Args:
+            root (tk.Tk lub tk.Frame): Główne okno lub ramka aplikacji
+            port (int, optional): Port nasłuchiwania, domyślnie PORT
+            peer (tuple, optional): Adres (host, port) stacji docelowej,
+                domyślnie PEER
+            hub (tuple, optional): Adres (host, port) węzła przekaźnikowego;
+                zastępuje port i peer
+        """
+        self.root = root
+        self.port = self.PORT if port is None else port
+        self.peer = self.PEER if peer is None else peer
+        self.hub = hub
+        
+        # Sprawdzamy czy root jest głównym oknem czy ramką
+        if isinstance(root, tk.Tk):
+            self.is_main_window = True
+            self.root.title(self.WINDOW_TITLE)
+            self.root.geometry("800x600")
+            self.root.minsize(600, 500)
+            self.root.protocol("WM_DELETE_WINDOW", self.close)
+        else:
+            self.is_main_window = False
+        
+        # Ustawienie stylu historycznego
+        self.set_historical_style()
+        
+        # Szyna zdarzeń z wątków sieciowych i dźwiękowych do wątku Tk
+        self.bus = UIBus(self.root)
+        self.playback_cancel = threading.Event()
+        
+        # Wspólny model czasowy dla dźwięku i wskaźnika
+        self.timing = DEFAULT_TIMING
+        
+        # Pomiary etapów transmisji włączane zmiennymi środowiskowymi
+        metrics.configure_from_env()
+        
+        # Tworzenie interfejsu
+        self.create_widgets()
+        self.bus.subscribe(STATUS, self.status_var.set, DELIVER_LATEST)
+        self.bus.subscribe(LOG_EVENT, self.log.extend, DELIVER_BATCH)
+        self.bus.subscribe(RECEIVE_EVENT, self.receive_messages, DELIVER_BATCH)
+        self.bus.start()
+        
+        # Silnik stacji i jego zdarzenia (wywoływane w wątkach sieciowych)
+        self.station = self.create_station()
+        self.station.on_status = self.bus.status
+        self.station.on_receive = functools.partial(self.bus.post, RECEIVE_EVENT)
+        self.station.on_auto_response = functools.partial(self.bus.call, self.auto_respond)
+        
+        # Uruchomienie odbioru
+        self.station.start()
+    
+    def create_station(self):
+        """
+        Tworzy silnik stacji (do nadpisania w klasach pochodnych).
+        
+        Returns:
+            RadioStation: Silnik stacji
+        """
+        raise NotImplementedError
+    
+    def close(self):
+        """Zatrzymuje stację, zapisuje log i zamyka okno"""
+        self.playback_cancel.set()
+        self.bus.stop()
+        self.station.stop()
+        self.log.close()
+        if self.is_main_window:
+            self.root.destroy()
+    
+    def schedule(self, delay, callback):
+        """Planuje wywołanie w wątku Tk (harmonogram dla silnika stacji)"""
+        self.bus.call(self.root.after, int(delay * 1000), callback)
+    
+    def set_historical_style(self):
+        """Ustawia historyczny styl GUI"""
+        style = ttk.Style()
+        style.configure("TFrame", background=self.BACKGROUND)
+        style.configure("Historical.TLabel",
+                      font=("Times New Roman", 12),
+                      background=self.BACKGROUND,
+                      foreground="#000000")
+        style.configure("Title.TLabel",
+                      font=("Times New Roman", 16, "bold"),
+                      background=self.BACKGROUND,
+                      foreground=self.TITLE_COLOR)
+        style.configure("Historical.TButton",
+                      font=("Times New Roman", 11),
+                      background=self.BUTTON_COLOR)
+        
+        if self.is_main_window:
+            self.root.configure(background=self.BACKGROUND)  # Ustawienie koloru tła
+    
+    def create_widgets(self):
+        """Tworzy wszystkie widgety dla interfejsu użytkownika"""
+        # Nagłówek
+        header_frame = ttk.Frame(self.root, padding="10", style="TFrame")
+        header_frame.pack(fill=tk.X)
+        
+        ttk.Label(
+            header_frame,
+            text=self.HEADER_TEXT,
+            style="Title.TLabel"
+        ).pack()
+        
+        # Data i położenie
+        info_frame = ttk.Frame(self.root, padding="5", style="TFrame")
+        info_frame.pack(fill=tk.X)
+        
+        ttk.Label(
+            info_frame,
+            text=self.POSITION_TEXT,
+            style="Historical.TLabel"
+        ).pack()
+        
+        # Ramka główna podzielona na nadawanie i odbieranie
+        main_frame = ttk.Frame(self.root, padding="10", style="TFrame")
+        main_frame.pack(fill=tk.BOTH, expand=True)
+        
+        # Lewa kolumna - nadawanie
+        transmit_frame = ttk.LabelFrame(main_frame, text="Nadawanie", padding="10", style="TFrame")
+        transmit_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        
+        # Predefiniowane wiadomości
+        ttk.Label(
+            transmit_frame,
+            text=self.MESSAGES_LABEL,
+            style="Historical.TLabel"
+        ).pack(anchor=tk.W)
+        
+        self.message_var = tk.StringVar()
+        message_combo = ttk.Combobox(
+            transmit_frame,
+            textvariable=self.message_var,
+            values=list(self.MESSAGES),
+            width=50
+        )
+        message_combo.pack(fill=tk.X, pady=(0, 10))
+        message_combo.bind("<<ComboboxSelected>>", self.update_custom_message)
+        
+        # Niestandardowa wiadomość
+        ttk.Label(
+            transmit_frame,
+            text="Lub wpisz własną wiadomość:",
+            style="Historical.TLabel"
+        ).pack(anchor=tk.W)
+        
+        self.custom_message = scrolledtext.ScrolledText(
+            transmit_frame,
+            height=5,
+            wrap=tk.WORD
+        )
+        self.custom_message.pack(fill=tk.X, pady=(0, 10))
+        
+        # Przyciski nadawania
+        buttons_frame = ttk.Frame(transmit_frame, style="TFrame")
+        buttons_frame.pack(fill=tk.X)
+        
+        ttk.Button(
+            buttons_frame,
+            text="Nadaj wiadomość",
+            command=self.transmit_message,
+            style="Historical.TButton"
+        ).pack(side=tk.LEFT, padx=(0, 5))
+        
+        ttk.Button(
+            buttons_frame,
+            text=self.QUICK_BUTTON_TEXT,
+            command=self.transmit_quick_message,
+            style="Historical.TButton"
+        ).pack(side=tk.LEFT)
+        
+        # Prawa kolumna - odbieranie
+        receive_frame = ttk.LabelFrame(main_frame, text="Odbieranie", padding="10", style="TFrame")
+        receive_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True)
+        
+        # Wskaźnik odbierania
+        self.signal_indicator = tk.Canvas(
+            receive_frame,
+            width=20,
+            height=20,
+            bg="black",
+            highlightthickness=1,
+            highlightbackground="gray"
+        )
+        self.signal_indicator.pack(anchor=tk.W, pady=(0, 5))
+        self.indicator_animator = IndicatorAnimator(
+            self.root,
+            self.signal_indicator,
+            on_color=self.INDICATOR_COLOR,
+            timing=self.timing
+        )
+        
+        # Log komunikacji
+        ttk.Label(
+            receive_frame,
+            text="Log komunikacji:",
+            style="Historical.TLabel"
+        ).pack(anchor=tk.W)
+        
+        self.communication_log = scrolledtext.ScrolledText(
+            receive_frame,
+            height=15,
+            wrap=tk.WORD,
+            bg="#f5f5dc",  # Kolor starego papieru
+            fg="#000000"
+        )
+        self.communication_log.pack(fill=tk.BOTH, expand=True)
+        self.communication_log.config(state=tk.DISABLED)
+        self.log = CommunicationLog(
+            self.root,
+            self.communication_log,
+            history_path=os.path.join(
+                HISTORY_DIR,
+                f"{self.HISTORY_NAME}-{datetime.now():%Y%m%d}.log"
+            )
+        )
+        
+        # Status bar
+        self.status_var = tk.StringVar(value="Stacja gotowa do pracy")
+        status_bar = ttk.Label(
+            self.root,
+            textvariable=self.status_var,
+            relief=tk.SUNKEN,
+            anchor=tk.W,
+            style="Historical.TLabel"
+        )
+        status_bar.pack(side=tk.BOTTOM, fill=tk.X)
+    
+    def update_custom_message(self, event):
+        """Aktualizuje pole wiadomości własnej po wybraniu opcji z listy"""
+        self.custom_message.delete("1.0", tk.END)
+        self.custom_message.insert(tk.END, self.message_var.get())
+    
+    def log_message(self, message, is_transmitted=False):
+        """Dodaje wiadomość do logu komunikacji (z dowolnego wątku)"""
+        timestamp = datetime.now().strftime("%H:%M:%S")
+        prefix = "NADANO: " if is_transmitted else "ODEBRANO: "
+        self.bus.post(LOG_EVENT, f"[{timestamp}] {prefix}{message}")
+    
+    def transmit_message(self):
+        """Nadaje wiadomość wpisaną w polu wiadomości"""
+        message = self.custom_message.get("1.0", tk.END).strip()
+        
+        if not message:
+            messagebox.showinfo("Informacja", "Wpisz wiadomość do nadania")
+            return
+        
+        self._connect(message)
+    
+    def _connect(self, message):
+        """
+        Rozpoczyna nawiązywanie łączności, po którym wiadomość zostanie nadana.
+        
+        Args:
+            message (str): Treść wiadomości
+        """
+        # Symulacja opóźnień z 1912 roku - dalsza część nadawania jest
+        # planowana w pętli zdarzeń, więc interfejs nie zamiera
+        self.status_var.set("Nawiązywanie połączenia radiowego...")
+        delay = 1 + random.random()  # Opóźnienie nawiązywania łączności
+        self.root.after(int(delay * 1000), self._send_message, message, time.perf_counter())
+    
+    def _send_message(self, message, connect_start):
+        """
+        Nadaje wiadomość po nawiązaniu łączności (wątek Tk).
+        
+        Args:
+            message (str): Treść wiadomości
+            connect_start (float): Chwila rozpoczęcia nawiązywania łączności
+                (time.perf_counter)
+        """
+        metrics.observe("gui_connect_delay", time.perf_counter() - connect_start)
+        try:
+            self.status_var.set("Nadawanie wiadomości...")
+            
+            # Nadanie wiadomości przez silnik stacji
+            morse_code = self.station.transmit(message)
+            
+            # Odtworzenie dźwięku i miganie wskaźnika podczas nadawania
+            self.start_playback(morse_code)
+            self.blink_indicator(morse_code)
+            
+            # Rejestracja w logu
+            self.log_message(message, is_transmitted=True)
+        
+        except Exception as e:
+            messagebox.showerror("Błąd", f"Wystąpił błąd podczas nadawania: {str(e)}")
+            self.status_var.set("Błąd nadawania")
+    
+    def transmit_quick_message(self):
+        """Szybkie nadanie standardowej wiadomości stacji"""
+        self.custom_message.delete("1.0", tk.END)
+        self.custom_message.insert(tk.END, self.QUICK_MESSAGE)
+        self.transmit_message()
+    
+    def auto_respond(self, response):
+        """
+        Nadaje automatyczną odpowiedź wybraną przez silnik stacji (wątek Tk).
+        
+        Wywoływana z opróżniania UIBus, więc jedynie planuje nadanie i od razu
+        wraca. Odpowiedź jest nadawana bezpośrednio, a nie z pola wiadomości,
+        którego treść mógł w tym czasie zmienić operator.
+        
+        Args:
+            response (str): Treść odpowiedzi
+        """
+        self.custom_message.delete("1.0", tk.END)
+        self.custom_message.insert(tk.END, response)
+        self._connect(response)
+    
+    def receive_messages(self, frames):
+        """
+        Wyświetla i odtwarza wiadomości odebrane w jednej klatce (wątek Tk).
+        
+        Wszystkie wiadomości trafiają do logu, ale dźwięk i miganie wskaźnika
+        dotyczą tylko ostatniej z nich. Jest to zamierzone: każde odtworzenie
+        przerywa poprzednie, więc wcześniejsze ramki z tej samej klatki
+        i tak nie zostałyby usłyszane.
+        
+        Args:
+            frames (list): Ramki (Frame) odebrane od poprzedniej klatki
+        """
+        with metrics.timer("gui_receive"):
+            # Dodanie wiadomości do logu
+            for frame in frames:
+                self.log_message(frame.message)
+            
+            morse_code = frames[-1].morse_code
+            
+            # Symulacja odbioru - migająca lampka
+            self.blink_indicator(morse_code)
+            
+            # Odtwarzanie dźwięku odebranej wiadomości
+            self.start_playback(morse_code)
+    
+    def start_playback(self, morse_code):
+        """Uruchamia odtwarzanie dźwięku w tle, przerywając poprzednie"""
+        self.playback_cancel.set()
+        self.playback_cancel = threading.Event()
+        threading.Thread(
+            target=_play_morse,
+            args=(morse_code, self.bus, self.playback_cancel, self.timing),
+            daemon=True
+        ).start()
+    
+    def blink_indicator(self, morse_code):
+        """Powoduje miganie wskaźnika zgodnie z kodem Morse'a (bez blokowania GUI)"""
+        self.indicator_animator.play(morse_code)
+
+def run_station(view_class, argv=None):
+    """
+    Uruchamia okno stacji jako osobny program.
+    
+    SIGTERM zamyka stację tak samo jak zamknięcie okna, więc proces
+    uruchomiony przez station_launcher kończy pracę z zapisanym logiem
+    i dziennikiem ruchu.
+    
+    Args:
+        view_class (type): Klasa pochodna StationView
+        argv (list, optional): Argumenty wiersza poleceń
+    """
+    parser = argparse.ArgumentParser(description=view_class.WINDOW_TITLE)
+    parser.add_argument("--port", type=int, help="Port nasłuchiwania (0 - dowolny wolny port)")
+    parser.add_argument("--peer", type=parse_address, help="Adres stacji docelowej host:port")
+    parser.add_argument("--hub", type=parse_address,
+                        help="Łączność przez węzeł przekaźnikowy host:port")
+    args = parser.parse_args(argv)
+    
+    root = tk.Tk()
+    app = view_class(root, port=args.port, peer=args.peer, hub=args.hub)
+    signal.signal(signal.SIGTERM, lambda signum, frame: root.after(0, app.close))
+    root.mainloop()
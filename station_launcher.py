@@ -0,0 +1,462 @@
+#!/usr/bin/env python3
+"""
+Moduł uruchamiający stacje radiowe w osobnych procesach i nadzorujący ich pracę
+"""
+
+import os
+import sys
+import time
+import signal
+import socket
+import argparse
+import threading
+import subprocess
+from collections import namedtuple, deque
+
+from station_profiles import PROFILES
+
+# Parametry nadzoru
+STARTUP_TIMEOUT = 20        # s, czas oczekiwania na gotowość wszystkich stacji
+HEALTH_INTERVAL = 1.0       # s, odstęp między kontrolami stacji
+STARTUP_POLL_INTERVAL = 0.1  # s, odstęp między kontrolami w czasie uruchamiania
+HEALTH_TIMEOUT = 1.0        # s, czas na połączenie z portem stacji
+HEALTH_FAILURES = 3         # Kolejne nieudane kontrole, po których stacja jest restartowana
+RESTART_DELAY = 0.5         # s, pierwsze opóźnienie restartu
+RESTART_DELAY_MAX = 10      # s, maksymalne opóźnienie restartu
+MAX_RESTARTS = 5            # Limit restartów w oknie RESTART_WINDOW - potem stacja jest porzucana
+RESTART_WINDOW = 60         # s
+SHUTDOWN_TIMEOUT = 5        # s, czas na zamknięcie stacji przed jej zabiciem
+STATION_HOST = 'localhost'
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+LOG_DIR = "launcher_logs"   # Katalog z wyjściem procesów stacji
+
+# Moduły okien stacji według nazwy profilu
+GUI_MODULES = {
+    'titanic': 'titanic_staion',
+    'carpathia': 'carphatia_station',
+}
+
+# Stany nadzorowanej stacji
+STARTING = 'starting'
+RUNNING = 'running'
+RESTARTING = 'restarting'
+FINISHED = 'finished'       # Proces zakończył się poprawnie (np. zamknięto okno)
+FAILED = 'failed'           # Przekroczono limit restartów
+STOPPED = 'stopped'
+
+# Opis stacji: nazwa, profil, znak wywoławczy, port, adres i znak stacji
+# docelowej, tryb okienkowy i czy prowadzić dziennik ruchu
+StationSpec = namedtuple(
+    'StationSpec',
+    'name profile call_sign port peer peer_call_sign gui journal'
+)
+
+def free_ports(count, host=STATION_HOST):
+    """
+    Wybiera wolne porty TCP, rezerwując je jednocześnie, więc się nie powtarzają.
+    
+    Port jest zwalniany przed uruchomieniem stacji - inny program może go
+    w tym czasie zająć, wtedy stacja kończy się błędem i jest restartowana.
+    
+    Args:
+        count (int): Liczba portów
+        host (str): Adres, na którym porty mają być wolne
+    
+    Returns:
+        list: Numery portów
+    """
+    sockets = []
+    try:
+        for _ in range(count):
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock.bind((host, 0))
+            sockets.append(sock)
+        return [sock.getsockname()[1] for sock in sockets]
+    finally:
+        for sock in sockets:
+            sock.close()
+
+def station_command(spec):
+    """
+    Tworzy polecenie uruchamiające stację.
+    
+    Args:
+        spec (StationSpec): Opis stacji
+    
+    Returns:
+        list: Argumenty procesu
+    
+    Raises:
+        ValueError: Jeśli dla profilu nie istnieje okno stacji
+    """
+    peer = f"{spec.peer[0]}:{spec.peer[1]}"
+    if spec.gui:
+        if spec.profile not in GUI_MODULES:
+            raise ValueError(f"Brak okna dla profilu {spec.profile!r}")
+        return [sys.executable, '-m', GUI_MODULES[spec.profile],
+                '--port', str(spec.port), '--peer', peer]
+    
+    command = [sys.executable, '-m', 'morse_cli', 'listen',
+               '--port', str(spec.port), '--call-sign', spec.call_sign,
+               '--peer', peer, '--peer-call-sign', spec.peer_call_sign]
+    if spec.profile is not None:
+        command += ['--profile', spec.profile]
+    if spec.journal:
+        command += ['--journal', spec.name]
+    return command
+
+def pair_specs(gui=True, fixed_ports=False, journal=False):
+    """
+    Opisuje parę stacji Titanic - Carpathia.
+    
+    Args:
+        gui (bool): Czy uruchomić stacje w oknach
+        fixed_ports (bool): Czy użyć historycznych portów z profili zamiast wolnych
+        journal (bool): Czy stacje bezgłowe mają prowadzić dziennik ruchu
+            (okna prowadzą go zawsze)
+    
+    Returns:
+        list: Opisy obu stacji
+    """
+    titanic, carpathia = PROFILES['titanic'], PROFILES['carpathia']
+    if fixed_ports:
+        titanic_port, carpathia_port = titanic.port, carpathia.port
+    else:
+        titanic_port, carpathia_port = free_ports(2)
+    return [
+        StationSpec('carpathia', 'carpathia', carpathia.call_sign, carpathia_port,
+                    (STATION_HOST, titanic_port), titanic.call_sign, gui, journal),
+        StationSpec('titanic', 'titanic', titanic.call_sign, titanic_port,
+                    (STATION_HOST, carpathia_port), carpathia.call_sign, gui, journal),
+    ]
+
+def fleet_specs(count, gui=False, journal=False):
+    """
+    Opisuje flotę stacji połączonych w pierścień.
+    
+    Stacje na przemian korzystają z profili Titanica i Carpathii, a każda
+    nadaje do następnej, więc stacje Carpathii odpowiadają na wezwania
+    pomocy sąsiadów.
+    
+    Args:
+        count (int): Liczba stacji
+        gui (bool): Czy uruchomić stacje w oknach
+        journal (bool): Czy stacje bezgłowe mają prowadzić dziennik ruchu
+    
+    Returns:
+        list: Opisy stacji
+    """
+    profiles = [PROFILES['titanic'], PROFILES['carpathia']]
+    ports = free_ports(count)
+    call_signs = [f"{profiles[index % 2].call_sign}{index + 1}" for index in range(count)]
+    specs = []
+    for index in range(count):
+        profile = profiles[index % 2]
+        peer = (index + 1) % count
+        specs.append(StationSpec(
+            f"{profile.name}-{index + 1:02d}", profile.name, call_signs[index], ports[index],
+            (STATION_HOST, ports[peer]), call_signs[peer], gui, journal
+        ))
+    return specs
+
+def port_open(port, host=STATION_HOST, timeout=HEALTH_TIMEOUT):
+    """
+    Sprawdza, czy stacja przyjmuje połączenia.
+    
+    Args:
+        port (int): Port stacji
+        host (str): Adres stacji
+        timeout (float): Czas na nawiązanie połączenia w sekundach
+    
+    Returns:
+        bool: True, jeśli połączenie się udało
+    """
+    try:
+        with socket.create_connection((host, port), timeout):
+            return True
+    except OSError:
+        return False
+
+class ManagedStation:
+    """Jedna nadzorowana stacja - proces, jego stan i historia restartów"""
+    
+    def __init__(self, spec, log_dir=LOG_DIR):
+        """
+        Inicjalizuje stację (proces rusza po wywołaniu start)
+        
+        Args:
+            spec (StationSpec): Opis stacji
+            log_dir (str): Katalog na wyjście procesu
+        """
+        self.spec = spec
+        self.command = station_command(spec)
+        self.log_path = os.path.join(log_dir, f"{spec.name}.out")
+        self.process = None
+        self.state = STOPPED
+        self.health_failures = 0
+        self.started_at = None
+        self.restart_at = None
+        self.restart_times = deque()
+    
+    @property
+    def pid(self):
+        """Identyfikator procesu lub None"""
+        return self.process.pid if self.process is not None else None
+    
+    def start(self):
+        """Uruchamia proces stacji, dopisując jego wyjście do pliku"""
+        directory = os.path.dirname(self.log_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.log_path, 'ab') as log_file:
+            self.process = subprocess.Popen(
+                self.command,
+                cwd=PACKAGE_DIR,
+                stdin=subprocess.DEVNULL,
+                stdout=log_file,
+                stderr=subprocess.STDOUT
+            )
+        self.state = STARTING
+        self.health_failures = 0
+        self.started_at = time.monotonic()
+        self.restart_at = None
+    
+    def alive(self):
+        """Czy proces stacji działa"""
+        return self.process is not None and self.process.poll() is None
+    
+    def terminate(self):
+        """Prosi proces o zamknięcie (SIGTERM) bez czekania"""
+        if self.alive():
+            self.process.terminate()
+    
+    def kill(self):
+        """Zabija proces, który nie zamknął się w wyznaczonym czasie"""
+        if self.alive():
+            self.process.kill()
+        if self.process is not None:
+            self.process.wait()
+
+class StationSupervisor:
+    """
+    Nadzorca floty stacji radiowych, każdej w osobnym procesie.
+    
+    Każda stacja, okienkowa czy bezgłowa, ma własny interpreter, więc okna Tk
+    nie dzielą GIL-a ani pętli zdarzeń, a flota rozkłada się na wszystkie
+    rdzenie. Nadzorca czeka, aż stacje zaczną przyjmować połączenia, a potem
+    co HEALTH_INTERVAL sprawdza ich procesy i porty. Stacja, która padła lub
+    przestała odpowiadać, jest restartowana z narastającym opóźnieniem; po
+    MAX_RESTARTS restartach w oknie RESTART_WINDOW jest porzucana. Proces
+    zakończony poprawnie (np. zamknięte okno) nie jest wznawiany.
+    """
+    
+    def __init__(self, specs, log_dir=LOG_DIR, health_interval=HEALTH_INTERVAL):
+        """
+        Inicjalizuje nadzorcę
+        
+        Args:
+            specs (list): Opisy stacji (StationSpec)
+            log_dir (str): Katalog na wyjście procesów stacji
+            health_interval (float): Odstęp między kontrolami w sekundach
+        """
+        self.stations = [ManagedStation(spec, log_dir) for spec in specs]
+        self.health_interval = health_interval
+        self._stopping = threading.Event()
+        
+        # Zdarzenia nadzoru (wywoływane w wątku nadzorcy)
+        self.on_event = None
+    
+    def report(self, station, text):
+        """Zgłasza zdarzenie dotyczące stacji"""
+        if self.on_event:
+            self.on_event(station, text)
+    
+    def start(self, timeout=STARTUP_TIMEOUT):
+        """
+        Uruchamia wszystkie stacje i czeka na ich gotowość.
+        
+        Args:
+            timeout (float): Maksymalny czas oczekiwania w sekundach
+        
+        Returns:
+            list: Stacje, które nie zgłosiły gotowości w wyznaczonym czasie
+        """
+        for station in self.stations:
+            station.start()
+        
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline and not self._stopping.is_set():
+            self.check()
+            if not any(station.state in (STARTING, RESTARTING) for station in self.stations):
+                break
+            self._stopping.wait(STARTUP_POLL_INTERVAL)
+        return [station for station in self.stations if station.state != RUNNING]
+    
+    def check(self):
+        """Jedna kontrola wszystkich stacji: restart padniętych i zawieszonych"""
+        for station in self.stations:
+            if station.state in (FINISHED, FAILED, STOPPED):
+                continue
+            if station.state == RESTARTING:
+                self._restart_if_due(station)
+                continue
+            if not station.alive():
+                self._handle_exit(station)
+                continue
+            
+            if port_open(station.spec.port):
+                station.health_failures = 0
+                if station.state == STARTING:
+                    station.state = RUNNING
+                    if station.restart_times:
+                        self.report(station, "gotowa po restarcie")
+                continue
+            
+            if station.state == STARTING:
+                # Stacja jeszcze nie otworzyła portu - po STARTUP_TIMEOUT
+                # uznajemy ją za zawieszoną
+                if time.monotonic() - station.started_at < STARTUP_TIMEOUT:
+                    continue
+                station.health_failures = HEALTH_FAILURES
+            else:
+                station.health_failures += 1
+            if station.health_failures >= HEALTH_FAILURES:
+                self.report(station, "nie odpowiada - restart")
+                station.kill()
+                self._schedule_restart(station)
+    
+    def _handle_exit(self, station):
+        """Obsługuje zakończenie procesu stacji"""
+        code = station.process.returncode
+        if code == 0:
+            station.state = FINISHED
+            self.report(station, "zakończyła pracę")
+            return
+        self.report(station, f"padła (kod {code})")
+        self._schedule_restart(station)
+    
+    def _schedule_restart(self, station):
+        """Planuje restart stacji z narastającym opóźnieniem lub ją porzuca"""
+        now = time.monotonic()
+        while station.restart_times and now - station.restart_times[0] > RESTART_WINDOW:
+            station.restart_times.popleft()
+        if len(station.restart_times) >= MAX_RESTARTS:
+            station.state = FAILED
+            self.report(station, f"porzucona po {MAX_RESTARTS} restartach")
+            return
+        
+        # Opóźnienie rośnie z liczbą restartów w oknie RESTART_WINDOW
+        delay = min(RESTART_DELAY * 2 ** len(station.restart_times), RESTART_DELAY_MAX)
+        station.restart_times.append(now)
+        station.state = RESTARTING
+        station.restart_at = now + delay
+    
+    def _restart_if_due(self, station):
+        """Uruchamia ponownie stację, której minęło opóźnienie restartu"""
+        if time.monotonic() >= station.restart_at:
+            station.start()
+            self.report(station, f"restart (pid {station.pid})")
+    
+    def active(self):
+        """Czy któraś stacja nadal działa lub czeka na restart"""
+        return any(station.state in (STARTING, RUNNING, RESTARTING) for station in self.stations)
+    
+    def run(self):
+        """Nadzoruje stacje do wywołania stop lub zakończenia pracy wszystkich"""
+        while self.active() and not self._stopping.wait(self.health_interval):
+            self.check()
+    
+    def stop(self, timeout=SHUTDOWN_TIMEOUT):
+        """
+        Zamyka wszystkie stacje: najpierw SIGTERM, po czasie - zabicie.
+        
+        Args:
+            timeout (float): Czas na zamknięcie stacji w sekundach
+        """
+        self._stopping.set()
+        for station in self.stations:
+            station.terminate()
+        deadline = time.monotonic() + timeout
+        for station in self.stations:
+            if station.process is None:
+                continue
+            try:
+                station.process.wait(max(deadline - time.monotonic(), 0))
+            except subprocess.TimeoutExpired:
+                station.kill()
+            if station.state != FINISHED:
+                station.state = STOPPED
+
+def _print_event(station, text):
+    """Wypisuje zdarzenie nadzoru"""
+    print(f"[{time.strftime('%H:%M:%S')}] {station.spec.name}: {text}", flush=True)
+
+def main(argv=None):
+    """
+    Uruchamia parę stacji lub flotę i nadzoruje je do przerwania (Ctrl+C).
+    
+    Args:
+        argv (list, optional): Argumenty wiersza poleceń
+    
+    Returns:
+        int: 0 po zamknięciu stacji, 1 gdy któraś nie wystartowała
+    """
+    parser = argparse.ArgumentParser(description="Uruchamianie i nadzór stacji radiowych")
+    commands = parser.add_subparsers(dest="command", required=True)
+    
+    pair_parser = commands.add_parser("pair", help="Titanic i Carpathia")
+    pair_parser.add_argument("--headless", action="store_true", help="Stacje bez okien")
+    pair_parser.add_argument("--fixed-ports", action="store_true",
+                             help="Użyj portów z profili zamiast dowolnych wolnych")
+    
+    fleet_parser = commands.add_parser("fleet", help="Flota stacji połączonych w pierścień")
+    fleet_parser.add_argument("--stations", type=int, default=os.cpu_count() or 4,
+                              help="Liczba stacji (domyślnie liczba rdzeni)")
+    fleet_parser.add_argument("--gui", action="store_true", help="Stacje w oknach")
+    
+    for command_parser in (pair_parser, fleet_parser):
+        command_parser.add_argument("--journal", action="store_true",
+                                    help="Dziennik ruchu stacji bezgłowych")
+        command_parser.add_argument("--log-dir", default=LOG_DIR,
+                                    help="Katalog na wyjście procesów stacji")
+        command_parser.add_argument("--startup-timeout", type=float, default=STARTUP_TIMEOUT,
+                                    help="Czas oczekiwania na gotowość stacji (s)")
+    args = parser.parse_args(argv)
+    
+    if args.command == "pair":
+        specs = pair_specs(not args.headless, args.fixed_ports, args.journal)
+    else:
+        if args.stations < 2:
+            parser.error("flota wymaga co najmniej 2 stacji")
+        specs = fleet_specs(args.stations, args.gui, args.journal)
+    
+    supervisor = StationSupervisor(specs, args.log_dir)
+    supervisor.on_event = _print_event
+    
+    def request_stop(signum, frame):
+        raise KeyboardInterrupt
+    
+    signal.signal(signal.SIGTERM, request_stop)
+    status = 0
+    try:
+        not_ready = supervisor.start(args.startup_timeout)
+        for station in supervisor.stations:
+            mode = "okno" if station.spec.gui else "bezgłowa"
+            ready = "BRAK GOTOWOŚCI" if station in not_ready else "gotowa"
+            print(f"{station.spec.name:16} {station.spec.call_sign:8} port {station.spec.port:5} "
+                  f"pid {station.pid:7} {mode:9} {ready}")
+        if not_ready:
+            print(f"Nie wystartowało {len(not_ready)} stacji - wyjście procesów "
+                  f"w katalogu {args.log_dir}")
+            status = 1
+        if supervisor.active():
+            print(f"Nadzór {len(specs)} stacji - Ctrl+C zamyka wszystkie", flush=True)
+            supervisor.run()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        supervisor.stop()
+    return status
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+Moduł zawierający trwałe połączenia stacji radiowej z inną stacją
+lub z węzłem przekaźnikowym
+"""
+
+import queue
+import socket
+import threading
+
+import metrics
+from station_protocol import (
+    FrameDecoder, FrameError, encode_register_frame, FRAME_REGISTER, CAPABILITY_BINARY
+)
+
+# Parametry połączenia
+OUTBOUND_QUEUE_SIZE = 10000     # Maksymalna liczba ramek oczekujących na wysłanie
+MAX_BATCH_BYTES = 256 * 1024    # Maksymalny rozmiar jednego zapisu do gniazda
+CONNECT_TIMEOUT = 5             # s
+RECONNECT_DELAY = 0.2           # s, pierwsze opóźnienie ponownego połączenia
+RECONNECT_DELAY_MAX = 5         # s, maksymalne opóźnienie ponownego połączenia
+READ_CHUNK = 65536              # Rozmiar pojedynczego odczytu z gniazda
+
+class PeerLink:
+    """
+    Trwałe, samonaprawiające się połączenie z jedną stacją.
+    
+    Ramki trafiają do kolejki nadawczej, a jeden wątek zapisujący wysyła je
+    przez stale otwarte gniazdo. Wszystkie ramki oczekujące w kolejce są
+    sklejane w jeden zapis, więc przy dużym ruchu liczba wywołań systemowych
+    nie rośnie razem z liczbą wiadomości. Po zerwaniu połączenia wątek łączy
+    się ponownie z narastającym opóźnieniem i ponawia tylko ramki, które nie
+    zostały zapisane do gniazda w całości - odbiorca nie dostaje duplikatów.
+    Ramka zapisana do gniazda tuż przed zerwaniem połączenia może jednak
+    zaginąć (dostarczanie co najwyżej raz).
+    """
+    
+    def __init__(self, host, port, on_sent=None, on_error=None, queue_size=OUTBOUND_QUEUE_SIZE):
+        """
+        Inicjalizuje połączenie (wątek zapisujący startuje przy pierwszym send)
+        
+        Args:
+            host (str): Adres stacji docelowej
+            port (int): Port stacji docelowej
+            on_sent (function, optional): Wywoływana z liczbą wysłanych ramek
+            on_error (function, optional): Wywoływana z wyjątkiem połączenia
+            queue_size (int): Pojemność kolejki nadawczej
+        """
+        self.host = host
+        self.port = port
+        self.on_sent = on_sent
+        self.on_error = on_error
+        # Czy druga strona przyjmuje ramki binarne - StationServer dekoduje
+        # oba formaty, więc połączenie bezpośrednie nie wymaga uzgadniania
+        self.supports_binary = True
+        
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._socket = None
+        self._thread = None
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+    
+    def send(self, frame):
+        """
+        Umieszcza ramkę w kolejce nadawczej (nie blokuje).
+        
+        Args:
+            frame (bytes): Zakodowana ramka
+        
+        Returns:
+            bool: False, jeśli kolejka jest pełna lub połączenie zamknięte
+        """
+        if self._closed.is_set():
+            return False
+        self._ensure_writer()
+        try:
+            self._queue.put_nowait(frame)
+        except queue.Full:
+            metrics.count("send_queue_full")
+            return False
+        return True
+    
+    def close(self):
+        """Zamyka połączenie i zatrzymuje wątek zapisujący"""
+        self._closed.set()
+        try:
+            # Budzimy wątek zapisujący czekający na kolejkę
+            self._queue.put_nowait(None)
+        except queue.Full:
+            pass
+        if self._thread is not None:
+            self._thread.join(CONNECT_TIMEOUT)
+        self._disconnect()
+    
+    def _ensure_writer(self):
+        """Uruchamia wątek zapisujący, jeśli jeszcze nie działa"""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name=f"peer-link-{self.host}:{self.port}",
+                    daemon=True
+                )
+                self._thread.start()
+    
+    def _next_batch(self):
+        """
+        Czeka na ramkę i dokleja do niej wszystkie ramki już oczekujące.
+        
+        Returns:
+            list: Ramki do wysłania jednym zapisem (pusta przy zamykaniu)
+        """
+        frame = self._queue.get()
+        if frame is None:
+            return []
+        
+        batch = [frame]
+        size = len(frame)
+        while size < MAX_BATCH_BYTES:
+            try:
+                frame = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if frame is None:
+                break
+            batch.append(frame)
+            size += len(frame)
+        return batch
+    
+    def _connect(self):
+        """Nawiązuje połączenie, ponawiając próby z narastającym opóźnieniem"""
+        delay = RECONNECT_DELAY
+        while not self._closed.is_set():
+            try:
+                self._socket = socket.create_connection((self.host, self.port), CONNECT_TIMEOUT)
+                self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                return True
+            except OSError as e:
+                if self.on_error:
+                    self.on_error(e)
+                self._closed.wait(delay)
+                delay = min(delay * 2, RECONNECT_DELAY_MAX)
+        return False
+    
+    def _disconnect(self):
+        """Zamyka bieżące gniazdo, budząc wątek, który z niego czyta"""
+        sock, self._socket = self._socket, None
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            sock.close()
+    
+    def _run(self):
+        """Główna pętla wątku zapisującego"""
+        while not self._closed.is_set():
+            batch = self._next_batch()
+            
+            # Niewysłana reszta paczki jest ponawiana aż do skutku lub zamknięcia połączenia
+            while batch and not self._closed.is_set():
+                sock = self._socket
+                if sock is None:
+                    if not self._connect():
+                        return
+                    continue
+                data = b''.join(batch)
+                written = 0
+                try:
+                    with metrics.timer("sendall"), memoryview(data) as view:
+                        while written < len(data):
+                            written += sock.send(view[written:])
+                except OSError as e:
+                    if self._socket is sock:
+                        self._disconnect()
+                    if self.on_error:
+                        self.on_error(e)
+                    # Niepełna ramka ginie razem z zerwanym połączeniem,
+                    # więc zostaje ponowiona w całości
+                    complete = 0
+                    for frame in batch:
+                        if written < len(frame):
+                            break
+                        written -= len(frame)
+                        complete += 1
+                    self._report_sent(batch[:complete])
+                    batch = batch[complete:]
+                    continue
+                self._report_sent(batch)
+                batch = []
+    
+    def _report_sent(self, frames):
+        """Zlicza ramki zapisane do gniazda i powiadamia o nich on_sent"""
+        if not frames:
+            return
+        metrics.count("frames_sent", len(frames))
+        metrics.count("bytes_sent", sum(len(frame) for frame in frames))
+        if self.on_sent:
+            self.on_sent(len(frames))
+
+class HubLink(PeerLink):
+    """
+    Dwukierunkowe połączenie stacji z węzłem przekaźnikowym (relay_hub).
+    
+    Wątek odczytu nawiązuje połączenie, zgłasza stację ramką REGISTER
+    i przekazuje odebrane ramki do on_message. Ramki binarne są nadawane
+    dopiero wtedy, gdy węzeł potwierdzi ich obsługę w odpowiedzi na
+    zgłoszenie. Po zerwaniu połączenia łączy się ponownie i zgłasza stację
+    od nowa. Wątek zapisujący korzysta z tego
+    samego gniazda i czeka, aż połączenie będzie gotowe.
+    """
+    
+    def __init__(self, host, port, call_sign, on_message, on_sent=None, on_error=None,
+                 queue_size=OUTBOUND_QUEUE_SIZE):
+        """
+        Inicjalizuje połączenie (odbiór rusza po wywołaniu start)
+        
+        Args:
+            host (str): Adres węzła przekaźnikowego
+            port (int): Port węzła przekaźnikowego
+            call_sign (str): Znak wywoławczy stacji
+            on_message (function): Wywoływana z odebraną ramką (Frame)
+                w wątku odczytu
+            on_sent (function, optional): Wywoływana z liczbą wysłanych ramek
+            on_error (function, optional): Wywoływana z wyjątkiem połączenia
+            queue_size (int): Pojemność kolejki nadawczej
+        """
+        super().__init__(host, port, on_sent, on_error, queue_size)
+        self.supports_binary = False
+        self.call_sign = call_sign
+        self.on_message = on_message
+        self._ready = threading.Condition()
+        self._reader = None
+    
+    def start(self):
+        """Uruchamia wątek odczytu i wątek zapisujący"""
+        self._reader = threading.Thread(
+            target=self._read_loop,
+            name=f"hub-link-{self.call_sign}",
+            daemon=True
+        )
+        self._reader.start()
+        self._ensure_writer()
+    
+    def close(self):
+        """Zamyka połączenie i zatrzymuje oba wątki"""
+        self._closed.set()
+        with self._ready:
+            self._ready.notify_all()
+        super().close()
+        if self._reader is not None:
+            self._reader.join(CONNECT_TIMEOUT)
+    
+    def _connect(self):
+        """Czeka, aż wątek odczytu nawiąże połączenie (wątek zapisujący)"""
+        with self._ready:
+            self._ready.wait_for(lambda: self._socket is not None or self._closed.is_set())
+        return not self._closed.is_set()
+    
+    def _open(self):
+        """
+        Nawiązuje połączenie i zgłasza stację w węźle.
+        
+        Returns:
+            socket.socket: Połączone gniazdo lub None po zamknięciu
+        """
+        delay = RECONNECT_DELAY
+        while not self._closed.is_set():
+            try:
+                sock = socket.create_connection((self.host, self.port), CONNECT_TIMEOUT)
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                sock.settimeout(None)
+                self.supports_binary = False
+                sock.sendall(encode_register_frame(self.call_sign))
+                return sock
+            except OSError as e:
+                if self.on_error:
+                    self.on_error(e)
+                self._closed.wait(delay)
+                delay = min(delay * 2, RECONNECT_DELAY_MAX)
+        return None
+    
+    def _read_loop(self):
+        """Główna pętla wątku odczytu"""
+        while not self._closed.is_set():
+            sock = self._open()
+            if sock is None:
+                return
+            
+            # Gniazdo jest udostępniane wątkowi zapisującemu dopiero po zgłoszeniu
+            with self._ready:
+                self._socket = sock
+                self._ready.notify_all()
+            
+            decoder = FrameDecoder()
+            try:
+                while True:
+                    data = sock.recv(READ_CHUNK)
+                    if not data:
+                        break
+                    metrics.count("bytes_received", len(data))
+                    with metrics.timer("recv_decode"):
+                        frames = decoder.feed(data)
+                    for frame in frames:
+                        if frame.kind == FRAME_REGISTER:
+                            # Odpowiedź węzła na zgłoszenie: obsługiwane formaty
+                            self.supports_binary = bool(frame.sequence & CAPABILITY_BINARY)
+                        else:
+                            self.on_message(frame)
+            except (OSError, FrameError) as e:
+                if self.on_error and not self._closed.is_set():
+                    self.on_error(e)
+            except Exception as e:
+                # Nieoczekiwany błąd nie może zatrzymać wątku - połączenie
+                # jest zamykane i nawiązywane od nowa z pustym dekoderem
+                print(f"Nieoczekiwany błąd odbioru z węzła: {e!r}")
+                if self.on_error and not self._closed.is_set():
+                    self.on_error(e)
+            
+            if self._socket is sock:
+                self._disconnect()
+            else:
+                sock.close()
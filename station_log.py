@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Moduł zawierający ograniczony log komunikacji stacji wyświetlany w widgecie Tk
+"""
+
+import os
+from collections import deque
+
+import tkinter as tk
+
+# Parametry logu
+LOG_CAPACITY = 10000        # Liczba wpisów przechowywanych w pamięci
+VISIBLE_ENTRIES = 500       # Liczba ostatnich wpisów wyświetlanych w widgecie
+TRIM_SLACK = 100            # Nadmiar wpisów w widgecie usuwany jednym wywołaniem
+FRAME_INTERVAL = 50         # ms, odstęp między aktualizacjami widgetu
+ENTRY_SEPARATOR = "\n\n"    # Odstęp między wpisami w widgecie
+
+class CommunicationLog:
+    """
+    Log komunikacji o stałym zużyciu pamięci, niezależnie od czasu pracy stacji.
+    
+    Wpisy trafiają do bufora cyklicznego (deque z maxlen), a widget pokazuje
+    jedynie okno ostatnich VISIBLE_ENTRIES wpisów - najstarsze linie są
+    usuwane hurtem, gdy nadmiar przekroczy TRIM_SLACK. Wpisy dodane w czasie
+    jednej klatki trafiają do widgetu jednym wstawieniem, a widok przewija
+    się tylko wtedy, gdy był przewinięty do końca. Pełna historia jest
+    dopisywana do pliku zamiast pozostawać w Tk.
+    """
+    
+    def __init__(self, root, text_widget, history_path=None, capacity=LOG_CAPACITY,
+                 visible_entries=VISIBLE_ENTRIES, frame_interval=FRAME_INTERVAL):
+        """
+        Inicjalizuje log
+        
+        Args:
+            root (tk.Tk lub tk.Frame): Widget, którego pętla zdarzeń aktualizuje log
+            text_widget (tk.Text): Widget wyświetlający wpisy (tylko do odczytu)
+            history_path (str, optional): Plik, do którego dopisywana jest historia
+            capacity (int): Liczba wpisów przechowywanych w pamięci
+            visible_entries (int): Liczba wpisów wyświetlanych w widgecie
+            frame_interval (int): Odstęp między aktualizacjami widgetu w ms
+        """
+        self.root = root
+        self.text_widget = text_widget
+        self.entries = deque(maxlen=capacity)
+        self.visible_entries = visible_entries
+        self.frame_interval = frame_interval
+        
+        # Wpisy oczekujące na wyświetlenie i liczba linii wpisów w widgecie
+        self._pending = deque()
+        self._widget_lines = deque()
+        self._flush_scheduled = False
+        
+        self.history_file = None
+        if history_path is not None:
+            self.open_history(history_path)
+    
+    def open_history(self, path):
+        """
+        Otwiera plik historii w trybie dopisywania.
+        
+        Args:
+            path (str): Ścieżka pliku (katalog jest tworzony w razie potrzeby)
+        
+        Returns:
+            bool: False, jeśli pliku nie udało się otworzyć
+        """
+        try:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self.history_file = open(path, 'a', encoding='utf-8')
+        except OSError as e:
+            print(f"Nie można otworzyć pliku historii {path}: {e}")
+            return False
+        return True
+    
+    def append(self, entry):
+        """
+        Dodaje wpis do logu - widget zostanie zaktualizowany w najbliższej klatce.
+        
+        Args:
+            entry (str): Treść wpisu
+        """
+        self.entries.append(entry)
+        self._pending.append(entry)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.root.after(self.frame_interval, self.flush)
+    
+    def extend(self, entries):
+        """
+        Dodaje wiele wpisów naraz.
+        
+        Args:
+            entries (iterable): Treści wpisów
+        """
+        entries = list(entries)
+        self.entries.extend(entries)
+        self._pending.extend(entries)
+        if entries and not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.root.after(self.frame_interval, self.flush)
+    
+    def flush(self):
+        """Przenosi oczekujące wpisy do widgetu i pliku historii (wątek Tk)"""
+        self._flush_scheduled = False
+        batch = []
+        while self._pending:
+            batch.append(self._pending.popleft())
+        if not batch:
+            return
+        
+        if self.history_file is not None:
+            self.history_file.write(''.join(entry + '\n' for entry in batch))
+            self.history_file.flush()
+        
+        # Z dużej paczki do widgetu trafia tylko to, co zmieści się w oknie
+        batch = batch[-self.visible_entries:]
+        widget = self.text_widget
+        at_end = widget.yview()[1] >= 1.0
+        
+        widget.config(state=tk.NORMAL)
+        widget.insert(tk.END, ''.join(entry + ENTRY_SEPARATOR for entry in batch))
+        self._widget_lines.extend(
+            entry.count('\n') + ENTRY_SEPARATOR.count('\n') for entry in batch
+        )
+        
+        excess = len(self._widget_lines) - self.visible_entries
+        if excess > 0 and (excess >= TRIM_SLACK or len(batch) == self.visible_entries):
+            trimmed_lines = sum(self._widget_lines.popleft() for _ in range(excess))
+            widget.delete("1.0", f"{trimmed_lines + 1}.0")
+        widget.config(state=tk.DISABLED)
+        
+        if at_end:
+            widget.see(tk.END)
+    
+    def recent(self, count=VISIBLE_ENTRIES):
+        """
+        Zwraca ostatnie wpisy z bufora.
+        
+        Args:
+            count (int): Maksymalna liczba wpisów
+        
+        Returns:
+            list: Wpisy od najstarszego do najnowszego
+        """
+        return list(self.entries)[-count:]
+    
+    def close(self):
+        """Zapisuje oczekujące wpisy i zamyka plik historii"""
+        self.flush()
+        if self.history_file is not None:
+            self.history_file.close()
+            self.history_file = None
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Moduł zawierający konfigurację stacji Titanica i Carpathii niezależną od interfejsu graficznego
+"""
+
+from collections import namedtuple
+
+# Konfiguracja połączenia
+TITANIC_HOST = 'localhost'     # Adres IP Titanica (ten sam komputer)
+CARPATHIA_HOST = 'localhost'   # Adres IP Carpathii (ten sam komputer)
+CARPATHIA_PORT = 5678          # Port nasłuchiwania Carpathii
+TITANIC_PORT = 5679            # Port nasłuchiwania Titanica
+TITANIC_CALL_SIGN = 'MGY'      # Znak wywoławczy Titanica
+CARPATHIA_CALL_SIGN = 'MPA'    # Znak wywoławczy Carpathii
+
+# Symulacja łączności
+TITANIC_SNR_DB = 10.5                     # dB, ~30% zakłóconych wiadomości
+CARPATHIA_SNR_DB = 11                     # dB, ~17% zakłóconych wiadomości
+AUTO_RESPONSE_PROBABILITY = 0.7           # 70% szans na auto-odpowiedź na SOS
+
+# Historyczne wiadomości Titanica
+TITANIC_MESSAGES = [
+    "CQD CQD SOS SOS FROM TITANIC. WE ARE SINKING FAST. PASSENGERS BEING PUT INTO BOATS.",
+    "CQD CQD SOS TITANIC 41.46 N 50.14 W REQUIRE IMMEDIATE ASSISTANCE.",
+    "WE HAVE STRUCK ICEBERG SINKING NEED IMMEDIATE ASSISTANCE.",
+    "TITANIC SINKING HEAD DOWN NEED IMMEDIATE ASSISTANCE.",
+    "SOS TITANIC POSITION 41.44 N 50.24 W. REQUIRE IMMEDIATE ASSISTANCE.",
+    "COME AT ONCE. WE HAVE STRUCK A BERG.",
+    "SINKING, COME QUICKLY.",
+    "WE ARE PUTTING PASSENGERS OFF IN SMALL BOATS.",
+    "WOMEN AND CHILDREN IN BOATS, CANNOT LAST MUCH LONGER."
+]
+
+# Historyczne odpowiedzi Carpathii
+CARPATHIA_MESSAGES = [
+    "COMING TO YOUR ASSISTANCE. FULL SPEED.",
+    "PUTTING ABOUT AND HEADING TO YOUR POSITION.",
+    "OUR POSITION 41.17 N 49.52 W. STEAMING FULL SPEED TO YOU.",
+    "WE ARE MAKING 14 KNOTS. WILL BE WITH YOU IN 4 HOURS.",
+    "HAVE BROADCAST NEWS TO OTHER SHIPS. OLYMPIC IS ALSO COMING.",
+    "HOW MANY LIFEBOATS LAUNCHED?",
+    "ALL BOATS ON STANDBY. CREW READY. ARRIVING SOON.",
+    "WE'RE COMING AS QUICK AS WE CAN.",
+    "KEEP YOUR SPIRITS UP. WE'RE COMING."
+]
+
+# Profil stacji: nazwa, znak wywoławczy, domyślny port, SNR kanału,
+# wiadomości do nadania, automatyczne odpowiedzi i szansa odpowiedzi na SOS
+StationProfile = namedtuple(
+    'StationProfile',
+    'name call_sign port snr_db messages responses auto_response_probability'
+)
+
+PROFILES = {
+    'titanic': StationProfile('titanic', TITANIC_CALL_SIGN, TITANIC_PORT, TITANIC_SNR_DB,
+                              TITANIC_MESSAGES, (), 0.0),
+    'carpathia': StationProfile('carpathia', CARPATHIA_CALL_SIGN, CARPATHIA_PORT,
+                                CARPATHIA_SNR_DB, CARPATHIA_MESSAGES, CARPATHIA_MESSAGES,
+                                AUTO_RESPONSE_PROBABILITY),
+}
+
+def station_corpora():
+    """Zwraca historyczne wiadomości obu stacji jako pary (nazwa, wiadomości)"""
+    return [("titanic", TITANIC_MESSAGES), ("carpathia", CARPATHIA_MESSAGES)]
+
+def parse_address(value, default_host='localhost'):
+    """
+    Zamienia adres w postaci host:port na krotkę.
+    
+    Args:
+        value (str): Adres, np. "localhost:5678" lub ":5678"
+        default_host (str): Host używany, gdy adres go nie zawiera
+    
+    Returns:
+        tuple: (host, port)
+    
+    Raises:
+        ValueError: Jeśli adres nie zawiera poprawnego portu
+    """
+    host, separator, port = value.rpartition(':')
+    if not separator or not port.isdigit():
+        raise ValueError(f"oczekiwano adresu host:port, otrzymano {value!r}")
+    return (host or default_host, int(port))
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Moduł zawierający format ramek wymienianych między stacjami radiowymi
+"""
+
+import time
+import struct
+from collections import namedtuple
+
+from morse_utils import pack_morse, unpack_morse, morse_to_text, is_recoverable, PACKED_HEADER_SIZE
+
+# Nagłówek ramki: znacznik, wersja, rodzaj ramki, znaki wywoławcze nadawcy
+# i adresata, numer kolejny, znacznik czasu (s od epoki) i długość danych
+FRAME_MAGIC = b'MC'
+FRAME_VERSION = 2
+FRAME_HEADER = struct.Struct('!2sBB8s8sIdI')
+FRAME_HEADER_SIZE = FRAME_HEADER.size
+MAX_FRAME_PAYLOAD = 16 * 1024 * 1024  # Ochrona przed uszkodzonym nagłówkiem
+
+# Rodzaje ramek. Wiadomość jest dołączana tylko wtedy, gdy nie da się jej
+# odtworzyć z kodu Morse'a - bez niej odbiorca odczytuje treść z kodu.
+FRAME_TEXT = 1      # Długość wiadomości (4 bajty), wiadomość i kod Morse'a w UTF-8
+FRAME_BINARY = 2    # Kod Morse'a spakowany po 2 bity na element, opcjonalnie wiadomość w UTF-8
+FRAME_REGISTER = 3  # Zgłoszenie stacji w węźle i odpowiedź węzła (bez danych,
+                    # obsługiwane formaty w polu numeru kolejnego)
+FRAME_KINDS = (FRAME_TEXT, FRAME_BINARY, FRAME_REGISTER)
+
+# Formaty obsługiwane przez stronę połączenia (ramka REGISTER). Zgłoszenie bez
+# tych znaczników oznacza stację przyjmującą tylko ramki tekstowe.
+CAPABILITY_BINARY = 0x01
+CAPABILITIES = CAPABILITY_BINARY
+
+# Adresat ramki nadawanej do wszystkich stacji
+BROADCAST_CALL_SIGN = 'CQ'
+
+# Długość wiadomości w ramce tekstowej
+TEXT_LENGTH = struct.Struct('!I')
+
+# Dostępne formaty pakietów
+PACKET_FORMAT_TEXT = 'text'
+PACKET_FORMAT_BINARY = 'binary'
+
+# Odebrana ramka
+Frame = namedtuple('Frame', 'kind sender recipient sequence timestamp message morse_code')
+
+# Nagłówek ramki bez danych
+FrameHeader = namedtuple('FrameHeader', 'kind sender recipient sequence timestamp length')
+
+class FrameError(ValueError):
+    """Błąd formatu ramki - strumień nie nadaje się do dalszego czytania"""
+
+def encode_frame(message, morse_code, sender, sequence, packet_format=PACKET_FORMAT_BINARY,
+                 timestamp=None, recipient=BROADCAST_CALL_SIGN, include_message=None):
+    """
+    Koduje wiadomość do ramki wysyłanej przez sieć.
+    
+    Ramka binarna zawiera spakowany kod Morse'a (2 bity na element). Treść
+    wiadomości jest dołączana w obu formatach tylko wtedy, gdy nie da się jej
+    odtworzyć z kodu (małe litery, znaki spoza alfabetu Morse'a), więc
+    odbiorca dostaje tę samą treść niezależnie od formatu. Jeśli kodu nie da
+    się spakować (znaki spoza formatu binarnego), używana jest ramka tekstowa.
+    
+    Args:
+        message (str): Treść wiadomości
+        morse_code (str): Kod Morse'a wiadomości
+        sender (str): Znak wywoławczy nadawcy (do 8 znaków ASCII)
+        sequence (int): Numer kolejny ramki nadawcy
+        packet_format (str): Preferowany format danych
+        timestamp (float, optional): Czas nadania, domyślnie bieżący
+        recipient (str): Znak wywoławczy adresata, domyślnie CQ (wszystkie stacje)
+        include_message (bool, optional): Dołącz treść wiadomości; domyślnie
+            tylko gdy nie da się jej odtworzyć z kodu
+    
+    Returns:
+        bytes: Ramka gotowa do wysłania
+    """
+    if include_message is None:
+        include_message = not is_recoverable(message)
+    message_bytes = message.encode('utf-8') if include_message else b''
+    
+    payload = None
+    kind = FRAME_BINARY
+    if packet_format == PACKET_FORMAT_BINARY:
+        try:
+            payload = pack_morse(morse_code) + message_bytes
+        except ValueError:
+            # Kod zawiera znaki nieobsługiwane - wracamy do ramki tekstowej
+            pass
+    
+    if payload is None:
+        kind = FRAME_TEXT
+        payload = b''.join((
+            TEXT_LENGTH.pack(len(message_bytes)),
+            message_bytes,
+            morse_code.encode('utf-8'),
+        ))
+    
+    return _pack_header(kind, sender, recipient, sequence, timestamp, len(payload)) + payload
+
+def encode_register_frame(call_sign, capabilities=CAPABILITIES, recipient=''):
+    """
+    Koduje ramkę zgłoszenia stacji w węźle przekaźnikowym (lub odpowiedź węzła).
+    
+    Args:
+        call_sign (str): Znak wywoławczy zgłaszanej stacji (pusty dla węzła)
+        capabilities (int): Znaczniki CAPABILITY_* obsługiwanych formatów
+        recipient (str): Adresat odpowiedzi węzła
+    
+    Returns:
+        bytes: Ramka gotowa do wysłania
+    """
+    return _pack_header(FRAME_REGISTER, call_sign, recipient, capabilities, None, 0)
+
+def _pack_header(kind, sender, recipient, sequence, timestamp, length):
+    """Pakuje nagłówek ramki"""
+    if timestamp is None:
+        timestamp = time.time()
+    
+    return FRAME_HEADER.pack(
+        FRAME_MAGIC,
+        FRAME_VERSION,
+        kind,
+        sender.encode('ascii'),
+        recipient.encode('ascii'),
+        sequence & 0xFFFFFFFF,
+        timestamp,
+        length
+    )
+
+def decode_frame_header(data):
+    """
+    Dekoduje nagłówek ramki.
+    
+    Args:
+        data (bytes lub memoryview): Co najmniej FRAME_HEADER_SIZE bajtów
+    
+    Returns:
+        FrameHeader: Nagłówek ramki
+    
+    Raises:
+        FrameError: Jeśli nagłówek jest nieprawidłowy
+    """
+    (magic, version, kind, sender, recipient,
+     sequence, timestamp, length) = FRAME_HEADER.unpack_from(data)
+    if magic != FRAME_MAGIC:
+        raise FrameError("Nieprawidłowy znacznik ramki")
+    if version != FRAME_VERSION:
+        raise FrameError(f"Nieobsługiwana wersja ramki: {version}")
+    if kind not in FRAME_KINDS:
+        raise FrameError(f"Nieznany rodzaj ramki: {kind}")
+    if length > MAX_FRAME_PAYLOAD:
+        raise FrameError(f"Zbyt duża ramka: {length} bajtów")
+    
+    sender = sender.rstrip(b'\x00').decode('ascii', errors='replace')
+    recipient = recipient.rstrip(b'\x00').decode('ascii', errors='replace')
+    return FrameHeader(kind, sender, recipient, sequence, timestamp, length)
+
+def decode_frame_payload(header, payload):
+    """
+    Dekoduje dane ramki.
+    
+    Args:
+        header (FrameHeader): Nagłówek ramki
+        payload (bytes lub memoryview): Dane o długości header.length
+    
+    Returns:
+        Frame: Odebrana ramka
+    
+    Raises:
+        FrameError: Jeśli dane są nieprawidłowe
+    """
+    try:
+        if header.kind == FRAME_REGISTER:
+            message = morse_code = ''
+        elif header.kind == FRAME_BINARY:
+            morse_code = unpack_morse(payload)
+            with memoryview(payload) as view:
+                message = str(view[PACKED_HEADER_SIZE + (len(morse_code) + 3) // 4:], 'utf-8')
+        else:
+            # Widok jest zwalniany także przy błędzie, żeby bufor dekodera
+            # strumienia można było przyciąć
+            with memoryview(payload) as view:
+                (message_length,) = TEXT_LENGTH.unpack_from(view)
+                message_end = TEXT_LENGTH.size + message_length
+                if message_end > len(view):
+                    raise FrameError(f"Długość wiadomości {message_length} B przekracza "
+                                     f"dane ramki {len(view)} B")
+                message = str(view[TEXT_LENGTH.size:message_end], 'utf-8')
+                morse_code = str(view[message_end:], 'utf-8')
+        if not message:
+            # Ramka bez treści - treść odczytywana z kodu
+            message = morse_to_text(morse_code)
+    except FrameError:
+        raise
+    except (ValueError, struct.error) as e:
+        raise FrameError(f"Uszkodzone dane ramki: {e}")
+    
+    return Frame(header.kind, header.sender, header.recipient, header.sequence,
+                 header.timestamp, message, morse_code)
+
+class FrameDecoder:
+    """
+    Przyrostowy dekoder strumienia ramek dla zwykłych gniazd.
+    
+    Przyjmuje dane w dowolnych kawałkach i zwraca wszystkie ramki, które
+    zostały już odebrane w całości. Jedno połączenie może przenosić
+    dowolnie wiele ramek jedna za drugą.
+    """
+    
+    def __init__(self):
+        """Inicjalizuje dekoder"""
+        self._buffer = bytearray()
+        self._header = None
+    
+    def feed(self, data):
+        """
+        Przekazuje kolejny kawałek strumienia.
+        
+        Args:
+            data (bytes): Dane odebrane z gniazda
+        
+        Returns:
+            list: Kompletne ramki (Frame)
+        
+        Raises:
+            FrameError: Jeśli strumień zawiera nieprawidłową ramkę
+        """
+        self._buffer += data
+        frames = []
+        offset = 0
+        view = memoryview(self._buffer)
+        
+        try:
+            while True:
+                if self._header is None:
+                    if len(view) - offset < FRAME_HEADER_SIZE:
+                        break
+                    # Wycinek jest zwalniany także przy błędzie nagłówka -
+                    # inaczej bufora nie dałoby się przyciąć
+                    with view[offset:] as header_view:
+                        self._header = decode_frame_header(header_view)
+                    offset += FRAME_HEADER_SIZE
+                
+                end = offset + self._header.length
+                if len(view) < end:
+                    break
+                with view[offset:end] as payload:
+                    frames.append(decode_frame_payload(self._header, payload))
+                self._header = None
+                offset = end
+        finally:
+            view.release()
+            # Usuwamy przetworzone dane jednym wywołaniem
+            del self._buffer[:offset]
+        
+        return frames
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Moduł zawierający serwer asyncio odbierający wiadomości stacji radiowej
+"""
+
+import time
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import metrics
+from morse_utils import MorseStreamDecoder, unpack_elements, PACKED_HEADER_SIZE
+from station_protocol import (
+    FrameError, decode_frame_header, decode_frame_payload,
+    FRAME_HEADER_SIZE, FRAME_TEXT, FRAME_BINARY, TEXT_LENGTH
+)
+
+# Parametry serwera
+QUEUE_SIZE = 1024      # Maksymalna liczba wiadomości oczekujących na obsłużenie
+READ_CHUNK = 65536     # Rozmiar pojedynczego odczytu z gniazda
+START_TIMEOUT = 5      # s, czas oczekiwania na uruchomienie serwera
+
+class StationServer:
+    """
+    Serwer stacji obsługujący wielu nadawców jednocześnie.
+    
+    Każde połączenie może przenosić wiele ramek jedna za drugą, a odebrane
+    ramki trafiają do ograniczonej kolejki. Gdy kolejka jest pełna, serwer
+    przestaje czytać z gniazd, więc nadawcy zwalniają zamiast tracić
+    wiadomości.
+    
+    Wiadomości są przekazywane do on_message po kolei, w osobnym wątku
+    roboczym, dzięki czemu wolna obsługa nie blokuje pętli zdarzeń.
+    Serwer nie zależy od Tkinter.
+    """
+    
+    def __init__(self, host, port, on_message, on_partial=None, queue_size=QUEUE_SIZE):
+        """
+        Inicjalizuje serwer
+        
+        Args:
+            host (str): Adres nasłuchiwania
+            port (int): Port nasłuchiwania (0 - dowolny wolny port)
+            on_message (function): Wywoływana z odebraną ramką (Frame)
+            on_partial (function, optional): Wywoływana z tekstem odkodowanym
+                w trakcie odbioru ramki tekstowej lub binarnej (w wątku pętli
+                zdarzeń)
+            queue_size (int): Pojemność kolejki odebranych wiadomości
+        """
+        self.host = host
+        self.port = port
+        self.on_message = on_message
+        self.on_partial = on_partial
+        self.queue_size = queue_size
+        
+        self.loop = None
+        self._thread = None
+        self._server = None
+        self._queue = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="station-dispatch")
+        self._started = threading.Event()
+        self._start_error = None
+    
+    def start(self):
+        """
+        Uruchamia pętlę zdarzeń serwera w osobnym wątku.
+        
+        Returns:
+            int: Port, na którym serwer faktycznie nasłuchuje
+        
+        Raises:
+            OSError: Jeśli nie można otworzyć portu
+        """
+        self._thread = threading.Thread(target=self._run, name="station-server", daemon=True)
+        self._thread.start()
+        self._started.wait(START_TIMEOUT)
+        if self._start_error is not None:
+            raise self._start_error
+        return self.port
+    
+    def stop(self):
+        """Zatrzymuje serwer i jego pętlę zdarzeń"""
+        if self.loop is not None and self.loop.is_running():
+            self.loop.call_soon_threadsafe(self.loop.stop)
+        if self._thread is not None:
+            self._thread.join(START_TIMEOUT)
+        self._executor.shutdown(wait=False)
+    
+    def _run(self):
+        """Główna funkcja wątku serwera"""
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        try:
+            self.loop.run_until_complete(self._serve())
+        except OSError as e:
+            self._start_error = e
+            self._started.set()
+            return
+        
+        self._started.set()
+        try:
+            self.loop.run_forever()
+        finally:
+            self._server.close()
+            tasks = asyncio.all_tasks(self.loop)
+            for task in tasks:
+                task.cancel()
+            self.loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            self.loop.run_until_complete(self._server.wait_closed())
+            self.loop.close()
+    
+    async def _serve(self):
+        """Otwiera gniazdo nasłuchujące i uruchamia obsługę kolejki"""
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self.loop.create_task(self._dispatch())
+    
+    async def _handle_connection(self, reader, writer):
+        """Odczytuje kolejne ramki z jednego połączenia i umieszcza je w kolejce"""
+        try:
+            while True:
+                frame = await self._read_frame(reader)
+                if frame is None:
+                    break
+                # Pełna kolejka wstrzymuje obsługę połączenia (backpressure)
+                await self._queue.put(frame)
+        except FrameError as e:
+            print(f"Błąd ramki: {e}")
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except asyncio.CancelledError:
+            # Zatrzymanie serwera przy otwartym trwałym połączeniu
+            pass
+        finally:
+            writer.close()
+    
+    async def _read_frame(self, reader):
+        """
+        Czyta jedną ramkę, dekodując jej kod Morse'a na bieżąco.
+        
+        Args:
+            reader (asyncio.StreamReader): Strumień połączenia
+            
+        Returns:
+            Frame: Odebrana ramka lub None, jeśli nadawca zamknął połączenie
+        """
+        try:
+            header = decode_frame_header(await reader.readexactly(FRAME_HEADER_SIZE))
+        except asyncio.IncompleteReadError as e:
+            if e.partial:
+                raise
+            return None
+        metrics.count("bytes_received", FRAME_HEADER_SIZE + header.length)
+        # Etap "recv": od nagłówka do zdekodowania całej ramki
+        start = time.perf_counter()
+        
+        if header.kind not in (FRAME_TEXT, FRAME_BINARY) or self.on_partial is None:
+            frame = decode_frame_payload(header, await reader.readexactly(header.length))
+            metrics.observe("recv", time.perf_counter() - start)
+            return frame
+        
+        if header.kind == FRAME_TEXT:
+            # Ramka tekstowa: wiadomość, a po niej kod Morse'a do końca ramki
+            chunks = [await self._read_field(reader, header, TEXT_LENGTH.size)]
+            (message_length,) = TEXT_LENGTH.unpack(chunks[0])
+            chunks.append(await self._read_field(reader, header, message_length,
+                                                 TEXT_LENGTH.size))
+            code_length = header.length - TEXT_LENGTH.size - message_length
+            elements = None
+        else:
+            # Ramka binarna: liczba elementów, spakowany kod, a po nim
+            # opcjonalna wiadomość
+            chunks = [await self._read_field(reader, header, PACKED_HEADER_SIZE)]
+            elements = int.from_bytes(chunks[0], 'big')
+            code_length = (elements + 3) // 4
+            if PACKED_HEADER_SIZE + code_length > header.length:
+                raise FrameError(f"Kod Morse'a ({elements} elementów) przekracza "
+                                 f"długość ramki {header.length} B")
+        
+        decoder = MorseStreamDecoder()
+        decoded = ''
+        remaining = code_length
+        while remaining > 0:
+            data = await reader.read(min(READ_CHUNK, remaining))
+            if not data:
+                raise asyncio.IncompleteReadError(b''.join(chunks), header.length)
+            chunks.append(data)
+            remaining -= len(data)
+            if elements is None:
+                code = data
+            else:
+                # Dopełnienie ostatniego bajtu nie należy do kodu
+                code = unpack_elements(data)[:elements]
+                elements -= len(code)
+            decoded = (decoded + decoder.feed(code))[-40:]
+            self.on_partial(decoded)
+        
+        rest = header.length - sum(map(len, chunks))
+        if rest:
+            chunks.append(await reader.readexactly(rest))
+        frame = decode_frame_payload(header, b''.join(chunks))
+        metrics.observe("recv", time.perf_counter() - start)
+        return frame
+    
+    async def _read_field(self, reader, header, size, offset=0):
+        """
+        Czyta pole danych ramki, sprawdzając, czy mieści się w ramce.
+        
+        Args:
+            reader (asyncio.StreamReader): Strumień połączenia
+            header (FrameHeader): Nagłówek czytanej ramki
+            size (int): Długość pola w bajtach
+            offset (int): Położenie pola w danych ramki
+            
+        Returns:
+            bytes: Zawartość pola
+            
+        Raises:
+            FrameError: Jeśli pole wychodzi poza ramkę
+        """
+        # Bez tej kontroli odczyt wszedłby w kolejną ramkę trwałego połączenia
+        if offset + size > header.length:
+            raise FrameError(f"Pole danych ({size} B od {offset} B) przekracza "
+                             f"długość ramki {header.length} B")
+        return await reader.readexactly(size)
+    
+    async def _dispatch(self):
+        """Przekazuje wiadomości z kolejki do on_message w wątku roboczym"""
+        while True:
+            frame = await self._queue.get()
+            try:
+                await self.loop.run_in_executor(self._executor, self.on_message, frame)
+            except Exception as e:
+                print(f"Błąd obsługi wiadomości: {e}")
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Testy dekodera strumienia ramek
+"""
+
+import unittest
+
+from morse_utils import text_to_morse
+from station_protocol import FrameDecoder, FrameError, encode_frame
+
+class FrameDecoderTest(unittest.TestCase):
+    """Testy FrameDecoder.feed"""
+    
+    def test_frames_split_across_chunks(self):
+        """Ramki podzielone na dowolne kawałki są składane w całość"""
+        data = b''.join(encode_frame("SOS", text_to_morse("SOS"), 'MGY', sequence)
+                        for sequence in range(3))
+        decoder = FrameDecoder()
+        frames = []
+        for position in range(0, len(data), 7):
+            frames += decoder.feed(data[position:position + 7])
+        self.assertEqual([frame.sequence for frame in frames], [0, 1, 2])
+    
+    def test_valid_frame_followed_by_garbage(self):
+        """Uszkodzony nagłówek po poprawnej ramce zgłasza FrameError, nie BufferError"""
+        frame = encode_frame("SOS", text_to_morse("SOS"), 'MGY', 1)
+        decoder = FrameDecoder()
+        with self.assertRaises(FrameError):
+            decoder.feed(frame + b'XX' + b'\x00' * len(frame))
+        # Bufor dekodera nadal daje się zmieniać
+        with self.assertRaises(FrameError):
+            decoder.feed(b'\x00')
+    
+    def test_text_length_exceeding_frame(self):
+        """Długość wiadomości większa niż dane ramki zgłasza FrameError"""
+        frame = bytearray(encode_frame("sos", "... --- ...", 'MGY', 1, 'text'))
+        frame[-len("sos... --- ...") - 4:-len("sos... --- ...")] = b'\x00\x00\xff\xff'
+        with self.assertRaises(FrameError):
+            FrameDecoder().feed(bytes(frame))
+
+class EncodeFrameTest(unittest.TestCase):
+    """Testy encode_frame"""
+    
+    def decode(self, data):
+        frames = FrameDecoder().feed(data)
+        self.assertEqual(len(frames), 1)
+        return frames[0]
+    
+    def test_formats_agree(self):
+        """Oba formaty dają tę samą treść, także po zakłóceniach kodu"""
+        for message, morse_code in (("SOS", "... --- ..."), ("SOS", "... --- .-."),
+                                    ("sos", "... --- ...")):
+            binary = self.decode(encode_frame(message, morse_code, 'MGY', 1, 'binary'))
+            text = self.decode(encode_frame(message, morse_code, 'MGY', 1, 'text'))
+            self.assertEqual(binary.message, text.message)
+    
+    def test_binary_frame_omits_recoverable_message(self):
+        """Ramka binarna nie powtarza treści, którą da się odtworzyć z kodu"""
+        message = "SOS HELP ME" * 100
+        morse_code = text_to_morse(message)
+        binary = encode_frame(message, morse_code, 'MGY', 1, 'binary')
+        text = encode_frame(message, morse_code, 'MGY', 1, 'text', include_message=True)
+        self.assertGreater(len(text) / len(binary), 3.5)
+        self.assertEqual(self.decode(binary).message, message)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,551 @@
+#!/usr/bin/env python3
+"""
+Moduł zawierający dziennik ruchu stacji (zapis ramek) i narzędzie do jego odtwarzania
+"""
+
+import os
+import sys
+import mmap
+import time
+import bisect
+import struct
+import argparse
+import threading
+from datetime import datetime
+from collections import namedtuple
+
+from station_protocol import (
+    encode_frame, decode_frame_header, decode_frame_payload, FrameError,
+    FRAME_HEADER, FRAME_HEADER_SIZE, FRAME_TEXT, PACKET_FORMAT_BINARY, PACKET_FORMAT_TEXT
+)
+
+# Nagłówek dziennika: znacznik, wersja i czas rozpoczęcia sesji (s od epoki)
+JOURNAL_MAGIC = b'MCJ'
+JOURNAL_VERSION = 1
+JOURNAL_HEADER = struct.Struct('!3sBd')
+
+# Nagłówek wpisu: czas od rozpoczęcia sesji (zegar monotoniczny), kierunek
+# i długość ramki, po nim ramka w formacie sieciowym
+RECORD_HEADER = struct.Struct('!dBI')
+
+# Indeks w pliku obok dziennika: (czas, położenie wpisu) co INDEX_STRIDE wpisów
+INDEX_SUFFIX = '.idx'
+INDEX_ENTRY = struct.Struct('!dQ')
+INDEX_STRIDE = 64
+
+# Kierunki ramek
+SENT = 0
+RECEIVED = 1
+DIRECTIONS = {SENT: 'nadana', RECEIVED: 'odebrana'}
+
+# Parametry zapisu i odtwarzania
+JOURNAL_DIR = "journals"
+JOURNAL_SUFFIX = '.mcj'
+FLUSH_INTERVAL = 0.5          # s, maksymalny czas danych w buforze zapisu
+REPLAY_QUEUE_BACKOFF = 0.001  # s, przerwa przy pełnej kolejce nadawczej
+REPLAY_DRAIN_TIMEOUT = 5      # s, oczekiwanie na wysłanie ramek z kolejki po odtworzeniu
+
+# Znacznik czasu w nagłówku ramki (nadpisywany przy odtwarzaniu) - przed nim
+# stoi jeszcze tylko długość danych
+_FRAME_TIMESTAMP = struct.Struct('!d')
+_FRAME_TIMESTAMP_OFFSET = FRAME_HEADER.size - _FRAME_TIMESTAMP.size - 4
+
+# Wpis dziennika
+JournalRecord = namedtuple('JournalRecord', 'time direction data')
+
+class JournalError(ValueError):
+    """Błąd formatu dziennika ruchu"""
+
+def session_path(name, directory=JOURNAL_DIR):
+    """
+    Tworzy ścieżkę pliku dziennika nowej sesji.
+    
+    Args:
+        name (str): Nazwa stacji
+        directory (str): Katalog dzienników
+    
+    Returns:
+        str: Ścieżka z datą i godziną rozpoczęcia w nazwie
+    """
+    return os.path.join(directory, f"{name}-{datetime.now():%Y%m%d-%H%M%S}{JOURNAL_SUFFIX}")
+
+def frame_bytes(frame):
+    """
+    Koduje odebraną ramkę z powrotem do formatu sieciowego.
+    
+    Args:
+        frame (Frame): Odebrana ramka
+    
+    Returns:
+        bytes: Ramka z tym samym nadawcą, adresatem, numerem i czasem
+    """
+    packet_format = PACKET_FORMAT_TEXT if frame.kind == FRAME_TEXT else PACKET_FORMAT_BINARY
+    return encode_frame(frame.message, frame.morse_code, frame.sender, frame.sequence,
+                        packet_format, frame.timestamp, frame.recipient)
+
+def decode_record(record):
+    """
+    Dekoduje ramkę zapisaną we wpisie dziennika.
+    
+    Args:
+        record (JournalRecord): Wpis dziennika
+    
+    Returns:
+        Frame: Ramka
+    
+    Raises:
+        FrameError: Jeśli zapisane dane nie są poprawną ramką
+    """
+    header = decode_frame_header(record.data)
+    return decode_frame_payload(header, record.data[FRAME_HEADER_SIZE:])
+
+class JournalWriter:
+    """
+    Dziennik ruchu dopisujący każdą ramkę na końcu pliku.
+    
+    Wpisy zawierają ramki w formacie sieciowym i czas od rozpoczęcia sesji
+    według zegara monotonicznego, więc zmiany zegara systemowego nie psują
+    kolejności. Co INDEX_STRIDE wpisów do pliku indeksu trafia para (czas,
+    położenie), co pozwala czytelnikowi przejść do dowolnej chwili bez
+    czytania całej sesji. Bufor zapisu jest opróżniany przez wątek w tle
+    co FLUSH_INTERVAL sekund. Przy wznowieniu niepełny ostatni wpis jest
+    obcinany. Zapis jest bezpieczny wątkowo.
+    """
+    
+    def __init__(self, path):
+        """
+        Otwiera dziennik do dopisywania (nowy plik zaczyna sesję)
+        
+        Args:
+            path (str): Ścieżka pliku dziennika (katalog jest tworzony w razie potrzeby)
+        
+        Raises:
+            OSError: Jeśli pliku nie można otworzyć
+            JournalError: Jeśli istniejący plik nie jest dziennikiem
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        self.path = path
+        self.count = 0
+        self._lock = threading.Lock()
+        self._last_time = 0.0
+        
+        if os.path.exists(path) and os.path.getsize(path):
+            # Dalszy ciąg sesji - czas liczony od zapisanego początku sesji
+            with JournalReader(path) as reader:
+                self.start_time = reader.start_time
+                self._last_time = reader.last_time()
+                self.count = reader.indexed_count()
+                end = reader.end_offset()
+                index_size = reader.index_size(end)
+            # Niepełny ostatni wpis (np. po awarii) jest obcinany - wpisy
+            # dopisane za nim byłyby nieczytelne
+            if os.path.getsize(path) > end:
+                os.truncate(path, end)
+            index_path = path + INDEX_SUFFIX
+            if os.path.exists(index_path) and os.path.getsize(index_path) > index_size:
+                os.truncate(index_path, index_size)
+            self._file = open(path, 'ab')
+        else:
+            self.start_time = time.time()
+            self._file = open(path, 'wb')
+            self._file.write(JOURNAL_HEADER.pack(JOURNAL_MAGIC, JOURNAL_VERSION, self.start_time))
+        self._index = open(path + INDEX_SUFFIX, 'ab')
+        
+        self._start_monotonic = time.monotonic() - (time.time() - self.start_time)
+        self._offset = self._file.tell()
+        
+        # Bufory są opróżniane w tle, również gdy nie przychodzą nowe ramki
+        self._closed = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_loop, name="journal-flush", daemon=True)
+        self._flusher.start()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def record(self, direction, data):
+        """
+        Dopisuje ramkę w formacie sieciowym.
+        
+        Args:
+            direction (int): SENT lub RECEIVED
+            data (bytes): Ramka
+        """
+        with self._lock:
+            if self._file is None:
+                return
+            now = time.monotonic()
+            # Czas sesji nie może się cofnąć, również po wznowieniu dziennika
+            self._last_time = max(self._last_time, now - self._start_monotonic)
+            
+            if self.count % INDEX_STRIDE == 0:
+                self._index.write(INDEX_ENTRY.pack(self._last_time, self._offset))
+            self._file.write(RECORD_HEADER.pack(self._last_time, direction, len(data)))
+            self._file.write(data)
+            self._offset += RECORD_HEADER.size + len(data)
+            self.count += 1
+    
+    def record_frame(self, direction, frame):
+        """
+        Dopisuje odebraną ramkę (Frame), kodując ją do formatu sieciowego.
+        
+        Args:
+            direction (int): SENT lub RECEIVED
+            frame (Frame): Ramka
+        """
+        self.record(direction, frame_bytes(frame))
+    
+    def flush(self):
+        """Zapisuje bufory dziennika i indeksu na dysk"""
+        with self._lock:
+            if self._file is not None:
+                self._flush()
+    
+    def close(self):
+        """Zapisuje bufory i zamyka pliki"""
+        self._closed.set()
+        if self._flusher is not threading.current_thread():
+            self._flusher.join()
+        with self._lock:
+            if self._file is None:
+                return
+            self._flush()
+            self._file.close()
+            self._index.close()
+            self._file = None
+    
+    def _flush_loop(self):
+        """Opróżnia bufory co FLUSH_INTERVAL do zamknięcia dziennika (wątek w tle)"""
+        while not self._closed.wait(FLUSH_INTERVAL):
+            self.flush()
+    
+    def _flush(self):
+        """Zapisuje bufory na dysk (przy założonej blokadzie)"""
+        # Dziennik przed indeksem - indeks nie może wskazywać niezapisanych danych
+        self._file.flush()
+        self._index.flush()
+
+class _IndexTimes:
+    """Widok czasów z mapowanego indeksu jako sekwencji dla modułu bisect"""
+    
+    def __init__(self, index):
+        self._index = index
+    
+    def __len__(self):
+        return len(self._index) // INDEX_ENTRY.size
+    
+    def __getitem__(self, position):
+        return INDEX_ENTRY.unpack_from(self._index, position * INDEX_ENTRY.size)[0]
+
+class JournalReader:
+    """
+    Czytnik dziennika ruchu mapujący plik do pamięci.
+    
+    Przejście do chwili sesji to wyszukiwanie binarne w indeksie i odczyt
+    najwyżej INDEX_STRIDE wpisów, niezależnie od długości sesji. Brak lub
+    niepełny indeks (np. po awarii) jedynie wydłuża wyszukiwanie. Niepełny
+    ostatni wpis jest pomijany.
+    """
+    
+    def __init__(self, path):
+        """
+        Otwiera dziennik do odczytu
+        
+        Args:
+            path (str): Ścieżka pliku dziennika
+        
+        Raises:
+            OSError: Jeśli pliku nie można otworzyć
+            JournalError: Jeśli plik nie jest dziennikiem ruchu
+        """
+        self.path = path
+        with open(path, 'rb') as journal_file:
+            header = journal_file.read(JOURNAL_HEADER.size)
+            if len(header) < JOURNAL_HEADER.size:
+                raise JournalError(f"{path}: plik jest za krótki na dziennik ruchu")
+            magic, version, self.start_time = JOURNAL_HEADER.unpack(header)
+            if magic != JOURNAL_MAGIC:
+                raise JournalError(f"{path}: nieprawidłowy znacznik dziennika")
+            if version != JOURNAL_VERSION:
+                raise JournalError(f"{path}: nieobsługiwana wersja dziennika: {version}")
+            self._data = mmap.mmap(journal_file.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        self._index = b''
+        index_path = path + INDEX_SUFFIX
+        if os.path.exists(index_path) and os.path.getsize(index_path) >= INDEX_ENTRY.size:
+            with open(index_path, 'rb') as index_file:
+                self._index = mmap.mmap(index_file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._times = _IndexTimes(self._index)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def __iter__(self):
+        return self.records()
+    
+    def close(self):
+        """Zwalnia mapowanie plików"""
+        self._data.close()
+        if isinstance(self._index, mmap.mmap):
+            self._index.close()
+    
+    def indexed_count(self):
+        """
+        Zlicza wpisy, czytając jedynie wpisy za ostatnią pozycją indeksu.
+        
+        Returns:
+            int: Liczba kompletnych wpisów
+        """
+        entries = len(self._times)
+        if not entries:
+            return sum(1 for _ in self.records())
+        offset = INDEX_ENTRY.unpack_from(self._index, (entries - 1) * INDEX_ENTRY.size)[1]
+        return (entries - 1) * INDEX_STRIDE + sum(1 for _ in self._records_from(offset))
+    
+    def last_time(self):
+        """
+        Zwraca czas ostatniego wpisu.
+        
+        Returns:
+            float: Sekundy od rozpoczęcia sesji (0 dla pustego dziennika)
+        """
+        last = 0.0
+        entries = len(self._times)
+        offset = JOURNAL_HEADER.size
+        if entries:
+            offset = INDEX_ENTRY.unpack_from(self._index, (entries - 1) * INDEX_ENTRY.size)[1]
+        for record in self._records_from(offset):
+            last = record.time
+        return last
+    
+    def end_offset(self):
+        """
+        Wyznacza koniec ostatniego kompletnego wpisu.
+        
+        Returns:
+            int: Położenie w pliku, od którego można dopisywać kolejne wpisy
+                (rozmiar nagłówka dla dziennika bez wpisów)
+        """
+        data = self._data
+        entries = len(self._times)
+        offset = JOURNAL_HEADER.size
+        if entries:
+            offset = INDEX_ENTRY.unpack_from(self._index, (entries - 1) * INDEX_ENTRY.size)[1]
+        if offset > len(data):
+            offset = JOURNAL_HEADER.size  # Indeks wskazuje poza dane - pełny odczyt
+        while offset + RECORD_HEADER.size <= len(data):
+            length = RECORD_HEADER.unpack_from(data, offset)[2]
+            if offset + RECORD_HEADER.size + length > len(data):
+                break
+            offset += RECORD_HEADER.size + length
+        return offset
+    
+    def index_size(self, end):
+        """
+        Wyznacza rozmiar indeksu bez wpisów wskazujących poza koniec danych.
+        
+        Args:
+            end (int): Koniec ostatniego kompletnego wpisu (end_offset)
+        
+        Returns:
+            int: Rozmiar pełnych pozycji indeksu w bajtach
+        """
+        entries = len(self._times)
+        while entries and INDEX_ENTRY.unpack_from(self._index, (entries - 1) * INDEX_ENTRY.size)[1] >= end:
+            entries -= 1
+        return entries * INDEX_ENTRY.size
+    
+    def seek(self, seconds):
+        """
+        Wyznacza położenie pierwszego wpisu nie wcześniejszego niż podany czas.
+        
+        Args:
+            seconds (float): Czas od rozpoczęcia sesji
+        
+        Returns:
+            int: Położenie wpisu w pliku (lub koniec danych)
+        """
+        position = bisect.bisect_right(self._times, seconds) - 1
+        offset = JOURNAL_HEADER.size
+        if position >= 0:
+            offset = INDEX_ENTRY.unpack_from(self._index, position * INDEX_ENTRY.size)[1]
+        
+        data = self._data
+        while offset + RECORD_HEADER.size <= len(data):
+            record_time, _, length = RECORD_HEADER.unpack_from(data, offset)
+            if record_time >= seconds:
+                break
+            offset += RECORD_HEADER.size + length
+        return offset
+    
+    def records(self, start=None, end=None, direction=None):
+        """
+        Zwraca wpisy z przedziału czasu sesji.
+        
+        Args:
+            start (float, optional): Początek przedziału w sekundach od rozpoczęcia sesji
+            end (float, optional): Koniec przedziału (wyłącznie)
+            direction (int, optional): Tylko wpisy o danym kierunku
+        
+        Yields:
+            JournalRecord: Kolejne wpisy
+        """
+        offset = JOURNAL_HEADER.size if start is None else self.seek(start)
+        for record in self._records_from(offset):
+            if end is not None and record.time >= end:
+                break
+            if direction is None or record.direction == direction:
+                yield record
+    
+    def _records_from(self, offset):
+        """Czyta kolejne kompletne wpisy od podanego położenia"""
+        data = self._data
+        size = len(data)
+        header_size = RECORD_HEADER.size
+        while offset + header_size <= size:
+            record_time, direction, length = RECORD_HEADER.unpack_from(data, offset)
+            start = offset + header_size
+            if start + length > size:
+                break
+            yield JournalRecord(record_time, direction, data[start:start + length])
+            offset = start + length
+
+def replay(reader, link, speed=1.0, start=None, end=None, direction=RECEIVED, retime=True):
+    """
+    Nadaje zapisane ramki ponownie, zachowując odstępy czasu z sesji.
+    
+    Args:
+        reader (JournalReader): Dziennik ruchu
+        link (PeerLink): Połączenie ze stacją lub węzłem docelowym
+        speed (float): Przyspieszenie względem zapisu (0 - najszybciej, jak się da)
+        start (float, optional): Początek przedziału w sekundach od rozpoczęcia sesji
+        end (float, optional): Koniec przedziału
+        direction (int, optional): Kierunek ramek do odtworzenia (None - wszystkie)
+        retime (bool): Czy nadpisać czas nadania w ramkach bieżącym czasem
+    
+    Returns:
+        dict: Liczba nadanych ramek, czas odtwarzania i średnie tempo
+    """
+    sent = 0
+    first_time = None
+    replay_start = time.monotonic()
+    for record in reader.records(start, end, direction):
+        if first_time is None:
+            first_time = record.time
+        if speed:
+            delay = replay_start + (record.time - first_time) / speed - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+        
+        frame = record.data
+        if retime:
+            frame = bytearray(frame)
+            _FRAME_TIMESTAMP.pack_into(frame, _FRAME_TIMESTAMP_OFFSET, time.time())
+        while not link.send(frame):
+            time.sleep(REPLAY_QUEUE_BACKOFF)
+        sent += 1
+    
+    elapsed = time.monotonic() - replay_start
+    return {
+        'frames': sent,
+        'elapsed_s': elapsed,
+        'frames_per_s': sent / elapsed if elapsed else 0.0,
+    }
+
+def _direction_arg(value):
+    """Zamienia nazwę kierunku z wiersza poleceń na stałą"""
+    return {'sent': SENT, 'received': RECEIVED, 'all': None}[value]
+
+def main(argv=None):
+    """
+    Narzędzie wiersza poleceń: podsumowanie, wypisanie i odtworzenie dziennika.
+    
+    Args:
+        argv (list, optional): Argumenty wiersza poleceń
+    
+    Returns:
+        int: 0 po powodzeniu, 1 w razie błędu
+    """
+    parser = argparse.ArgumentParser(description="Dziennik ruchu stacji radiowych")
+    commands = parser.add_subparsers(dest="command", required=True)
+    
+    info_parser = commands.add_parser("info", help="Podsumowanie sesji")
+    info_parser.add_argument("journal", help="Plik dziennika")
+    
+    dump_parser = commands.add_parser("dump", help="Wypisanie ramek")
+    dump_parser.add_argument("journal", help="Plik dziennika")
+    dump_parser.add_argument("--start", type=float, help="Od sekundy sesji")
+    dump_parser.add_argument("--end", type=float, help="Do sekundy sesji")
+    
+    replay_parser = commands.add_parser("replay", help="Odtworzenie ramek do stacji")
+    replay_parser.add_argument("journal", help="Plik dziennika")
+    replay_parser.add_argument("--host", default='localhost', help="Adres stacji docelowej")
+    replay_parser.add_argument("--port", type=int, required=True, help="Port stacji docelowej")
+    replay_parser.add_argument("--speed", type=float, default=1.0,
+                               help="Przyspieszenie, np. 1 lub 10 (0 - bez przerw)")
+    replay_parser.add_argument("--start", type=float, help="Od sekundy sesji")
+    replay_parser.add_argument("--end", type=float, help="Do sekundy sesji")
+    replay_parser.add_argument("--direction", choices=['received', 'sent', 'all'],
+                               default='received', help="Które ramki odtworzyć")
+    replay_parser.add_argument("--original-timestamps", action="store_true",
+                               help="Nie nadpisuj czasu nadania w ramkach")
+    args = parser.parse_args(argv)
+    
+    try:
+        reader = JournalReader(args.journal)
+    except (OSError, JournalError) as e:
+        print(f"Błąd: {e}")
+        return 1
+    
+    with reader:
+        if args.command == "info":
+            counts = {SENT: 0, RECEIVED: 0}
+            for record in reader:
+                counts[record.direction] = counts.get(record.direction, 0) + 1
+            started = datetime.fromtimestamp(reader.start_time)
+            print(f"Początek sesji: {started:%Y-%m-%d %H:%M:%S}")
+            print(f"Czas trwania: {reader.last_time():.1f} s")
+            print(f"Ramki nadane: {counts[SENT]}, odebrane: {counts[RECEIVED]}")
+        
+        elif args.command == "dump":
+            for record in reader.records(args.start, args.end):
+                try:
+                    frame = decode_record(record)
+                except FrameError as e:
+                    print(f"{record.time:10.3f} uszkodzona ramka: {e}")
+                    continue
+                print(f"{record.time:10.3f} {DIRECTIONS.get(record.direction, '?'):8} "
+                      f"{frame.sender}->{frame.recipient} #{frame.sequence}: {frame.message}")
+        
+        else:
+            # Import lokalny - info i dump nie potrzebują połączeń sieciowych
+            from station_link import PeerLink
+            delivered = [0]
+            
+            def on_sent(count):
+                delivered[0] += count
+            
+            link = PeerLink(args.host, args.port, on_sent=on_sent)
+            try:
+                stats = replay(reader, link, args.speed, args.start, args.end,
+                               _direction_arg(args.direction), not args.original_timestamps)
+                # Zamknięcie połączenia porzuca ramki czekające w kolejce
+                drain_end = time.monotonic() + REPLAY_DRAIN_TIMEOUT
+                while delivered[0] < stats['frames'] and time.monotonic() < drain_end:
+                    time.sleep(0.01)
+            finally:
+                link.close()
+            print(f"Odtworzono {stats['frames']} ramek w {stats['elapsed_s']:.1f} s "
+                  f"({stats['frames_per_s']:.0f} ramek/s)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Moduł zawierający szynę zdarzeń przekazującą aktualizacje z wątków roboczych do wątku Tk
+"""
+
+import queue
+import traceback
+
+# Parametry szyny
+TICK_INTERVAL = 33           # ms, odstęp między opróżnieniami kolejki (~30 klatek/s)
+MAX_EVENTS_PER_TICK = 10000  # Limit zdarzeń na klatkę - reszta czeka na kolejną
+
+# Sposoby dostarczania zdarzeń do obsługi
+DELIVER_EACH = 'each'        # Każde zdarzenie osobno, w kolejności nadejścia
+DELIVER_LATEST = 'latest'    # Tylko ostatnie zdarzenie z klatki
+DELIVER_BATCH = 'batch'      # Wszystkie zdarzenia z klatki jedną listą
+
+# Wbudowane rodzaje zdarzeń
+STATUS = 'status'
+CALL = 'call'
+
+class UIBus:
+    """
+    Szyna zdarzeń interfejsu - jedyna droga z wątków roboczych do Tk.
+    
+    Wątki sieciowe, nadawcze i dźwiękowe jedynie wkładają zdarzenia do
+    queue.SimpleQueue (bez blokad po stronie Pythona), a wątek Tk opróżnia
+    ją w stałym rytmie przez root.after(). Powtarzające się zdarzenia są
+    scalane: ze zmian statusu w jednej klatce stosowana jest tylko ostatnia,
+    a zdarzenia zbiorcze (np. linie logu) trafiają do obsługi jedną listą.
+    Dzięki temu duży ruch nie zalewa pętli zdarzeń, a widgety są zmieniane
+    wyłącznie w wątku Tk.
+    """
+    
+    def __init__(self, root, interval=TICK_INTERVAL, max_events=MAX_EVENTS_PER_TICK):
+        """
+        Inicjalizuje szynę (opróżnianie rusza po wywołaniu start)
+        
+        Args:
+            root (tk.Tk lub tk.Frame): Widget, którego pętla zdarzeń opróżnia kolejkę
+            interval (int): Odstęp między opróżnieniami w ms
+            max_events (int): Maksymalna liczba zdarzeń obsłużonych w jednej klatce
+        """
+        self.root = root
+        self.interval = interval
+        self.max_events = max_events
+        self._queue = queue.SimpleQueue()
+        self._handlers = {CALL: (DELIVER_EACH, lambda call: call[0](*call[1]))}
+        self._after_id = None
+    
+    def subscribe(self, kind, handler, delivery=DELIVER_EACH):
+        """
+        Rejestruje obsługę zdarzeń danego rodzaju (wywoływaną w wątku Tk).
+        
+        Args:
+            kind (str): Rodzaj zdarzenia
+            handler (function): Funkcja przyjmująca dane zdarzenia, a przy
+                DELIVER_BATCH listę danych
+            delivery (str): DELIVER_EACH, DELIVER_LATEST lub DELIVER_BATCH
+        """
+        self._handlers[kind] = (delivery, handler)
+    
+    def post(self, kind, payload=None):
+        """
+        Wysyła zdarzenie (można wywołać z dowolnego wątku).
+        
+        Args:
+            kind (str): Rodzaj zdarzenia
+            payload: Dane przekazywane do obsługi
+        """
+        self._queue.put((kind, payload))
+    
+    def status(self, text):
+        """Wysyła zmianę statusu (z klatki stosowana jest tylko ostatnia)"""
+        self._queue.put((STATUS, text))
+    
+    def put(self, text):
+        """Odpowiednik queue.Queue.put - szynę można podać jako progress_queue"""
+        self._queue.put((STATUS, text))
+    
+    def call(self, function, *args):
+        """Zleca wywołanie funkcji w wątku Tk"""
+        self._queue.put((CALL, (function, args)))
+    
+    def start(self):
+        """Uruchamia cykliczne opróżnianie kolejki"""
+        if self._after_id is None:
+            self._after_id = self.root.after(self.interval, self._tick)
+    
+    def stop(self):
+        """Zatrzymuje opróżnianie kolejki"""
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+    
+    def drain(self):
+        """
+        Opróżnia kolejkę i dostarcza zdarzenia do obsługi (wątek Tk).
+        
+        Returns:
+            int: Liczba pobranych zdarzeń
+        """
+        handlers = self._handlers
+        latest = {}
+        batches = {}
+        count = 0
+        while count < self.max_events:
+            try:
+                kind, payload = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            count += 1
+            
+            delivery, handler = handlers.get(kind, (None, None))
+            if delivery == DELIVER_EACH:
+                self._dispatch(handler, payload)
+            elif delivery == DELIVER_LATEST:
+                latest[kind] = payload
+            elif delivery == DELIVER_BATCH:
+                batches.setdefault(kind, []).append(payload)
+        
+        # Zdarzenia scalone są stosowane po pozostałych, więc status z końca
+        # klatki nie zostanie nadpisany przez starsze zdarzenia
+        for kind, payloads in batches.items():
+            self._dispatch(handlers[kind][1], payloads)
+        for kind, payload in latest.items():
+            self._dispatch(handlers[kind][1], payload)
+        return count
+    
+    def _dispatch(self, handler, payload):
+        """Wywołuje obsługę zdarzenia - błąd jednej obsługi nie zatrzymuje szyny"""
+        try:
+            handler(payload)
+        except Exception:
+            traceback.print_exc()
+    
+    def _tick(self):
+        """Opróżnia kolejkę i planuje kolejną klatkę"""
+        try:
+            self.drain()
+        finally:
+            self._after_id = self.root.after(self.interval, self._tick)